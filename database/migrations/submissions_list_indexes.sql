@@ -0,0 +1,15 @@
+-- Indexes behind the paginated GET /api/submissions in railway-api/server.js
+
+-- Keyset pagination: ORDER BY created_at DESC, id DESC with (created_at, id) < cursor
+CREATE INDEX IF NOT EXISTS submissions_created_at_id_idx
+    ON submissions (created_at DESC, id DESC);
+
+-- ?stage= / ?status= / ?area= filters, each paged in the same order
+CREATE INDEX IF NOT EXISTS submissions_stage_created_at_idx
+    ON submissions (workflow_stage, created_at DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS submissions_status_created_at_idx
+    ON submissions (ai_processing_status, created_at DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS submissions_area_created_at_idx
+    ON submissions (therapeutic_area, created_at DESC, id DESC);
@@ -1,5 +1,11 @@
 // Netlify Function for Claude AI Quality Assurance Review
 
+const { cachedCompletion, cacheModeFrom, parseJsonResponse } = require('./lib/llm-cache');
+
+const PROMPT_VERSION = 'claude-qa@1';
+
+const parseResponse = parseJsonResponse('Claude');
+
 exports.handler = async (event, context) => {
   // Add CORS headers
   const headers = {
@@ -77,43 +83,41 @@ Format your response as JSON:
   "compliance_notes": "FDA compliance observations"
 }`;
 
-    const response = await globalThis.fetch('https://api.anthropic.com/v1/messages', {
-      method: 'POST',
-      headers: {
-        'x-api-key': claudeApiKey,
-        'anthropic-version': '2023-06-01',
-        'content-type': 'application/json'
-      },
-      body: JSON.stringify({
-        model: 'claude-3-haiku-20240307',
-        max_tokens: 1500,
-        temperature: 0,
-        messages: [
-          {
-            role: 'user',
-            content: qaPrompt
-          }
-        ]
-      })
-    });
+    const request = {
+      model: 'claude-3-haiku-20240307',
+      max_tokens: 1500,
+      temperature: 0,
+      messages: [
+        {
+          role: 'user',
+          content: qaPrompt
+        }
+      ]
+    };
 
-    if (!response.ok) {
-      const error = await response.text();
-      throw new Error(`Claude API error: ${response.status} - ${error}`);
-    }
+    const parsedQA = await cachedCompletion(
+      { ...request, template: PROMPT_VERSION, mode: cacheModeFrom(event) },
+      async () => {
+        const response = await globalThis.fetch('https://api.anthropic.com/v1/messages', {
+          method: 'POST',
+          headers: {
+            'x-api-key': claudeApiKey,
+            'anthropic-version': '2023-06-01',
+            'content-type': 'application/json'
+          },
+          body: JSON.stringify(request)
+        });
 
-    const data = await response.json();
-    const qaResult = data.content[0].text;
-    
-    // Parse JSON response
-    let parsedQA;
-    try {
-      const jsonMatch = qaResult.match(/```json\n?([\s\S]*?)\n?```/) || qaResult.match(/({[\s\S]*})/);
-      parsedQA = JSON.parse(jsonMatch ? jsonMatch[1] : qaResult);
-    } catch (parseError) {
-      console.error('Failed to parse Claude response:', parseError);
-      throw new Error('Invalid response format from Claude');
-    }
+        if (!response.ok) {
+          const error = await response.text();
+          throw new Error(`Claude API error: ${response.status} - ${error}`);
+        }
+
+        const data = await response.json();
+        return data.content[0].text;
+      },
+      parseResponse
+    );
 
     // Add timestamp and metadata
     parsedQA.reviewed_at = new Date().toISOString();
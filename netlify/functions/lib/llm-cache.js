@@ -0,0 +1,227 @@
+// Content-addressed cache for Perplexity / Claude responses
+//
+// Entries live on local disk as <dir>/<key[0..2]>/<key>.json, where key is
+// sha256 over (model, prompt-template version, temperature, normalized
+// prompt). A hit refreshes the file's mtime; when the directory grows past
+// LLM_CACHE_MAX_BYTES the least recently used entries are deleted. Writes
+// keep a running size instead of listing the directory each time: a full
+// scan happens only when that size crosses the bound or the last scan
+// (recorded in <dir>/size.json) is older than SCAN_INTERVAL_MS.
+// seo_tools/llm_cache.py reads and writes the same layout, so Python
+// reprocessing runs on the same host share entries with these functions.
+//
+// Modes: 'use' (default) reads and writes, 'refresh' skips the read but
+// stores the new response, 'bypass' neither reads nor writes.
+//
+// Each caller passes a prompt-template version as `template` (its
+// *_PROMPT_VERSION constant, e.g. 'claude-qa@1'). Bump it whenever the
+// prompt changes meaning, so responses cached for the old prompt are not
+// reused.
+
+const crypto = require('crypto');
+const fs = require('fs');
+const os = require('os');
+const path = require('path');
+
+const CACHE_DIR = process.env.LLM_CACHE_DIR || path.join(os.tmpdir(), '3cubed-llm-cache');
+const MAX_BYTES = parseInt(process.env.LLM_CACHE_MAX_BYTES, 10) || 200 * 1024 * 1024;
+const MODES = ['use', 'refresh', 'bypass'];
+const SIZE_FILE = 'size.json';
+const SCAN_INTERVAL_MS = 60 * 1000;
+
+// dir -> { bytes, scannedAt } as of the last scan plus this process's writes
+const sizes = new Map();
+
+// Collapse ASCII whitespace runs so re-indented templates hash the same
+const normalizePrompt = (messages) =>
+  messages
+    .map(m => `${m.role}: ${m.content}`)
+    .join('\n')
+    .replace(/[ \t\n\r\f\v]+/g, ' ')
+    .replace(/^ | $/g, '');
+
+const formatTemperature = (temperature) =>
+  temperature === undefined || temperature === null ? 'default' : Number(temperature).toFixed(3);
+
+const cacheKey = ({ model, messages, temperature, template }) =>
+  crypto
+    .createHash('sha256')
+    .update([model, template, formatTemperature(temperature), normalizePrompt(messages)].join('\n'))
+    .digest('hex');
+
+const entryPath = (key, dir = CACHE_DIR) => path.join(dir, key.slice(0, 2), `${key}.json`);
+
+// ?cache=, X-LLM-Cache header, then LLM_CACHE env; anything unknown means 'use'
+const cacheModeFrom = (event = {}) => {
+  const headers = event.headers || {};
+  const mode = (event.queryStringParameters || {}).cache
+    || headers['x-llm-cache'] || headers['X-LLM-Cache']
+    || process.env.LLM_CACHE;
+  return MODES.includes(mode) ? mode : 'use';
+};
+
+const readEntry = async (key, dir) => {
+  const file = entryPath(key, dir);
+  try {
+    const entry = JSON.parse(await fs.promises.readFile(file, 'utf8'));
+    const now = new Date();
+    await fs.promises.utimes(file, now, now).catch(() => {});
+    return entry;
+  } catch {
+    return null;
+  }
+};
+
+const listEntries = async (dir) => {
+  const entries = [];
+  let shards = [];
+  try {
+    shards = await fs.promises.readdir(dir);
+  } catch {
+    return entries;
+  }
+  for (const shard of shards) {
+    let names = [];
+    try {
+      names = await fs.promises.readdir(path.join(dir, shard));
+    } catch {
+      continue;
+    }
+    for (const name of names) {
+      if (!name.endsWith('.json')) continue;
+      const file = path.join(dir, shard, name);
+      try {
+        const stat = await fs.promises.stat(file);
+        entries.push({ file, size: stat.size, mtime: stat.mtimeMs });
+      } catch {
+        // Removed by a concurrent eviction
+      }
+    }
+  }
+  return entries;
+};
+
+const readSizeFile = async (dir) => {
+  try {
+    const { bytes, scanned_at: scannedAt } = JSON.parse(
+      await fs.promises.readFile(path.join(dir, SIZE_FILE), 'utf8')
+    );
+    return Number.isFinite(bytes) && Number.isFinite(scannedAt)
+      ? { bytes, scannedAt: scannedAt * 1000 }
+      : null;
+  } catch {
+    return null;
+  }
+};
+
+const recordSize = async (dir, bytes) => {
+  const state = { bytes, scannedAt: Date.now() };
+  sizes.set(dir, state);
+  const file = path.join(dir, SIZE_FILE);
+  const tmp = `${file}.${process.pid}.${Date.now()}.tmp`;
+  await fs.promises.writeFile(tmp, JSON.stringify({ bytes, scanned_at: state.scannedAt / 1000 }))
+    .then(() => fs.promises.rename(tmp, file))
+    .catch(() => {});
+};
+
+// Drop least recently used entries until the cache is under 90% of maxBytes
+const evict = async (dir = CACHE_DIR, maxBytes = MAX_BYTES) => {
+  const entries = await listEntries(dir);
+  let total = entries.reduce((sum, e) => sum + e.size, 0);
+  let removed = 0;
+  if (total > maxBytes) {
+    entries.sort((a, b) => a.mtime - b.mtime);
+    for (const entry of entries) {
+      if (total <= maxBytes * 0.9) break;
+      await fs.promises.unlink(entry.file).catch(() => {});
+      total -= entry.size;
+      removed += 1;
+    }
+  }
+  await recordSize(dir, total);
+  return removed;
+};
+
+// Account for `written` new bytes; scan only when the running size says the
+// bound is crossed or the last scan is stale (other writers share the dir)
+const afterWrite = async (dir, written, maxBytes = MAX_BYTES) => {
+  let state = sizes.get(dir);
+  if (!state) {
+    state = await readSizeFile(dir);
+    if (state) sizes.set(dir, state);
+  }
+  if (!state || Date.now() - state.scannedAt > SCAN_INTERVAL_MS
+      || state.bytes + written > maxBytes) {
+    await evict(dir, maxBytes);
+    return;
+  }
+  state.bytes += written;
+};
+
+const writeEntry = async (key, entry, dir) => {
+  const file = entryPath(key, dir);
+  await fs.promises.mkdir(path.dirname(file), { recursive: true });
+  const tmp = `${file}.${process.pid}.${Date.now()}.tmp`;
+  const data = JSON.stringify(entry);
+  await fs.promises.writeFile(tmp, data);
+  await fs.promises.rename(tmp, file);
+  await afterWrite(dir, Buffer.byteLength(data));
+};
+
+// Parser for JSON answers, extracting the object if it is wrapped in a
+// markdown code block or surrounding prose; `label` names the provider in
+// errors. Throwing keeps malformed answers out of the cache.
+const parseJsonResponse = (label) => (content) => {
+  try {
+    const jsonMatch = content.match(/```json\n?([\s\S]*?)\n?```/) || content.match(/({[\s\S]*})/);
+    return JSON.parse(jsonMatch ? jsonMatch[1] : content);
+  } catch (parseError) {
+    console.error(`Failed to parse ${label} response:`, parseError);
+    throw new Error(`Invalid response format from ${label}`);
+  }
+};
+
+// Return parse(text) for the request in `spec`, calling `call()` for the raw
+// response text on a miss. Only responses that parse are stored, so a
+// malformed answer is retried rather than replayed. Cache I/O failures never
+// fail the request.
+const cachedCompletion = async (spec, call, parse = (text) => text) => {
+  const mode = MODES.includes(spec.mode) ? spec.mode : 'use';
+  const dir = spec.dir || CACHE_DIR;
+  const key = cacheKey(spec);
+
+  if (mode === 'use') {
+    const entry = await readEntry(key, dir);
+    if (entry) {
+      try {
+        return parse(entry.response);
+      } catch {
+        // Fall through and regenerate
+      }
+    }
+  }
+
+  const text = await call();
+  const parsed = parse(text);
+  if (mode !== 'bypass') {
+    await writeEntry(key, {
+      key,
+      model: spec.model,
+      template: spec.template,
+      temperature: spec.temperature ?? null,
+      created_at: new Date().toISOString(),
+      response: text
+    }, dir).catch(error => console.error('LLM cache write failed:', error.message));
+  }
+  return parsed;
+};
+
+module.exports = {
+  CACHE_DIR,
+  cacheKey,
+  cacheModeFrom,
+  cachedCompletion,
+  evict,
+  normalizePrompt,
+  parseJsonResponse
+};
@@ -1,5 +1,11 @@
 // Enhanced Perplexity Function - Leverages Rich FDA Pre-Trial Data for Compelling SEO/GEO Content
 
+const { cachedCompletion, cacheModeFrom, parseJsonResponse } = require('./lib/llm-cache');
+
+const PROMPT_VERSION = 'perplexity-generate-enhanced@1';
+
+const parseResponse = parseJsonResponse('Perplexity');
+
 exports.handler = async (event, context) => {
   // Add CORS headers
   const headers = {
@@ -160,46 +166,44 @@ Ensure all content:
 - Builds trust through transparency about clinical development
 - Includes clear next steps appropriate to reader intent`;
 
-    const response = await globalThis.fetch('https://api.perplexity.ai/chat/completions', {
-      method: 'POST',
-      headers: {
-        'Authorization': `Bearer ${perplexityApiKey}`,
-        'Content-Type': 'application/json'
-      },
-      body: JSON.stringify({
-        model: 'sonar',
-        messages: [
-          {
-            role: 'system',
-            content: 'You are a pharmaceutical SEO expert who creates medically accurate, compliant content that ranks well in search engines while providing genuine value to patients and healthcare providers. Always return valid JSON.'
+    const request = {
+      model: 'sonar',
+      messages: [
+        {
+          role: 'system',
+          content: 'You are a pharmaceutical SEO expert who creates medically accurate, compliant content that ranks well in search engines while providing genuine value to patients and healthcare providers. Always return valid JSON.'
+        },
+        {
+          role: 'user',
+          content: enhancedPrompt
+        }
+      ],
+      temperature: 0.7,
+      max_tokens: 4000
+    };
+
+    const parsedContent = await cachedCompletion(
+      { ...request, template: PROMPT_VERSION, mode: cacheModeFrom(event) },
+      async () => {
+        const response = await globalThis.fetch('https://api.perplexity.ai/chat/completions', {
+          method: 'POST',
+          headers: {
+            'Authorization': `Bearer ${perplexityApiKey}`,
+            'Content-Type': 'application/json'
           },
-          {
-            role: 'user',
-            content: enhancedPrompt
-          }
-        ],
-        temperature: 0.7,
-        max_tokens: 4000
-      })
-    });
+          body: JSON.stringify(request)
+        });
 
-    if (!response.ok) {
-      const error = await response.text();
-      throw new Error(`Perplexity API error: ${response.status} - ${error}`);
-    }
+        if (!response.ok) {
+          const error = await response.text();
+          throw new Error(`Perplexity API error: ${response.status} - ${error}`);
+        }
 
-    const data = await response.json();
-    const content = data.choices[0].message.content;
-    
-    // Parse JSON response
-    let parsedContent;
-    try {
-      const jsonMatch = content.match(/```json\n?([\s\S]*?)\n?```/) || content.match(/({[\s\S]*})/);
-      parsedContent = JSON.parse(jsonMatch ? jsonMatch[1] : content);
-    } catch (parseError) {
-      console.error('Failed to parse Perplexity response:', parseError);
-      throw new Error('Invalid response format from Perplexity');
-    }
+        const data = await response.json();
+        return data.choices[0].message.content;
+      },
+      parseResponse
+    );
 
     // Enhance with additional SEO metrics
     parsedContent.seo_metrics = calculateSEOMetrics(parsedContent, fdaData);
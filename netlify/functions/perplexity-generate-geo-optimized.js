@@ -1,5 +1,11 @@
 // GEO-Optimized Perplexity Function - Creates AI-Friendly Content for Generative Engine Optimization
 
+const { cachedCompletion, cacheModeFrom, parseJsonResponse } = require('./lib/llm-cache');
+
+const PROMPT_VERSION = 'perplexity-generate-geo-optimized@1';
+
+const parseResponse = parseJsonResponse('Perplexity');
+
 exports.handler = async (event, context) => {
   // Add CORS headers
   const headers = {
@@ -272,46 +278,44 @@ Ensure all content:
 - Optimizes for both traditional SEO and GEO
 - Addresses multiple user intents in natural language`;
 
-    const response = await globalThis.fetch('https://api.perplexity.ai/chat/completions', {
-      method: 'POST',
-      headers: {
-        'Authorization': `Bearer ${perplexityApiKey}`,
-        'Content-Type': 'application/json'
-      },
-      body: JSON.stringify({
-        model: 'sonar',
-        messages: [
-          {
-            role: 'system',
-            content: 'You are a pharmaceutical content strategist expert in both traditional SEO and Generative Engine Optimization (GEO). Create content that ranks in search engines AND gets cited by AI systems like ChatGPT, Claude, and Perplexity. Always return valid JSON.'
+    const request = {
+      model: 'sonar',
+      messages: [
+        {
+          role: 'system',
+          content: 'You are a pharmaceutical content strategist expert in both traditional SEO and Generative Engine Optimization (GEO). Create content that ranks in search engines AND gets cited by AI systems like ChatGPT, Claude, and Perplexity. Always return valid JSON.'
+        },
+        {
+          role: 'user',
+          content: geoEnhancedPrompt
+        }
+      ],
+      temperature: 0.7,
+      max_tokens: 4000
+    };
+
+    const parsedContent = await cachedCompletion(
+      { ...request, template: PROMPT_VERSION, mode: cacheModeFrom(event) },
+      async () => {
+        const response = await globalThis.fetch('https://api.perplexity.ai/chat/completions', {
+          method: 'POST',
+          headers: {
+            'Authorization': `Bearer ${perplexityApiKey}`,
+            'Content-Type': 'application/json'
           },
-          {
-            role: 'user',
-            content: geoEnhancedPrompt
-          }
-        ],
-        temperature: 0.7,
-        max_tokens: 4000
-      })
-    });
+          body: JSON.stringify(request)
+        });
 
-    if (!response.ok) {
-      const error = await response.text();
-      throw new Error(`Perplexity API error: ${response.status} - ${error}`);
-    }
+        if (!response.ok) {
+          const error = await response.text();
+          throw new Error(`Perplexity API error: ${response.status} - ${error}`);
+        }
 
-    const data = await response.json();
-    const content = data.choices[0].message.content;
-    
-    // Parse JSON response
-    let parsedContent;
-    try {
-      const jsonMatch = content.match(/```json\n?([\s\S]*?)\n?```/) || content.match(/({[\s\S]*})/);
-      parsedContent = JSON.parse(jsonMatch ? jsonMatch[1] : content);
-    } catch (parseError) {
-      console.error('Failed to parse Perplexity response:', parseError);
-      throw new Error('Invalid response format from Perplexity');
-    }
+        const data = await response.json();
+        return data.choices[0].message.content;
+      },
+      parseResponse
+    );
 
     // Add GEO-specific enhancements
     parsedContent.geo_performance_indicators = calculateGEOReadiness(parsedContent);
@@ -2,6 +2,10 @@
 // Handles FDA database queries, Perplexity content generation, and Claude QA
 
 const fetch = require('node-fetch');
+const { cachedCompletion, cacheModeFrom } = require('./lib/llm-cache');
+
+const SEO_PROMPT_VERSION = 'process-submission/seo@1';
+const QA_PROMPT_VERSION = 'process-submission/qa@1';
 
 // FDA Database Integration
 const queryFDADatabases = async (productName, indication) => {
@@ -50,7 +54,7 @@ const queryFDADatabases = async (productName, indication) => {
 };
 
 // Perplexity AI Integration
-const generateSEOContent = async (submission, fdaData) => {
+const generateSEOContent = async (submission, fdaData, cacheMode) => {
   const perplexityApiKey = process.env.PERPLEXITY_API_KEY;
   
   const prompt = `
@@ -76,22 +80,30 @@ Generate the following SEO-optimized content:
 
 Format as JSON.`;
 
+  const request = {
+    model: 'sonar',
+    messages: [{ role: 'user', content: prompt }],
+    temperature: 0.7
+  };
+
   try {
-    const response = await fetch('https://api.perplexity.ai/chat/completions', {
-      method: 'POST',
-      headers: {
-        'Authorization': `Bearer ${perplexityApiKey}`,
-        'Content-Type': 'application/json'
+    return await cachedCompletion(
+      { ...request, template: SEO_PROMPT_VERSION, mode: cacheMode },
+      async () => {
+        const response = await fetch('https://api.perplexity.ai/chat/completions', {
+          method: 'POST',
+          headers: {
+            'Authorization': `Bearer ${perplexityApiKey}`,
+            'Content-Type': 'application/json'
+          },
+          body: JSON.stringify(request)
+        });
+
+        const data = await response.json();
+        return data.choices[0].message.content;
       },
-      body: JSON.stringify({
-        model: 'sonar',
-        messages: [{ role: 'user', content: prompt }],
-        temperature: 0.7
-      })
-    });
-
-    const data = await response.json();
-    return JSON.parse(data.choices[0].message.content);
+      JSON.parse
+    );
   } catch (error) {
     console.error('Perplexity API error:', error);
     throw error;
@@ -99,7 +111,7 @@ Format as JSON.`;
 };
 
 // Claude QA Integration
-const performQAReview = async (content, submission) => {
+const performQAReview = async (content, submission, cacheMode) => {
   const claudeApiKey = process.env.CLAUDE_API_KEY;
   
   const qaPrompt = `
@@ -119,23 +131,31 @@ Evaluate on:
 Provide specific feedback and required changes.
 Format as JSON with scores and feedback.`;
 
+  const request = {
+    model: 'claude-3-haiku-20240307',
+    max_tokens: 1000,
+    messages: [{ role: 'user', content: qaPrompt }]
+  };
+
   try {
-    const response = await fetch('https://api.anthropic.com/v1/messages', {
-      method: 'POST',
-      headers: {
-        'x-api-key': claudeApiKey,
-        'anthropic-version': '2023-06-01',
-        'content-type': 'application/json'
+    return await cachedCompletion(
+      { ...request, template: QA_PROMPT_VERSION, mode: cacheMode },
+      async () => {
+        const response = await fetch('https://api.anthropic.com/v1/messages', {
+          method: 'POST',
+          headers: {
+            'x-api-key': claudeApiKey,
+            'anthropic-version': '2023-06-01',
+            'content-type': 'application/json'
+          },
+          body: JSON.stringify(request)
+        });
+
+        const data = await response.json();
+        return data.content[0].text;
       },
-      body: JSON.stringify({
-        model: 'claude-3-haiku-20240307',
-        max_tokens: 1000,
-        messages: [{ role: 'user', content: qaPrompt }]
-      })
-    });
-
-    const data = await response.json();
-    return JSON.parse(data.content[0].text);
+      JSON.parse
+    );
   } catch (error) {
     console.error('Claude API error:', error);
     throw error;
@@ -153,6 +173,8 @@ exports.handler = async (event, context) => {
 
   try {
     const submission = JSON.parse(event.body);
+    // ?cache=refresh regenerates and overwrites, ?cache=bypass skips the cache
+    const cacheMode = cacheModeFrom(event);
     
     // Step 1: Query FDA Databases
     console.log('Querying FDA databases...');
@@ -163,11 +185,11 @@ exports.handler = async (event, context) => {
     
     // Step 2: Generate SEO Content with Perplexity
     console.log('Generating SEO content with Perplexity...');
-    const seoContent = await generateSEOContent(submission, fdaData);
+    const seoContent = await generateSEOContent(submission, fdaData, cacheMode);
     
     // Step 3: Perform QA Review with Claude
     console.log('Performing QA review with Claude...');
-    const qaReview = await performQAReview(seoContent, submission);
+    const qaReview = await performQAReview(seoContent, submission, cacheMode);
     
     // Step 4: Update submission in Railway PostgreSQL
     const railwayApiUrl = process.env.RAILWAY_API_URL || 'https://3cubed-seo-production.up.railway.app';
@@ -1,5 +1,6 @@
 const express = require('express');
 const cors = require('cors');
+const crypto = require('crypto');
 const { Pool } = require('pg');
 
 const app = express();
@@ -11,7 +12,8 @@ const pool = new Pool({
   ssl: process.env.NODE_ENV === 'production' ? { rejectUnauthorized: false } : false
 });
 
-app.use(cors());
+// Let the dashboard read the pagination and caching headers
+app.use(cors({ exposedHeaders: ['ETag', 'X-Next-Cursor', 'Link'] }));
 app.use(express.json());
 
 // Test database connection
@@ -23,27 +25,178 @@ pool.query('SELECT NOW()', (err, res) => {
   }
 });
 
-// Get all submissions
+// Listing and projection helpers
+const DEFAULT_PAGE_SIZE = 50;
+const MAX_PAGE_SIZE = 500;
+// Columns every projection keeps: the cursor and ETags are built from them
+const KEY_COLUMNS = ['id', 'created_at', 'updated_at'];
+// Query parameter -> column for equality filters (comma-separated = any of)
+const FILTERS = {
+  stage: 'workflow_stage',
+  status: 'ai_processing_status',
+  area: 'therapeutic_area'
+};
+
+// Column whitelist for fields=, read once from the catalog
+let submissionColumns = null;
+const getSubmissionColumns = async () => {
+  if (!submissionColumns) {
+    submissionColumns = pool.query(
+      `SELECT column_name FROM information_schema.columns
+       WHERE table_schema = current_schema() AND table_name = 'submissions'`
+    ).then(result => new Set(result.rows.map(row => row.column_name)))
+      .catch(error => {
+        submissionColumns = null;
+        throw error;
+      });
+  }
+  return submissionColumns;
+};
+
+class BadRequest extends Error {}
+
+// Parse fields=a,b,c into a quoted select list, rejecting unknown columns
+const selectList = async (fields) => {
+  if (!fields) return '*';
+  const columns = await getSubmissionColumns();
+  const requested = String(fields).split(',').map(f => f.trim()).filter(Boolean);
+  const unknown = requested.filter(f => !columns.has(f));
+  if (unknown.length > 0) {
+    throw new BadRequest(`Unknown fields: ${unknown.join(', ')}`);
+  }
+  return [...new Set([...KEY_COLUMNS, ...requested])].map(f => `"${f}"`).join(', ');
+};
+
+// Cursors are opaque base64url of [created_at, id] of the last row returned.
+// created_at is carried as Postgres text so microseconds survive the round trip.
+const CURSOR_COLUMN = '_cursor_created_at';
+
+const encodeCursor = (row) =>
+  Buffer.from(JSON.stringify([row[CURSOR_COLUMN], row.id])).toString('base64url');
+
+const decodeCursor = (cursor) => {
+  try {
+    const [createdAt, id] = JSON.parse(Buffer.from(String(cursor), 'base64url').toString());
+    if (typeof createdAt !== 'string' || !id) throw new Error();
+    return [createdAt, id];
+  } catch {
+    throw new BadRequest('Invalid cursor');
+  }
+};
+
+const etagFor = (parts) =>
+  `W/"${crypto.createHash('sha1').update(parts.join('|')).digest('base64url')}"`;
+
+const rowVersion = (row) =>
+  `${row.id}:${row.updated_at ? new Date(row.updated_at).getTime() : ''}`;
+
+const notModified = (req, etag) => {
+  const header = req.get('If-None-Match');
+  return Boolean(header) && header.split(',').map(tag => tag.trim()).includes(etag);
+};
+
+// Get submissions, newest first: ?limit=&cursor=&fields=&stage=&status=&area=
+// The body stays a plain array; the next page is advertised in X-Next-Cursor
+// and a Link header, and an unchanged page answers 304 to If-None-Match.
+// Without limit or cursor the whole (filtered) list is returned as before,
+// so existing callers that expect every row are not cut off.
 app.get('/api/submissions', async (req, res) => {
   try {
-    const result = await pool.query('SELECT * FROM submissions ORDER BY created_at DESC');
-    res.json(result.rows);
+    const paginated = req.query.limit !== undefined || req.query.cursor !== undefined;
+    const limit = paginated ? Math.min(
+      Math.max(parseInt(req.query.limit, 10) || DEFAULT_PAGE_SIZE, 1),
+      MAX_PAGE_SIZE
+    ) : null;
+    const select = await selectList(req.query.fields);
+
+    const where = [];
+    const values = [];
+    for (const [param, column] of Object.entries(FILTERS)) {
+      if (req.query[param]) {
+        values.push(String(req.query[param]).split(',').map(v => v.trim()));
+        where.push(`${column} = ANY($${values.length})`);
+      }
+    }
+    if (req.query.cursor) {
+      const [createdAt, id] = decodeCursor(req.query.cursor);
+      values.push(createdAt, id);
+      where.push(`(created_at, id) < ($${values.length - 1}::timestamptz, $${values.length})`);
+    }
+    if (paginated) {
+      values.push(limit + 1);
+    }
+
+    const result = await pool.query(
+      `SELECT ${select}, created_at::text AS ${CURSOR_COLUMN} FROM submissions
+       ${where.length ? `WHERE ${where.join(' AND ')}` : ''}
+       ORDER BY created_at DESC, id DESC
+       ${paginated ? `LIMIT $${values.length}` : ''}`,
+      values
+    );
+
+    const rows = paginated ? result.rows.slice(0, limit) : result.rows;
+    const nextCursor = paginated && result.rows.length > limit
+      ? encodeCursor(rows[rows.length - 1])
+      : null;
+    rows.forEach(row => delete row[CURSOR_COLUMN]);
+    const etag = etagFor([select, nextCursor || '', ...rows.map(rowVersion)]);
+
+    res.set('ETag', etag);
+    res.set('Cache-Control', 'private, no-cache');
+    if (nextCursor) {
+      const next = new URLSearchParams({ ...req.query, cursor: nextCursor });
+      res.set('X-Next-Cursor', nextCursor);
+      res.set('Link', `<${req.baseUrl}${req.path}?${next}>; rel="next"`);
+    }
+    if (notModified(req, etag)) {
+      return res.status(304).end();
+    }
+    res.json(rows);
   } catch (error) {
+    if (error instanceof BadRequest) {
+      return res.status(400).json({ error: error.message });
+    }
+    // A well-formed cursor whose timestamp or id Postgres cannot cast
+    if (req.query.cursor && ['22007', '22008', '22P02'].includes(error.code)) {
+      return res.status(400).json({ error: 'Invalid cursor' });
+    }
     console.error('Error fetching submissions:', error);
     res.status(500).json({ error: error.message });
   }
 });
 
-// Get single submission
+// Get single submission (?fields= supported). A matching If-None-Match is
+// answered from updated_at alone, without reading the row.
 app.get('/api/submissions/:id', async (req, res) => {
   try {
     const { id } = req.params;
-    const result = await pool.query('SELECT * FROM submissions WHERE id = $1', [id]);
+    const select = await selectList(req.query.fields);
+
+    if (req.get('If-None-Match')) {
+      const version = await pool.query(
+        'SELECT id, updated_at FROM submissions WHERE id = $1', [id]
+      );
+      if (version.rows.length > 0) {
+        const etag = etagFor([select, rowVersion(version.rows[0])]);
+        if (notModified(req, etag)) {
+          res.set('ETag', etag);
+          res.set('Cache-Control', 'private, no-cache');
+          return res.status(304).end();
+        }
+      }
+    }
+
+    const result = await pool.query(`SELECT ${select} FROM submissions WHERE id = $1`, [id]);
     if (result.rows.length === 0) {
       return res.status(404).json({ error: 'Submission not found' });
     }
+    res.set('ETag', etagFor([select, rowVersion(result.rows[0])]));
+    res.set('Cache-Control', 'private, no-cache');
     res.json(result.rows[0]);
   } catch (error) {
+    if (error instanceof BadRequest) {
+      return res.status(400).json({ error: error.message });
+    }
     console.error('Error fetching submission:', error);
     res.status(500).json({ error: error.message });
   }
@@ -0,0 +1,3 @@
+"""
+Python tooling for the 3Cubed SEO submission pipeline
+"""
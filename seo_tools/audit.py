@@ -0,0 +1,310 @@
+"""
+Follow-mode tail, rolling aggregation and paginated history for audit_logs
+
+Rows are read in (created_at, id) order with a keyset cursor. created_at is
+the writing transaction's start time, so a row can commit after the tail has
+moved past its timestamp; each poll therefore re-reads a short lookback
+window behind the cursor and drops rows it has already returned.
+"""
+import argparse
+import bisect
+import time
+from collections import Counter, deque
+from datetime import datetime, timedelta
+from typing import Iterator, Optional, Tuple
+
+PAGE_SIZE = 500
+TRAIL_PAGE_SIZE = 200
+MIN_POLL_INTERVAL = 0.25
+MAX_POLL_INTERVAL = 5.0
+LOOKBACK = timedelta(seconds=60)
+
+TAIL_COLUMNS = (
+    "id, table_name, record_id, action, changed_fields, "
+    "user_email, compliance_impact, created_at"
+)
+
+Cursor = Tuple[str, str]
+
+
+def _after_cursor_filter(cursor: Cursor):
+    created_at, row_id = cursor
+    return (
+        f'created_at.gt."{created_at}",'
+        f'and(created_at.eq."{created_at}",id.gt.{row_id})'
+    )
+
+
+def _parse_ts(value):
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _key(row_or_cursor):
+    if isinstance(row_or_cursor, dict):
+        return (_parse_ts(row_or_cursor["created_at"]), str(row_or_cursor["id"]))
+    return (_parse_ts(row_or_cursor[0]), str(row_or_cursor[1]))
+
+
+def fetch_audit_page(client, cursor: Optional[Cursor] = None, limit=PAGE_SIZE,
+                     since: Optional[str] = None):
+    """Return up to `limit` audit rows strictly after `cursor`, oldest first.
+
+    `since` instead starts at the first row with created_at >= since.
+    """
+    query = client.table("audit_logs").select(TAIL_COLUMNS)
+    if cursor is not None:
+        query = query.or_(_after_cursor_filter(cursor))
+    elif since is not None:
+        query = query.gte("created_at", since)
+    return (
+        query.order("created_at").order("id").limit(limit).execute().data or []
+    )
+
+
+def latest_cursor(client) -> Optional[Cursor]:
+    """Cursor pointing at the newest audit row, for tails that skip history."""
+    result = (
+        client.table("audit_logs")
+        .select("id, created_at")
+        .order("created_at", desc=True)
+        .order("id", desc=True)
+        .limit(1)
+        .execute()
+    )
+    if not result.data:
+        return None
+    return (result.data[0]["created_at"], result.data[0]["id"])
+
+
+class AuditTail:
+    """Stream new audit_logs rows as they are written.
+
+    Polling is adaptive: a full page is followed immediately by the next one,
+    and empty polls back off from MIN_POLL_INTERVAL towards MAX_POLL_INTERVAL,
+    resetting as soon as new rows arrive.
+
+    Each poll re-reads from `lookback` behind the cursor so late-committing
+    rows are still delivered (once, possibly out of created_at order); the
+    ids already returned are remembered only for rows inside that window.
+    """
+
+    def __init__(self, client=None, cursor: Optional[Cursor] = None,
+                 from_start=False, page_size=PAGE_SIZE,
+                 min_interval=MIN_POLL_INTERVAL, max_interval=MAX_POLL_INTERVAL,
+                 lookback=LOOKBACK, sleep=time.sleep):
+        if client is None:
+            from .config import get_supabase
+            client = get_supabase()
+        self.client = client
+        self.cursor = cursor
+        self.from_start = from_start
+        self.page_size = page_size
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.lookback = lookback
+        self._sleep = sleep
+        self._seen = {}
+
+    def poll(self):
+        """Return up to a page of unseen rows from the lookback window onwards."""
+        if self.cursor is None:
+            rows = fetch_audit_page(self.client, None, self.page_size)
+        else:
+            since = (_parse_ts(self.cursor[0]) - self.lookback).isoformat()
+            rows, scan = [], None
+            while len(rows) < self.page_size:
+                page = fetch_audit_page(self.client, scan, self.page_size,
+                                        since=since if scan is None else None)
+                rows.extend(row for row in page if row["id"] not in self._seen)
+                if len(page) < self.page_size:
+                    break
+                scan = (page[-1]["created_at"], page[-1]["id"])
+            # Anything past a full page is picked up again by the next poll
+            rows = rows[:self.page_size]
+
+        for row in rows:
+            self._seen[row["id"]] = _parse_ts(row["created_at"])
+        if rows and (self.cursor is None or _key(rows[-1]) > _key(self.cursor)):
+            self.cursor = (rows[-1]["created_at"], rows[-1]["id"])
+        if self.cursor is not None:
+            cutoff = _parse_ts(self.cursor[0]) - self.lookback
+            self._seen = {row_id: created_at for row_id, created_at in self._seen.items()
+                          if created_at >= cutoff}
+        return rows
+
+    def follow(self, stop=None) -> Iterator[dict]:
+        """Yield rows forever (or until `stop()` returns true)."""
+        if self.cursor is None and not self.from_start:
+            self.cursor = latest_cursor(self.client)
+
+        interval = self.min_interval
+        while stop is None or not stop():
+            rows = self.poll()
+            yield from rows
+            if len(rows) >= self.page_size:
+                continue
+            if rows:
+                interval = self.min_interval
+            else:
+                interval = min(interval * 2, self.max_interval)
+            self._sleep(interval)
+
+
+class AuditAggregator:
+    """Rolling in-memory aggregates over a stream of audit rows.
+
+    Counts are updated per row; per-minute action rates only keep the buckets
+    inside the rolling window, so memory stays bounded on long tails.
+    """
+
+    def __init__(self, window_minutes=15):
+        self.window_minutes = window_minutes
+        self._minutes = deque()
+        self._per_minute = {}
+        self.compliance_impact = Counter()
+        self.changed_fields = Counter()
+        self.actions = Counter()
+        self.total = 0
+
+    def add(self, row):
+        self.total += 1
+        minute = _minute_bucket(row["created_at"])
+        table = row.get("table_name") or "unknown"
+
+        if minute not in self._per_minute:
+            if self._minutes and minute <= self._minutes[-1] - self.window_minutes:
+                minute = None  # late row from before the rolling window
+            else:
+                self._per_minute[minute] = Counter()
+                bisect.insort(self._minutes, minute)
+                self._expire(self._minutes[-1])
+        if minute is not None:
+            self._per_minute[minute][table] += 1
+
+        self.actions[row.get("action") or "unknown"] += 1
+        self.compliance_impact[row.get("compliance_impact") or "none"] += 1
+        self.changed_fields.update(row.get("changed_fields") or ())
+
+    def actions_per_minute(self):
+        """Average actions per minute by table_name over the rolling window."""
+        totals = Counter()
+        for counts in self._per_minute.values():
+            totals.update(counts)
+        if not self._minutes:
+            return {}
+        minutes = min(self._minutes[-1] - self._minutes[0] + 1, self.window_minutes)
+        return {table: count / minutes for table, count in totals.most_common()}
+
+    def top_changed_fields(self, n=10):
+        return self.changed_fields.most_common(n)
+
+    def summary(self):
+        return {
+            "total": self.total,
+            "actions_per_minute": self.actions_per_minute(),
+            "actions": dict(self.actions),
+            "compliance_impact": dict(self.compliance_impact),
+            "top_changed_fields": self.top_changed_fields(),
+        }
+
+    def _expire(self, newest):
+        cutoff = newest - self.window_minutes
+        while self._minutes and self._minutes[0] <= cutoff:
+            del self._per_minute[self._minutes.popleft()]
+
+
+def _minute_bucket(timestamp):
+    # ISO-8601 timestamps from PostgREST; minutes since epoch keeps buckets
+    # ordered across hour and day boundaries.
+    parsed = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    return int(parsed.timestamp() // 60)
+
+
+def iter_submission_audit_trail(client, submission_id, page_size=TRAIL_PAGE_SIZE):
+    """Yield a submission's audit trail newest first, one page at a time."""
+    before_created_at = before_id = None
+    while True:
+        page = client.rpc("get_submission_audit_trail_page", {
+            "submission_id": submission_id,
+            "before_created_at": before_created_at,
+            "before_id": before_id,
+            "page_size": page_size,
+        }).execute().data or []
+        yield from page
+        if len(page) < page_size:
+            return
+        before_created_at, before_id = page[-1]["created_at"], page[-1]["id"]
+
+
+def format_row(row):
+    fields = ", ".join(row.get("changed_fields") or []) or "-"
+    return (
+        f"{row['created_at']}  {row.get('action', ''):<6}  "
+        f"{row.get('table_name', '')}/{row.get('record_id', '')}  "
+        f"[{row.get('compliance_impact') or 'none'}]  {fields}"
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="seo_tools audit",
+                                     description="Tail and summarise audit_logs")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    tail = sub.add_parser("tail", help="Stream new audit rows")
+    tail.add_argument("--from-start", action="store_true",
+                      help="Replay existing history before following")
+    tail.add_argument("--summary-every", type=int, default=100, metavar="N",
+                      help="Print rolling aggregates every N rows (0 disables)")
+    tail.add_argument("--window", type=int, default=15, metavar="MINUTES",
+                      help="Rolling window for actions/min")
+    tail.add_argument("--lookback", type=float, default=LOOKBACK.total_seconds(),
+                      metavar="SECONDS",
+                      help="Re-read this far behind the cursor for late commits")
+
+    trail = sub.add_parser("trail", help="Page through a submission's audit trail")
+    trail.add_argument("submission_id")
+    trail.add_argument("--page-size", type=int, default=TRAIL_PAGE_SIZE)
+    trail.add_argument("--limit", type=int, default=None,
+                       help="Stop after this many rows")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "tail":
+        aggregator = AuditAggregator(args.window)
+        print("Following audit_logs (Ctrl+C to stop)...\n")
+        try:
+            for row in AuditTail(from_start=args.from_start,
+                                 lookback=timedelta(seconds=args.lookback)).follow():
+                aggregator.add(row)
+                print(format_row(row))
+                if args.summary_every and aggregator.total % args.summary_every == 0:
+                    _print_summary(aggregator)
+        except KeyboardInterrupt:
+            _print_summary(aggregator)
+        return 0
+
+    from .config import get_supabase
+    client = get_supabase()
+    shown = 0
+    for row in iter_submission_audit_trail(client, args.submission_id, args.page_size):
+        print(format_row({**row, "table_name": "submissions",
+                          "record_id": args.submission_id}))
+        shown += 1
+        if args.limit is not None and shown >= args.limit:
+            break
+    print(f"\n{shown} audit rows")
+    return 0
+
+
+def _print_summary(aggregator):
+    summary = aggregator.summary()
+    print(f"\n📊 {summary['total']} rows")
+    for table, rate in summary["actions_per_minute"].items():
+        print(f"  {table}: {rate:.1f} actions/min")
+    print(f"  Compliance impact: {summary['compliance_impact']}")
+    fields = ", ".join(f"{name} ({count})" for name, count in summary["top_changed_fields"])
+    print(f"  Top changed fields: {fields or '-'}\n")
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,468 @@
+"""
+Parallel base + incremental backups of submissions with point-in-time restore
+
+A backup directory holds one manifest per recovery point:
+
+    backups/
+      0001-base-20250801T020000Z/manifest.json, chunk-0000.jsonl.gz, ...
+      0002-delta-20250802T020000Z/manifest.json, chunk-0000.jsonl.gz, ...
+
+A base snapshot is dumped in parallel across created_at ranges; each delta
+contains only the rows whose updated_at moved past the previous watermark
+(plus ids deleted since then, read from audit_logs), so nightly runs cost
+time proportional to the day's changes. The watermark is the newest write
+the backup can see (submissions.updated_at or audit_logs.created_at) and
+never moves backwards. Delta ranges and delete detection stop at it; a base
+keeps whichever version of a row it reads, and the next delta's lookback
+re-applies anything newer. Every chunk is gzip-compressed JSON lines with a
+sha256 recorded in the manifest and verified on restore.
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+PAGE_SIZE = 1000
+DEFAULT_WORKERS = 4
+DEFAULT_CHUNK_DAYS = 7
+DEFAULT_DELTA_SLICES = 4
+LOOKBACK = timedelta(minutes=5)
+MANIFEST = "manifest.json"
+RESTORE_TABLE = "submissions_restored"
+
+
+def _parse_ts(value):
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _now_tag():
+    return datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def _sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _bound(client, column, desc, table="submissions"):
+    result = (
+        client.table(table)
+        .select(column)
+        .not_.is_(column, "null")
+        .order(column, desc=desc)
+        .limit(1)
+        .execute()
+    )
+    return _parse_ts(result.data[0][column]) if result.data else None
+
+
+def current_watermark(client, parent=None):
+    """Newest submissions.updated_at or audit_logs.created_at, never below the parent's.
+
+    Deletes only show up in audit_logs, so the table's newest updated_at
+    alone would leave quiet-period deletes out, and could even move back
+    when the most recently updated row is deleted.
+    """
+    candidates = [
+        _bound(client, "updated_at", desc=True),
+        _bound(client, "created_at", desc=True, table="audit_logs"),
+    ]
+    if parent and parent.get("watermark"):
+        candidates.append(_parse_ts(parent["watermark"]))
+    candidates = [c for c in candidates if c is not None]
+    return max(candidates) if candidates else None
+
+
+def split_ranges(start, end, step, open_ended=True):
+    """Split [start, end] into consecutive (lo, hi) ranges of width `step`.
+
+    With open_ended the first range has no lower bound and the last no upper
+    bound, so no row falls between the sampled bounds and the chunks.
+    """
+    if start is None or end is None:
+        return [(None, None)]
+    bounds = []
+    lo = start
+    while lo <= end:
+        bounds.append(lo)
+        lo += step
+    ranges = []
+    for i, lo in enumerate(bounds):
+        hi = bounds[i + 1] if i + 1 < len(bounds) else (None if open_ended else end)
+        ranges.append((None if open_ended and i == 0 else lo, hi))
+    return ranges
+
+
+def _dump(client, apply_filters, path, described_range):
+    """Page rows by id keyset into a gzip chunk.
+
+    Keyset paging never skips rows when others are updated or deleted
+    mid-dump.
+    """
+    rows = 0
+    last_id = None
+    with gzip.open(path, "wt", encoding="utf-8") as out:
+        while True:
+            query = apply_filters(client.table("submissions").select("*"))
+            if last_id is not None:
+                query = query.gt("id", last_id)
+            page = query.order("id").limit(PAGE_SIZE).execute().data or []
+            for row in page:
+                out.write(json.dumps(row, default=str))
+                out.write("\n")
+            rows += len(page)
+            if len(page) < PAGE_SIZE:
+                break
+            last_id = page[-1]["id"]
+    return {
+        "file": os.path.basename(path),
+        "rows": rows,
+        "bytes": os.path.getsize(path),
+        "sha256": _sha256(path),
+        "range": described_range,
+    }
+
+
+def dump_range(client, column, lo, hi, path, inclusive_hi=False):
+    """Page through lo <= column < hi (or <= hi) into a gzip JSONL chunk file."""
+    def apply_filters(query):
+        if lo is not None:
+            query = query.gte(column, lo.isoformat())
+        if hi is not None:
+            query = query.lte(column, hi.isoformat()) if inclusive_hi \
+                else query.lt(column, hi.isoformat())
+        return query
+
+    described = [column, lo.isoformat() if lo else None, hi.isoformat() if hi else None]
+    return _dump(client, apply_filters, path, described)
+
+
+def dump_null(client, column, path):
+    """Dump rows whose range column is NULL, which no range filter matches."""
+    return _dump(client, lambda query: query.is_(column, "null"), path, [column, None, None])
+
+
+def list_manifests(backup_dir):
+    """Return manifests in sequence order."""
+    manifests = []
+    if not os.path.isdir(backup_dir):
+        return manifests
+    for name in sorted(os.listdir(backup_dir)):
+        path = os.path.join(backup_dir, name, MANIFEST)
+        if os.path.isfile(path):
+            with open(path) as f:
+                manifest = json.load(f)
+            manifest["_dir"] = os.path.join(backup_dir, name)
+            manifests.append(manifest)
+    return manifests
+
+
+def _deleted_since(client, since, until=None):
+    """Ids deleted in (since, until], paged on the audit_logs (created_at, id) keyset."""
+    ids = set()
+    cursor = None
+    while True:
+        query = (
+            client.table("audit_logs")
+            .select("id, record_id, created_at")
+            .eq("table_name", "submissions")
+            .eq("action", "DELETE")
+            .gt("created_at", since.isoformat())
+        )
+        if until is not None:
+            query = query.lte("created_at", until.isoformat())
+        if cursor is not None:
+            query = query.or_(
+                f'created_at.gt."{cursor[0]}",'
+                f'and(created_at.eq."{cursor[0]}",id.gt.{cursor[1]})'
+            )
+        page = query.order("created_at").order("id").limit(PAGE_SIZE).execute().data or []
+        ids.update(row["record_id"] for row in page)
+        if len(page) < PAGE_SIZE:
+            return sorted(ids)
+        cursor = (page[-1]["created_at"], page[-1]["id"])
+
+
+def run_backup(client, backup_dir, kind="incremental", workers=DEFAULT_WORKERS,
+               chunk_days=DEFAULT_CHUNK_DAYS, register=True):
+    """Write a base or delta backup and return its manifest.
+
+    kind="incremental" falls back to a base snapshot when none exists yet.
+    """
+    manifests = list_manifests(backup_dir)
+    parent = manifests[-1] if manifests else None
+    if kind == "incremental" and parent is None:
+        print("No base snapshot found, taking a full backup")
+        kind = "full"
+
+    started = time.monotonic()
+    watermark = current_watermark(client, parent)
+    sequence = len(manifests) + 1
+    label = "base" if kind == "full" else "delta"
+    point_name = f"{sequence:04d}-{label}-{_now_tag()}"
+    out_dir = os.path.join(backup_dir, point_name)
+    os.makedirs(out_dir)
+
+    jobs = []
+    deleted_ids = []
+    if kind == "full":
+        first = _bound(client, "created_at", desc=False)
+        last = _bound(client, "created_at", desc=True)
+        for lo, hi in split_ranges(first, last, timedelta(days=chunk_days)):
+            jobs.append(("created_at", lo, hi, False))
+    else:
+        since = _parse_ts(parent["watermark"]) - LOOKBACK if parent["watermark"] else None
+        if watermark is not None and (since is None or watermark > since):
+            step = max((watermark - since) / DEFAULT_DELTA_SLICES, timedelta(seconds=1)) \
+                if since is not None else timedelta(days=chunk_days)
+            slices = split_ranges(since, watermark, step, open_ended=False)
+            for i, (lo, hi) in enumerate(slices):
+                jobs.append(("updated_at", lo, hi, i == len(slices) - 1))
+        if since is not None:
+            deleted_ids = _deleted_since(client, since, watermark)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(dump_range, client, column, lo, hi,
+                        os.path.join(out_dir, f"chunk-{i:04d}.jsonl.gz"), inclusive)
+            for i, (column, lo, hi, inclusive) in enumerate(jobs)
+        ]
+        if kind == "full":
+            futures.append(pool.submit(
+                dump_null, client, "created_at",
+                os.path.join(out_dir, f"chunk-{len(jobs):04d}.jsonl.gz"),
+            ))
+        chunks = [future.result() for future in futures]
+
+    # Keep the manifest to chunks that hold data
+    for chunk in chunks:
+        if not chunk["rows"]:
+            os.remove(os.path.join(out_dir, chunk["file"]))
+    chunks = [chunk for chunk in chunks if chunk["rows"]]
+
+    manifest = {
+        "point_name": point_name,
+        "kind": label,
+        "sequence": sequence,
+        "parent": parent["point_name"] if parent and label == "delta" else None,
+        "taken_at": datetime.now(timezone.utc).isoformat(),
+        "watermark": watermark.isoformat() if watermark else
+        (parent["watermark"] if parent else None),
+        "row_count": sum(c["rows"] for c in chunks),
+        "size_bytes": sum(c["bytes"] for c in chunks),
+        "deleted_ids": deleted_ids,
+        "chunks": chunks,
+        "elapsed_seconds": round(time.monotonic() - started, 3),
+    }
+    with open(os.path.join(out_dir, MANIFEST), "w") as f:
+        json.dump(manifest, f, indent=2)
+
+    if register:
+        try:
+            client.rpc("register_backup_recovery_point", {
+                "point_name": point_name,
+                "backup_type": label,
+                "backup_location": os.path.abspath(out_dir),
+                "size_bytes": manifest["size_bytes"],
+                "manifest": manifest,
+            }).execute()
+        except Exception as e:
+            print(f"⚠️ Could not register recovery point: {e}")
+
+    return manifest
+
+
+def restore_chain(manifests, to=None, until=None):
+    """Pick the base and deltas needed to reach a recovery point.
+
+    `to` selects a point by name; `until` picks the newest point whose
+    watermark is at or before the given time. Defaults to the latest point.
+    """
+    if not manifests:
+        raise ValueError("No backups found")
+
+    if to is not None:
+        names = [m["point_name"] for m in manifests]
+        if to not in names:
+            raise ValueError(f"Unknown recovery point: {to}")
+        end = names.index(to)
+    elif until is not None:
+        end = None
+        for i, m in enumerate(manifests):
+            if m["watermark"] and _parse_ts(m["watermark"]) <= until:
+                end = i
+        if end is None:
+            raise ValueError(f"No recovery point at or before {until.isoformat()}")
+    else:
+        end = len(manifests) - 1
+
+    start = end
+    while manifests[start]["kind"] != "base":
+        start -= 1
+        if start < 0:
+            raise ValueError("Recovery point has no base snapshot")
+    return manifests[start:end + 1]
+
+
+def iter_chunk_rows(manifest, chunk):
+    path = os.path.join(manifest["_dir"], chunk["file"])
+    actual = _sha256(path)
+    if actual != chunk["sha256"]:
+        raise ValueError(f"Checksum mismatch for {path}")
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            yield json.loads(line)
+
+
+class SQLiteTarget:
+    placeholder = "?"
+
+    def __init__(self, path):
+        import sqlite3
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {RESTORE_TABLE} "
+            "(id TEXT PRIMARY KEY, updated_at TEXT, data TEXT NOT NULL)"
+        )
+
+    def upsert(self, rows):
+        self.conn.executemany(
+            f"INSERT INTO {RESTORE_TABLE} (id, updated_at, data) VALUES (?, ?, ?) "
+            "ON CONFLICT (id) DO UPDATE SET updated_at = excluded.updated_at, "
+            "data = excluded.data",
+            rows,
+        )
+
+    def delete(self, ids):
+        self.conn.executemany(
+            f"DELETE FROM {RESTORE_TABLE} WHERE id = ?", [(i,) for i in ids]
+        )
+
+    def commit(self):
+        self.conn.commit()
+
+
+class PostgresTarget:
+    def __init__(self, dsn):
+        try:
+            import psycopg
+        except ImportError:
+            import psycopg2 as psycopg
+        self.conn = psycopg.connect(dsn)
+        with self.conn.cursor() as cur:
+            cur.execute(
+                f"CREATE TABLE IF NOT EXISTS {RESTORE_TABLE} "
+                "(id uuid PRIMARY KEY, updated_at timestamptz, data jsonb NOT NULL)"
+            )
+
+    def upsert(self, rows):
+        with self.conn.cursor() as cur:
+            cur.executemany(
+                f"INSERT INTO {RESTORE_TABLE} (id, updated_at, data) VALUES (%s, %s, %s) "
+                "ON CONFLICT (id) DO UPDATE SET updated_at = excluded.updated_at, "
+                "data = excluded.data",
+                rows,
+            )
+
+    def delete(self, ids):
+        with self.conn.cursor() as cur:
+            cur.executemany(
+                f"DELETE FROM {RESTORE_TABLE} WHERE id = %s", [(i,) for i in ids]
+            )
+
+    def commit(self):
+        self.conn.commit()
+
+
+def open_target(target):
+    if target.startswith(("postgres://", "postgresql://")):
+        return PostgresTarget(target)
+    if target.startswith("sqlite:///"):
+        target = target[len("sqlite:///"):]
+    return SQLiteTarget(target)
+
+
+def restore(backup_dir, target, to=None, until=None, batch_size=PAGE_SIZE):
+    """Replay base + deltas up to a recovery point into `target`."""
+    chain = restore_chain(list_manifests(backup_dir), to=to, until=until)
+    sink = open_target(target)
+    restored = 0
+    for manifest in chain:
+        for chunk in manifest["chunks"]:
+            batch = []
+            for row in iter_chunk_rows(manifest, chunk):
+                batch.append((row["id"], row.get("updated_at"), json.dumps(row)))
+                if len(batch) >= batch_size:
+                    sink.upsert(batch)
+                    restored += len(batch)
+                    batch = []
+            if batch:
+                sink.upsert(batch)
+                restored += len(batch)
+        if manifest.get("deleted_ids"):
+            sink.delete(manifest["deleted_ids"])
+        sink.commit()
+        print(f"  Replayed {manifest['point_name']} ({manifest['row_count']} rows)")
+    return chain[-1], restored
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="seo_tools backup",
+                                     description="Back up and restore submissions")
+    parser.add_argument("--dir", default="backups", help="Backup directory")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    for name, help_text in (("full", "Take a base snapshot"),
+                            ("incremental", "Take a delta since the last backup")):
+        p = sub.add_parser(name, help=help_text)
+        p.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+        p.add_argument("--chunk-days", type=int, default=DEFAULT_CHUNK_DAYS)
+        p.add_argument("--no-register", action="store_true",
+                       help="Do not record the backup in recovery_points")
+
+    sub.add_parser("list", help="List recovery points")
+
+    p = sub.add_parser("restore", help="Replay backups into a local database")
+    p.add_argument("target", help="sqlite:///path.db, a file path, or a postgresql:// DSN")
+    group = p.add_mutually_exclusive_group()
+    group.add_argument("--to", help="Recovery point name")
+    group.add_argument("--until", help="Latest point at or before this ISO timestamp")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "list":
+        for m in list_manifests(args.dir):
+            print(f"{m['point_name']:<40} {m['kind']:<6} {m['row_count']:>7} rows  "
+                  f"watermark {m['watermark']}")
+        return 0
+
+    if args.command == "restore":
+        until = _parse_ts(args.until) if args.until else None
+        point, restored = restore(args.dir, args.target, to=args.to, until=until)
+        print(f"\n✅ Restored {restored} rows to {point['point_name']} in {args.target}")
+        print(f"Rows are in {RESTORE_TABLE}(id, updated_at, data); on Postgres use "
+              "jsonb_populate_record(NULL::submissions, data) to rebuild submissions.")
+        return 0
+
+    from .config import get_supabase
+    manifest = run_backup(
+        get_supabase(), args.dir, kind=args.command, workers=args.workers,
+        chunk_days=args.chunk_days, register=not args.no_register,
+    )
+    print(f"✅ {manifest['point_name']}: {manifest['row_count']} rows in "
+          f"{len(manifest['chunks'])} chunk(s), {manifest['size_bytes']} bytes, "
+          f"{manifest['elapsed_seconds']}s")
+    if manifest["deleted_ids"]:
+        print(f"   {len(manifest['deleted_ids'])} deletion(s) recorded")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
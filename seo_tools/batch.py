@@ -0,0 +1,180 @@
+"""
+Chunked wrappers for the batch RPCs in supabase/08-batch-operations.sql
+
+run_seo_automation_batch() and create_submissions_batch() take a whole
+array per call and report per-item results, so a backlog of thousands of
+submissions costs a handful of round trips. The wrappers below split large
+inputs into chunks and rebase item_index so it always refers to the
+position in the caller's original list. A chunk whose RPC call fails
+reports each of its items as failed instead of aborting the run.
+"""
+import argparse
+import json
+import uuid
+
+SEO_CHUNK_SIZE = 200
+CREATE_CHUNK_SIZE = 500
+
+# create_submission() parameters accepted per record (without the p_ prefix)
+RECORD_FIELDS = (
+    "compliance_id", "product_name", "generic_name", "indication",
+    "therapeutic_area", "submitter_email", "submitter_name",
+    "seo_reviewer_name", "seo_reviewer_email", "workflow_stage",
+    "priority_level", "stage",
+)
+
+
+def chunked(items, size):
+    for start in range(0, len(items), size):
+        yield start, items[start:start + size]
+
+
+def _is_uuid(value):
+    try:
+        uuid.UUID(str(value))
+    except ValueError:
+        return False
+    return True
+
+
+def _call(client, function, params, offset, progress, ids):
+    """Run one chunk; `ids` gives each item's submission_id (or None) on failure."""
+    try:
+        rows = client.rpc(function, params).execute().data or []
+    except Exception as e:
+        rows = [{"item_index": i, "submission_id": submission_id, "ok": False,
+                 "error": f"batch call failed: {e}"} for i, submission_id in enumerate(ids)]
+    for row in rows:
+        row["item_index"] += offset
+    if progress:
+        failed = sum(1 for row in rows if not row["ok"])
+        print(f"  {function}: items {offset}-{offset + len(rows) - 1}, {failed} failed")
+    return rows
+
+
+def run_seo_automation_many(client, submission_ids, chunk_size=SEO_CHUNK_SIZE, progress=False):
+    """Run SEO automation for every id; one result dict per input id.
+
+    Ids that are not UUIDs are reported as failed without being sent, since
+    one would make Postgres reject the whole uuid[] chunk. Repeated ids run
+    once; later copies are reported as skipped, the same way the SQL
+    function treats repeats within one chunk.
+    """
+    first_seen = {}
+    skipped = []
+    for index, submission_id in enumerate(submission_ids):
+        if not _is_uuid(submission_id):
+            skipped.append({
+                "item_index": index, "submission_id": submission_id, "ok": False,
+                "error": "invalid submission id",
+            })
+        elif submission_id in first_seen:
+            skipped.append({
+                "item_index": index, "submission_id": submission_id, "ok": True,
+                "error": f"duplicate of item {first_seen[submission_id]}, skipped",
+            })
+        else:
+            first_seen[submission_id] = index
+
+    unique = list(first_seen)
+    positions = list(first_seen.values())
+    results = []
+    for offset, chunk in chunked(unique, chunk_size):
+        results.extend(_call(client, "run_seo_automation_batch",
+                             {"submission_ids": chunk}, offset, progress, chunk))
+    for row in results:
+        row["item_index"] = positions[row["item_index"]]
+    return sorted(results + skipped, key=lambda row: row["item_index"])
+
+
+def create_submissions_many(client, records, chunk_size=CREATE_CHUNK_SIZE, progress=False):
+    """Create every record (keys as in RECORD_FIELDS); one result per record."""
+    records = [{k: r[k] for k in RECORD_FIELDS if k in r} for r in records]
+    results = []
+    for offset, chunk in chunked(records, chunk_size):
+        results.extend(_call(client, "create_submissions_batch",
+                             {"records": chunk}, offset, progress, [None] * len(chunk)))
+    return results
+
+
+def stuck_submission_ids(client, page_size=1000):
+    """Ids still marked processing without SEO output (see process-all-stuck.mjs)."""
+    ids = []
+    last_id = None
+    while True:
+        query = (
+            client.table("submissions")
+            .select("id")
+            .eq("ai_processing_status", "processing")
+            .is_("seo_title", "null")
+        )
+        if last_id is not None:
+            query = query.gt("id", last_id)
+        page = query.order("id").limit(page_size).execute().data or []
+        ids.extend(row["id"] for row in page)
+        if len(page) < page_size:
+            return ids
+        last_id = page[-1]["id"]
+
+
+def _report(results, label):
+    failed = [r for r in results if not r["ok"]]
+    print(f"\n{'✅' if not failed else '⚠️'} {label}: {len(results) - len(failed)} ok, "
+          f"{len(failed)} failed")
+    for row in failed[:20]:
+        print(f"  [{row['item_index']}] {row.get('submission_id') or '-'}: {row['error']}")
+    if len(failed) > 20:
+        print(f"  ... and {len(failed) - 20} more")
+    return 1 if failed else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="seo_tools batch",
+                                     description="Batch SEO automation and submission creation")
+    sub = parser.add_subparsers(dest="action", required=True)
+
+    seo = sub.add_parser("seo", help="Run run_seo_automation for many submissions")
+    seo.add_argument("submission_ids", nargs="*")
+    seo.add_argument("--file", help="File with one submission id per line")
+    seo.add_argument("--stuck", action="store_true",
+                     help="All submissions stuck in processing without SEO output")
+    seo.add_argument("--chunk-size", type=int, default=SEO_CHUNK_SIZE)
+
+    create = sub.add_parser("create", help="Create submissions from a JSON array of records")
+    create.add_argument("file", help="JSON file: a list of records, or {\"test_submissions\": [...]}")
+    create.add_argument("--chunk-size", type=int, default=CREATE_CHUNK_SIZE)
+    create.add_argument("--out", help="Write per-item results as JSON")
+
+    args = parser.parse_args(argv)
+
+    from .config import get_supabase
+    client = get_supabase()
+
+    if args.action == "seo":
+        ids = list(args.submission_ids)
+        if args.file:
+            with open(args.file) as f:
+                ids.extend(line.strip() for line in f if line.strip())
+        if args.stuck:
+            ids.extend(stuck_submission_ids(client))
+        if not ids:
+            print("No submission ids given")
+            return 1
+        print(f"Running SEO automation for {len(ids)} submissions...")
+        results = run_seo_automation_many(client, ids, args.chunk_size, progress=True)
+        return _report(results, "SEO automation")
+
+    with open(args.file) as f:
+        data = json.load(f)
+    records = data.get("test_submissions", []) if isinstance(data, dict) else data
+    print(f"Creating {len(records)} submissions...")
+    results = create_submissions_many(client, records, args.chunk_size, progress=True)
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"📄 Results saved to: {args.out}")
+    return _report(results, "Create submissions")
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
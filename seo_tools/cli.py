@@ -0,0 +1,88 @@
+"""
+Single entry point for the Python tooling: `python -m seo_tools <command>`
+
+Dispatch is a dictionary lookup; a command's module (and anything heavy it
+needs, like the supabase client) is imported only after it has been picked,
+so `--help` and short checks stay cheap when run from cron and shell loops.
+"""
+import sys
+
+# command -> (module, function, summary)
+COMMANDS = {
+    "check-submission": ("seo_tools.commands.submissions", "check_submission",
+                         "Check AI/SEO status of a submission"),
+    "check-fields": ("seo_tools.commands.submissions", "check_all_fields",
+                     "List every field of a submission, grouped"),
+    "check-detailed": ("seo_tools.commands.submissions", "check_submission_detailed",
+                       "Detailed AI/SEO/timestamp dump of a submission"),
+    "webhook-logs": ("seo_tools.commands.webhooks", "check_webhook_logs",
+                     "Recent webhook executions, audit logs and AI updates"),
+    "trigger-seo": ("seo_tools.commands.automation", "trigger_seo_automation",
+                    "Run run_seo_automation for a submission"),
+    "batch": ("seo_tools.batch", "main",
+              "Batch run_seo_automation / create_submission in chunked RPCs"),
+    "check-functions": ("seo_tools.commands.automation", "check_available_functions",
+                        "Probe which RPC functions exist"),
+    "final-test": ("seo_tools.commands.test_runs", "final_test_submission",
+                   "Insert a test submission and call trigger_n8n_webhook"),
+    "direct-submission": ("seo_tools.commands.test_runs", "direct_submission",
+                          "Create via create_submission and POST the webhook"),
+    "webhook-submission": ("seo_tools.commands.test_runs", "webhook_submission",
+                           "Insert a test submission and POST the webhook"),
+    "api-submissions": ("seo_tools.railway", "main",
+                        "List submissions via the Railway API (cursor + ETag cache)"),
+    "search": ("seo_tools.search", "main",
+               "Batched hybrid search over submissions"),
+    "validate-seo": ("seo_tools.validate", "main",
+                     "Bulk-check generated SEO output constraints"),
+    "llm-cache": ("seo_tools.llm_cache", "main",
+                  "Stats/prune/clear the shared LLM response cache"),
+    "governor": ("seo_tools.governor", "main",
+                 "Adaptive concurrency governor (simulate against a fake provider)"),
+    "terminology": ("seo_tools.terminology", "main",
+                    "Annotate text/submissions with SNOMED/ICD-10/RxNorm codes"),
+    "audit": ("seo_tools.audit", "main",
+              "Tail audit_logs or page a submission's audit trail"),
+    "rollups": ("seo_tools.rollups", "main",
+                "Refresh the analytics dashboard rollups"),
+    "backup": ("seo_tools.backup", "main",
+               "Incremental backups and point-in-time restore"),
+    "load": ("seo_tools.load", "main",
+             "Open-loop synthetic load test of the submission pipeline"),
+    "startup-check": ("seo_tools.startup", "main",
+                      "Measure CLI import time against a budget"),
+}
+
+
+def usage():
+    width = max(len(name) for name in COMMANDS)
+    lines = ["usage: python -m seo_tools <command> [args...]", "", "commands:"]
+    for name, (_, _, summary) in COMMANDS.items():
+        lines.append(f"  {name:<{width}}  {summary}")
+    lines.append("")
+    lines.append("Run `python -m seo_tools <command> --help` for command options.")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if not argv or argv[0] in ("-h", "--help", "help"):
+        print(usage())
+        return 0
+
+    name, rest = argv[0], argv[1:]
+    if name not in COMMANDS:
+        print(f"Unknown command: {name}\n", file=sys.stderr)
+        print(usage(), file=sys.stderr)
+        return 2
+
+    module_name, func_name, _ = COMMANDS[name]
+    from importlib import import_module
+    command = getattr(import_module(module_name), func_name)
+
+    from .config import ConfigError
+    try:
+        return command(rest) or 0
+    except ConfigError as e:
+        print(f"Error: {e}")
+        return 1
@@ -0,0 +1,6 @@
+"""
+Subcommand implementations for `python -m seo_tools`
+
+Each module is imported only when one of its commands runs, and must not
+import supabase, requests or other heavy dependencies at module level.
+"""
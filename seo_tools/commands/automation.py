@@ -0,0 +1,111 @@
+"""
+Trigger SEO automation and probe the RPC functions it depends on
+"""
+import argparse
+import time
+
+KNOWN_FUNCTIONS = [
+    'run_seo_automation',
+    'create_submission',
+    'trigger_n8n_webhook',
+    'check_submissions_schema'
+]
+
+
+def trigger_seo_automation(argv):
+    parser = argparse.ArgumentParser(prog="seo_tools trigger-seo",
+                                     description="Trigger SEO automation for a submission")
+    parser.add_argument("submission_id", nargs="?",
+                        help="Defaults to the most recent TEST% submission")
+    parser.add_argument("--wait", type=float, default=5,
+                        help="Seconds to wait before checking results")
+    args = parser.parse_args(argv)
+
+    from ..config import get_supabase
+    supabase = get_supabase()
+
+    submission_id = args.submission_id
+    if not submission_id:
+        result = supabase.table('submissions').select("id, compliance_id, product_name").like('compliance_id', 'TEST%').order('created_at', desc=True).limit(1).execute()
+        if not result.data:
+            print("No test submissions found")
+            return 1
+        submission_id = result.data[0]['id']
+        print(f"Using most recent test submission: {result.data[0]['compliance_id']} - {result.data[0]['product_name']}")
+
+    print(f"\nTriggering SEO automation for submission: {submission_id}")
+    try:
+        supabase.rpc('run_seo_automation', {'submission_id': submission_id}).execute()
+        print("✅ SEO automation triggered successfully!")
+    except Exception as e:
+        print(f"❌ Error triggering SEO automation: {e}")
+        return 1
+
+    if args.wait:
+        print(f"\nWaiting {args.wait:g} seconds for processing...")
+        time.sleep(args.wait)
+
+    print("\nChecking results...")
+    result = supabase.table('submissions').select(
+        "id, compliance_id, product_name, workflow_stage, langchain_status, "
+        "seo_title, meta_description, seo_keywords, long_tail_keywords, "
+        "h2_tags, geo_event_tags, geo_optimization_score"
+    ).eq('id', submission_id).execute()
+
+    if not result.data:
+        print("❌ Could not retrieve submission")
+        return 1
+
+    submission = result.data[0]
+    print(f"\n📊 Submission Status:")
+    print(f"- Compliance ID: {submission.get('compliance_id')}")
+    print(f"- Product: {submission.get('product_name')}")
+    print(f"- Workflow Stage: {submission.get('workflow_stage')}")
+    print(f"- Langchain Status: {submission.get('langchain_status')}")
+
+    if submission.get('seo_title'):
+        print(f"\n✅ SEO content generated!")
+        print(f"- SEO Title: {submission.get('seo_title')}")
+        print(f"- Meta Description: {(submission.get('meta_description') or '')[:100]}...")
+        print(f"- SEO Keywords: {submission.get('seo_keywords')}")
+        print(f"- Long Tail Keywords: {submission.get('long_tail_keywords')}")
+        print(f"- H2 Tags: {submission.get('h2_tags')}")
+        print(f"- GEO Event Tags: {submission.get('geo_event_tags')}")
+        print(f"- GEO Optimization Score: {submission.get('geo_optimization_score')}")
+    else:
+        print("\n⚠️ SEO content generation may still be in progress or failed")
+    return 0
+
+
+def check_available_functions(argv):
+    parser = argparse.ArgumentParser(prog="seo_tools check-functions",
+                                     description="Check available RPC functions in Supabase")
+    parser.add_argument("functions", nargs="*", default=KNOWN_FUNCTIONS)
+    args = parser.parse_args(argv)
+
+    from ..config import get_supabase
+    supabase = get_supabase()
+
+    print("Testing available functions:\n")
+    for func_name in args.functions:
+        try:
+            # Called with no params: an error still tells us the function exists
+            supabase.rpc(func_name, {}).execute()
+            print(f"✅ {func_name} - Function exists")
+        except Exception as e:
+            error_msg = str(e)
+            if "Could not find the function" in error_msg:
+                print(f"❌ {func_name} - Function not found")
+            else:
+                print(f"⚠️  {func_name} - Function exists but error: {error_msg[:100]}...")
+
+    if 'check_submissions_schema' in args.functions:
+        print("\n\nTrying check_submissions_schema function...")
+        try:
+            result = supabase.rpc('check_submissions_schema', {}).execute()
+            if result.data:
+                print("✅ check_submissions_schema returned data:")
+                print(result.data)
+        except Exception as e:
+            print(f"Error: {e}")
+    return 0
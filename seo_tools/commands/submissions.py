@@ -0,0 +1,222 @@
+"""
+Inspect a single submission's AI / SEO fields
+"""
+import argparse
+import json
+
+DEFAULT_SUBMISSION_ID = "d3baa593-bd9a-4e9a-98e9-ab460e3a9960"
+SEO_SPECIFIC_FIELDS = [
+    'seo_content', 'seo_title', 'meta_title', 'meta_description',
+    'seo_keywords', 'primary_keywords', 'secondary_keywords',
+    'h1_tag', 'h2_tags', 'geo_event_tags', 'seo_strategy_outline',
+    'competitive_analysis'
+]
+
+
+def _parse(prog, description, argv, default_id=DEFAULT_SUBMISSION_ID):
+    parser = argparse.ArgumentParser(prog=prog, description=description)
+    parser.add_argument("submission_id", nargs="?", default=default_id)
+    parser.add_argument("--no-save", action="store_true",
+                        help="Do not write the submission to a JSON file")
+    return parser.parse_args(argv)
+
+
+def fetch_submission(submission_id, columns="*"):
+    from ..config import get_supabase
+    result = get_supabase().table('submissions').select(columns).eq('id', submission_id).execute()
+    return result.data[0] if result.data else None
+
+
+def check_submission(argv):
+    args = _parse("seo_tools check-submission", "Check the status of a submission", argv)
+    print(f"Checking submission: {args.submission_id}\n")
+
+    submission = fetch_submission(args.submission_id)
+    if not submission:
+        print(f"❌ Submission not found: {args.submission_id}")
+        return 1
+
+    ai_fields = {
+        'workflow_stage': submission.get('workflow_stage'),
+        'ai_processing_status': submission.get('ai_processing_status'),
+        'ai_generated_content': submission.get('ai_generated_content'),
+        'seo_title': submission.get('seo_title'),
+        'meta_description': submission.get('meta_description'),
+        'primary_keywords': submission.get('primary_keywords'),
+        'secondary_keywords': submission.get('secondary_keywords'),
+        'h1_tag': submission.get('h1_tag'),
+        'h2_tags': submission.get('h2_tags'),
+        'geo_event_tags': submission.get('geo_event_tags'),
+        'seo_strategy_outline': submission.get('seo_strategy_outline'),
+        'competitive_analysis': submission.get('competitive_analysis'),
+        'ai_error': submission.get('ai_error')
+    }
+
+    print("📊 Submission Status:")
+    print(f"Compliance ID: {submission.get('compliance_id')}")
+    print(f"Product: {submission.get('product_name')}")
+    print(f"Workflow Stage: {ai_fields['workflow_stage']}")
+    print(f"AI Processing Status: {ai_fields['ai_processing_status']}")
+
+    if ai_fields['ai_error']:
+        print(f"\n❌ AI Error: {ai_fields['ai_error']}")
+
+    if not ai_fields['ai_generated_content']:
+        print("\n⏳ No AI content generated yet")
+        print("AI processing may still be in progress or there might be an error")
+        return 0
+
+    print("\n✅ AI content generated successfully!")
+    print_seo_preview(ai_fields)
+
+    if not args.no_save:
+        output_file = f"submission_{args.submission_id}.json"
+        save_json(output_file, {
+            'submission_id': args.submission_id,
+            'compliance_id': submission.get('compliance_id'),
+            'ai_fields': ai_fields,
+            'full_submission': submission
+        })
+        print(f"\nFull results saved to: {output_file}")
+    return 0
+
+
+def check_all_fields(argv):
+    args = _parse("seo_tools check-fields", "Check ALL fields in the submission", argv,
+                  default_id="367789ee-9e5d-4a16-9c27-30d475736dab")
+    submission = fetch_submission(args.submission_id)
+    if not submission:
+        print(f"❌ Submission not found: {args.submission_id}")
+        return 1
+
+    print(f"=== COMPLETE FIELD LIST FOR SUBMISSION {args.submission_id} ===\n")
+
+    ai_fields, seo_fields, other_fields = [], [], []
+    for field, value in submission.items():
+        if 'ai_' in field or field == 'seo_content':
+            ai_fields.append((field, value))
+        elif 'seo_' in field or 'meta_' in field or 'keyword' in field or '_tag' in field:
+            seo_fields.append((field, value))
+        else:
+            other_fields.append((field, value))
+
+    print("AI RELATED FIELDS:")
+    _print_fields(ai_fields, show_null=True)
+    print("\nSEO RELATED FIELDS:")
+    _print_fields(seo_fields, show_null=True)
+    print("\nOTHER FIELDS:")
+    _print_fields(
+        [(f, v) for f, v in other_fields if f not in ['id', 'created_at', 'updated_at']],
+        show_null=False,
+    )
+
+    print("\n=== CHECKING FOR ANY PERPLEXITY CONTENT ===")
+    perplexity_found = False
+    for field, value in submission.items():
+        if value and isinstance(value, str):
+            if 'perplexity' in value.lower() or 'ai-generated' in value.lower():
+                print(f"Found potential AI content in {field}!")
+                perplexity_found = True
+    if not perplexity_found:
+        print("No Perplexity or AI-generated content found in any fields.")
+
+    print("\n=== ADDITIONAL SEO FIELD CHECK ===")
+    for field in SEO_SPECIFIC_FIELDS:
+        if submission.get(field):
+            print(f"✓ {field}: HAS CONTENT")
+        else:
+            print(f"✗ {field}: EMPTY")
+    return 0
+
+
+def check_submission_detailed(argv):
+    args = _parse("seo_tools check-detailed",
+                  "Detailed check of a submission including all SEO and AI fields", argv,
+                  default_id="367789ee-9e5d-4a16-9c27-30d475736dab")
+    print(f"Detailed check for submission: {args.submission_id}\n")
+    submission = fetch_submission(args.submission_id)
+    if not submission:
+        print(f"❌ Submission not found: {args.submission_id}")
+        return 1
+
+    print("=== AI PROCESSING STATUS ===")
+    print(f"ai_processing_status: {submission.get('ai_processing_status')}")
+    print(f"ai_generated_content: {'YES' if submission.get('ai_generated_content') else 'NO'}")
+    print(f"ai_error: {submission.get('ai_error')}")
+
+    print("\n=== SEO CONTENT FIELDS ===")
+    print(f"seo_content: {'YES' if submission.get('seo_content') else 'NO'}")
+    if submission.get('seo_content'):
+        print(f"  Length: {len(submission.get('seo_content', ''))} characters")
+        print(f"  Preview: {submission.get('seo_content', '')[:200]}...")
+
+    print(f"\nseo_title: {submission.get('seo_title')}")
+    print(f"meta_title: {submission.get('meta_title')}")
+    print(f"meta_description: {submission.get('meta_description')}")
+    print(f"seo_keywords: {submission.get('seo_keywords')}")
+
+    print("\n=== OTHER SEO FIELDS ===")
+    for field in ('primary_keywords', 'secondary_keywords', 'h1_tag', 'h2_tags', 'geo_event_tags'):
+        print(f"{field}: {submission.get(field)}")
+    print(f"seo_strategy_outline: {'YES' if submission.get('seo_strategy_outline') else 'NO'}")
+    print(f"competitive_analysis: {'YES' if submission.get('competitive_analysis') else 'NO'}")
+
+    print("\n=== TIMESTAMPS ===")
+    for field in ('created_at', 'updated_at', 'ai_processing_started_at', 'ai_processing_completed_at'):
+        print(f"{field}: {submission.get(field)}")
+
+    print("\n=== WORKFLOW INFO ===")
+    print(f"workflow_stage: {submission.get('workflow_stage')}")
+    print(f"status: {submission.get('status')}")
+
+    content = submission.get('ai_generated_content')
+    if content:
+        print("\n=== AI GENERATED CONTENT DETAILS ===")
+        parsed = content if isinstance(content, dict) else None
+        if parsed is None:
+            try:
+                parsed = json.loads(content)
+            except (TypeError, ValueError):
+                parsed = None
+        if isinstance(parsed, dict):
+            print("Content is JSON format:")
+            for key, value in parsed.items():
+                print(f"  {key}: {str(value)[:100]}...")
+        else:
+            print(f"Content is text format ({len(str(content))} characters)")
+            print(f"Preview: {str(content)[:500]}...")
+
+    if not args.no_save:
+        output_file = f"detailed_submission_{args.submission_id}.json"
+        save_json(output_file, submission)
+        print(f"\n\nComplete submission data saved to: {output_file}")
+    return 0
+
+
+def print_seo_preview(fields):
+    print(f"\nGenerated content preview:")
+    print(f"- SEO Title: {fields.get('seo_title')}")
+    if fields.get('meta_description'):
+        print(f"- Meta Description: {fields['meta_description'][:100]}...")
+    else:
+        print("- Meta Description: Not generated")
+    print(f"- Primary Keywords: {fields.get('primary_keywords')}")
+    print(f"- H1 Tag: {fields.get('h1_tag')}")
+    print(f"- H2 Tags: {fields.get('h2_tags')}")
+    print(f"- GEO Event Tags: {fields.get('geo_event_tags')}")
+
+
+def save_json(path, data):
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2, default=str)
+
+
+def _print_fields(fields, show_null):
+    for field, value in sorted(fields, key=lambda item: item[0]):
+        if value is None:
+            if show_null:
+                print(f"  {field}: NULL/None")
+        elif isinstance(value, str) and len(value) > 100:
+            print(f"  {field}: {value[:100]}... (truncated)")
+        else:
+            print(f"  {field}: {value}")
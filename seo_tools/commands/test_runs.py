@@ -0,0 +1,329 @@
+"""
+End-to-end test submissions: create, trigger the n8n webhook, wait, report
+"""
+import argparse
+import time
+from datetime import datetime, timezone
+
+from .submissions import print_seo_preview, save_json
+
+N8N_WEBHOOK_URL = "https://innovareai.app.n8n.cloud/webhook/hP9yZxUjmBKJmrZt"
+
+SEO_FIELDS = [
+    'seo_title', 'meta_description', 'meta_title',
+    'seo_keywords', 'primary_keywords', 'secondary_keywords',
+    'h1_tag', 'h2_tags', 'geo_event_tags'
+]
+
+AI_FIELDS = [
+    'ai_processing_status', 'ai_generated_content', 'seo_title',
+    'meta_description', 'primary_keywords', 'secondary_keywords', 'h1_tag',
+    'h2_tags', 'geo_event_tags', 'seo_strategy_outline', 'competitive_analysis'
+]
+
+# Fixtures previously hardcoded in the standalone test scripts
+PRODUCTS = {
+    "final": {
+        "compliance_prefix": "TEST-FINAL",
+        "product_name": "Opdivo Plus",
+        "generic_name": "nivolumab-ipilimumab",
+        "indication": "Unresectable malignant pleural mesothelioma",
+        "therapeutic_area": "Oncology",
+        "submitter_email": "final.test@pharma.com",
+        "submitter_name": "Dr. Final Test",
+        "seo_reviewer_name": "SEO Expert",
+        "seo_reviewer_email": "seo@3cubed.com",
+        "priority_level": "high",
+        "raw_input_content": """
+    Product: Opdivo Plus (nivolumab + ipilimumab)
+    Indication: First-line treatment of unresectable malignant pleural mesothelioma
+
+    Key Clinical Data:
+    - CheckMate 743 trial
+    - Overall Survival: 18.1 vs 14.1 months (HR 0.74, p=0.002)
+    - 3-year OS rate: 23% vs 15%
+    - Durable responses observed
+
+    Target Audience: Oncologists, thoracic surgeons
+    Key Message: First immunotherapy combination approved for mesothelioma
+    """,
+    },
+    "direct": {
+        "compliance_prefix": "TEST-AI",
+        "product_name": "Keytruda Plus",
+        "generic_name": "pembrolizumab-lenvatinib",
+        "indication": "First-line treatment of advanced renal cell carcinoma",
+        "therapeutic_area": "Oncology",
+        "submitter_email": "test.ai@pharma.com",
+        "submitter_name": "Dr. AI Test",
+        "seo_reviewer_name": "SEO Reviewer",
+        "seo_reviewer_email": "seo@3cubed.com",
+        "priority_level": "medium",
+        "stage": "Phase III",
+        "raw_input_content": """
+        Product: Keytruda Plus (pembrolizumab + lenvatinib)
+        Indication: First-line advanced RCC
+        Key Data:
+        - CLEAR trial: mPFS 23.9 vs 9.2 months (HR 0.39)
+        - ORR: 71% vs 36%
+        - CR rate: 16.1% vs 4.2%
+        Target: Oncologists, urologists
+        """,
+    },
+    "webhook": {
+        "compliance_prefix": "TEST-PHARMA",
+        "product_name": "Nexavar Plus",
+        "generic_name": "sorafenib-pembrolizumab",
+        "indication": "Advanced hepatocellular carcinoma in patients with Child-Pugh A liver function",
+        "therapeutic_area": "Oncology",
+        "submitter_email": "test.pharma@example.com",
+        "submitter_name": "Dr. Sarah Johnson",
+        "seo_reviewer_name": "Michael Chen",
+        "seo_reviewer_email": "seo.reviewer@3cubed.com",
+        "mlr_reviewer_name": "Dr. Emily Roberts",
+        "mlr_reviewer_email": "mlr.reviewer@pharmatest.com",
+        "priority_level": "medium",
+        "raw_input_content": """
+    Product: Nexavar Plus (sorafenib-pembrolizumab combination)
+    Indication: Advanced hepatocellular carcinoma
+    Key Clinical Data:
+    - Phase 3 STELLAR trial: mPFS 9.2 months vs 7.4 months (HR 0.72, p=0.003)
+    - ORR: 32% vs 18% with sorafenib alone
+    - Grade 3-4 AEs: 68% (manageable with dose modifications)
+    Target HCPs: Oncologists specializing in HCC treatment
+    """,
+    },
+}
+
+
+def build_submission(fixture):
+    data = {k: v for k, v in PRODUCTS[fixture].items() if k not in ("compliance_prefix", "stage")}
+    now = datetime.now(timezone.utc).isoformat()
+    data.update({
+        "compliance_id": f"{PRODUCTS[fixture]['compliance_prefix']}-{int(time.time())}",
+        "workflow_stage": "draft",
+        "ai_processing_status": "pending",
+        "created_at": now,
+        "updated_at": now,
+    })
+    return data
+
+
+def insert_submission(supabase, data):
+    result = supabase.table('submissions').insert(data).execute()
+    return result.data[0]['id'] if result.data else None
+
+
+def create_via_rpc(supabase, data, stage=None):
+    """Create through the create_submission RPC, mirroring its p_* parameters."""
+    params = {f"p_{key}": data[key] for key in (
+        'compliance_id', 'product_name', 'generic_name', 'indication',
+        'therapeutic_area', 'submitter_email', 'submitter_name',
+        'seo_reviewer_name', 'seo_reviewer_email', 'workflow_stage',
+        'priority_level'
+    )}
+    if stage:
+        params['p_stage'] = stage
+    result = supabase.rpc('create_submission', params).execute()
+    if not result.data:
+        raise Exception("No data returned from function")
+    return result.data
+
+
+def post_webhook(payload, url=N8N_WEBHOOK_URL):
+    import requests
+    response = requests.post(url, json=payload)
+    print(f"Webhook response status: {response.status_code}")
+    if response.text:
+        print(f"Response body: {response.text[:200]}")
+    return response
+
+
+def wait_for_ai(supabase, submission_id, seconds, poll=5):
+    """Wait up to `seconds`, returning early once ai_generated_content appears."""
+    print(f"\nWaiting {seconds} seconds for AI processing...")
+    remaining = seconds
+    while remaining > 0:
+        step = min(poll, remaining)
+        time.sleep(step)
+        remaining -= step
+        print(f"  {remaining} seconds remaining...")
+        check = supabase.table('submissions').select(
+            "ai_processing_status, workflow_stage, ai_generated_content"
+        ).eq('id', submission_id).execute()
+        if check.data and check.data[0].get('ai_generated_content'):
+            print("\n🎉 AI content detected early!")
+            return
+
+
+def report(supabase, submission_id, compliance_id, output_prefix):
+    result = supabase.table('submissions').select("*").eq('id', submission_id).execute()
+    if not result.data:
+        print("❌ Could not retrieve submission")
+        return 1
+    submission = result.data[0]
+
+    print(f"\n📊 FINAL RESULTS:")
+    print(f"Submission ID: {submission_id}")
+    print(f"Compliance ID: {compliance_id}")
+    print(f"Workflow Stage: {submission.get('workflow_stage')}")
+    print(f"AI Processing Status: {submission.get('ai_processing_status')}")
+    if submission.get('ai_error'):
+        print(f"AI Error: {submission.get('ai_error')}")
+
+    ai_content = submission.get('ai_generated_content')
+    if ai_content:
+        print("\n✅ AI CONTENT GENERATED SUCCESSFULLY!")
+        print_seo_preview(submission)
+    else:
+        print("\n❌ No AI content was generated")
+
+    seo_data = {field: submission[field] for field in SEO_FIELDS if submission.get(field)}
+    if seo_data:
+        print(f"\n✅ SEO FIELDS POPULATED:")
+        for field, value in seo_data.items():
+            if isinstance(value, list):
+                print(f"- {field}: {', '.join(map(str, value[:3]))}...")
+            else:
+                print(f"- {field}: {str(value)[:100]}...")
+    else:
+        print("\n❌ No SEO fields were populated")
+
+    output_file = f"{output_prefix}_{submission_id}.json"
+    save_json(output_file, {
+        'submission_id': submission_id,
+        'compliance_id': compliance_id,
+        'ai_content_generated': bool(ai_content),
+        'seo_fields_populated': bool(seo_data),
+        'seo_data': seo_data,
+        'ai_fields': {field: submission.get(field) for field in AI_FIELDS},
+        'full_submission': submission
+    })
+    print(f"\n📄 Full results saved to: {output_file}")
+
+    print(f"\n{'='*50}")
+    print("SUMMARY:")
+    print(f"- Submission created: ✅")
+    print(f"- AI content generated: {'✅' if ai_content else '❌'}")
+    print(f"- SEO fields populated: {'✅' if seo_data else '❌'}")
+    print(f"{'='*50}")
+    return 0
+
+
+def _parse(prog, description, argv, wait):
+    parser = argparse.ArgumentParser(prog=prog, description=description)
+    parser.add_argument("--wait", type=int, default=wait,
+                        help="Seconds to wait for AI processing")
+    return parser.parse_args(argv)
+
+
+def final_test_submission(argv):
+    args = _parse("seo_tools final-test",
+                  "Create submission and trigger webhook via trigger_n8n_webhook()", argv, 30)
+    from ..config import get_supabase
+    supabase = get_supabase()
+
+    data = build_submission("final")
+    print(f"Creating submission with compliance ID: {data['compliance_id']}")
+    try:
+        submission_id = insert_submission(supabase, data)
+        if not submission_id:
+            print("❌ Failed to create submission")
+            return 1
+        print(f"✅ Submission created: {submission_id}")
+
+        print("\nAttempting to trigger webhook via function...")
+        try:
+            supabase.rpc('trigger_n8n_webhook').execute()
+            print("✅ Webhook function called")
+        except Exception as e:
+            print(f"⚠️ Webhook function error: {e}")
+
+        wait_for_ai(supabase, submission_id, args.wait)
+        print("\n\nFinal submission check...")
+        return report(supabase, submission_id, data['compliance_id'], "final_test_results")
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+def direct_submission(argv):
+    args = _parse("seo_tools direct-submission",
+                  "Create via create_submission() and POST the n8n webhook", argv, 30)
+    from ..config import get_supabase
+    supabase = get_supabase()
+
+    data = build_submission("direct")
+    print(f"Creating test submission with compliance ID: {data['compliance_id']}")
+    try:
+        submission_id = create_via_rpc(supabase, data, PRODUCTS["direct"]["stage"])
+        print(f"✅ Submission created via function: {submission_id}")
+    except Exception as e:
+        print(f"Function call failed: {e}")
+        print("Falling back to direct insert...")
+        submission_id = insert_submission(supabase, data)
+        if not submission_id:
+            print("❌ Failed to create submission")
+            return 1
+        print(f"✅ Submission created via insert: {submission_id}")
+
+    print("\nTriggering webhook...")
+    post_webhook({
+        "submission_id": submission_id,
+        "compliance_id": data['compliance_id'],
+        "trigger_type": "manual_test",
+        "timestamp": datetime.now(timezone.utc).isoformat()
+    })
+
+    wait_for_ai(supabase, submission_id, args.wait)
+    print("\nChecking results...")
+    return report(supabase, submission_id, data['compliance_id'], "test_result")
+
+
+def webhook_submission(argv):
+    args = _parse("seo_tools webhook-submission",
+                  "Insert a submission and POST its fields to the n8n webhook", argv, 20)
+    from ..config import get_supabase, supabase_url
+    supabase = get_supabase()
+
+    data = build_submission("webhook")
+    print("Creating test submission...")
+    print(f"Compliance ID: {data['compliance_id']}")
+    try:
+        submission_id = insert_submission(supabase, data)
+        if not submission_id:
+            print("❌ Failed to create submission")
+            return 1
+        print(f"\n✅ Submission created successfully!")
+        print(f"Submission ID: {submission_id}")
+
+        print("\nTriggering webhook manually...")
+        payload = {"submission_id": submission_id}
+        payload.update({key: data[key] for key in (
+            'compliance_id', 'product_name', 'generic_name', 'indication',
+            'therapeutic_area', 'submitter_email', 'submitter_name',
+            'seo_reviewer_name', 'seo_reviewer_email', 'workflow_stage',
+            'priority_level', 'created_at'
+        )})
+        post_webhook(payload)
+
+        try:
+            supabase.table('submissions').update({
+                "ai_processing_status": "processing"
+            }).eq('id', submission_id).execute()
+        except Exception as e:
+            print(f"Warning: Could not update submission status: {e}")
+
+        wait_for_ai(supabase, submission_id, args.wait)
+        print("\nChecking for AI-generated content...")
+        status = report(supabase, submission_id, data['compliance_id'], "test_results")
+        print(f"\n🔍 Submission ID: {submission_id}")
+        print(f"You can check the full submission at: {supabase_url()}/project/default/editor/submissions?filter=id.eq.{submission_id}")
+        return status
+    except Exception as e:
+        print(f"\n❌ Error: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return 1
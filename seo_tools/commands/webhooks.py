@@ -0,0 +1,66 @@
+"""
+Recent webhook executions, audit logs and AI processing updates
+"""
+import argparse
+
+
+def check_webhook_logs(argv):
+    parser = argparse.ArgumentParser(prog="seo_tools webhook-logs",
+                                     description="Check webhook execution logs")
+    parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    from ..config import get_supabase
+    supabase = get_supabase()
+
+    print("Checking recent webhook executions...\n")
+    try:
+        result = supabase.table('n8n_webhook_executions').select("*").order('created_at', desc=True).limit(args.limit).execute()
+        if result.data:
+            print(f"Found {len(result.data)} recent webhook executions:")
+            for log in result.data:
+                print(f"\n- Submission ID: {log.get('submission_id')}")
+                print(f"  Status: {log.get('status')}")
+                print(f"  Created: {log.get('created_at')}")
+                print(f"  Response: {log.get('response_data', 'No response data')}")
+                print(f"  Error: {log.get('error_message', 'No error')}")
+        else:
+            print("No webhook executions found in n8n_webhook_executions table")
+    except Exception as e:
+        print(f"Error accessing n8n_webhook_executions: {e}")
+
+    print("\n\nChecking audit logs...")
+    try:
+        result = supabase.table('audit_logs').select("*").order('created_at', desc=True).limit(args.limit).execute()
+        if result.data:
+            print(f"\nFound {len(result.data)} recent audit logs:")
+            for log in result.data[:5]:
+                print(f"\n- Action: {log.get('action')}")
+                print(f"  Entity: {log.get('entity_type') or log.get('table_name')} - "
+                      f"{log.get('entity_id') or log.get('record_id')}")
+                print(f"  User: {log.get('user_email')}")
+                print(f"  Created: {log.get('created_at')}")
+            print("\nUse `python -m seo_tools audit tail` to follow new audit rows.")
+        else:
+            print("No audit logs found")
+    except Exception as e:
+        print(f"Error accessing audit_logs: {e}")
+
+    print("\n\nChecking submissions with AI processing...")
+    try:
+        result = supabase.table('submissions').select(
+            "id, compliance_id, workflow_stage, ai_processing_status, ai_error, created_at"
+        ).neq('ai_processing_status', 'pending').order('created_at', desc=True).limit(5).execute()
+        if result.data:
+            print(f"\nFound {len(result.data)} submissions with AI processing updates:")
+            for sub in result.data:
+                print(f"\n- ID: {sub.get('id')}")
+                print(f"  Compliance ID: {sub.get('compliance_id')}")
+                print(f"  Workflow Stage: {sub.get('workflow_stage')}")
+                print(f"  AI Status: {sub.get('ai_processing_status')}")
+                print(f"  AI Error: {sub.get('ai_error', 'None')}")
+        else:
+            print("No submissions found with AI processing updates")
+    except Exception as e:
+        print(f"Error checking submissions: {e}")
+    return 0
@@ -0,0 +1,60 @@
+"""
+Shared configuration and Supabase client setup for the Python tooling
+
+Everything here is loaded on first use and cached for the life of the
+process, so commands that never talk to Supabase never pay for it.
+"""
+import os
+
+_env_loaded = False
+_client = None
+
+
+class ConfigError(RuntimeError):
+    """Required configuration (e.g. Supabase credentials) is missing."""
+
+
+SUPABASE_URL_VARS = ("VITE_SUPABASE_URL", "SUPABASE_URL", "NEXT_PUBLIC_SUPABASE_URL")
+SUPABASE_KEY_VARS = ("VITE_SUPABASE_ANON_KEY", "SUPABASE_SERVICE_KEY", "SUPABASE_ANON_KEY")
+
+
+def load_env():
+    """Load .env once per process, tolerating a missing python-dotenv."""
+    global _env_loaded
+    if _env_loaded:
+        return
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        pass
+    else:
+        load_dotenv()
+    _env_loaded = True
+
+
+def get_env(*names, default=None):
+    """Return the first of `names` that is set in the environment."""
+    load_env()
+    for name in names:
+        value = os.environ.get(name)
+        if value:
+            return value
+    return default
+
+
+def supabase_url():
+    return get_env(*SUPABASE_URL_VARS)
+
+
+def get_supabase():
+    """Return a process-wide Supabase client built from the environment."""
+    global _client
+    if _client is None:
+        url = supabase_url()
+        key = get_env(*SUPABASE_KEY_VARS)
+        if not url or not key:
+            raise ConfigError("Missing Supabase credentials")
+
+        from supabase import create_client
+        _client = create_client(url, key)
+    return _client
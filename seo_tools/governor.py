@@ -0,0 +1,379 @@
+"""
+Adaptive concurrency governor for outbound AI and FDA API calls
+
+One limiter per provider (perplexity, anthropic, openfda, ...) decides how
+many calls may be in flight. The limit follows AIMD: every call that
+finishes at close to the best latency seen adds 1/limit (about +1 per round
+trip of the whole window); a 429/503, a timeout or a latency spike
+multiplies it by BACKOFF, at most once per round trip so a burst of
+failures from one overload counts once. Retry-After pauses new calls to that
+provider until it has passed.
+
+    governor = get_governor()
+    async with governor.slot("perplexity"):
+        response = await call_perplexity(...)
+        if response.status == 429:
+            raise Throttled(retry_after_seconds(response.headers))
+
+`seo_tools governor simulate` runs the governor against FakeProvider, a
+local stand-in with a fixed capacity, a token-bucket rate limit and optional
+injected throttling windows.
+
+asyncio is imported where it is used, so `seo_tools governor --help` stays
+within the CLI's import-time budget.
+"""
+import argparse
+import random
+import time
+from contextlib import asynccontextmanager
+from email.utils import parsedate_to_datetime
+
+BACKOFF = 0.7
+LATENCY_TOLERANCE = 2.0
+EWMA_ALPHA = 0.2
+# Seconds over which the best-latency baseline relaxes toward current latency
+BASELINE_DRIFT = 60.0
+DEFAULT_RETRY_AFTER = 1.0
+
+# provider -> (initial limit, min limit, max limit)
+PROVIDERS = {
+    "perplexity": (4, 1, 32),
+    "anthropic": (4, 1, 32),
+    "openfda": (4, 1, 16),
+}
+DEFAULT_LIMITS = (4, 1, 16)
+
+
+class Throttled(Exception):
+    """The provider rejected a call for rate reasons (429/503)."""
+
+    def __init__(self, retry_after=None, message="throttled"):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def retry_after_seconds(headers, default=None):
+    """Parse a Retry-After header (delta seconds or HTTP date)."""
+    value = (headers or {}).get("Retry-After") or (headers or {}).get("retry-after")
+    if not value:
+        return default
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return default
+
+
+class ProviderLimiter:
+    def __init__(self, name, initial=4, min_limit=1, max_limit=16):
+        self.name = name
+        self.limit = float(initial)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.in_flight = 0
+        self.waiting = 0
+        self.latency = None
+        self.best_latency = None
+        self.blocked_until = 0.0
+        self.last_decrease = 0.0
+        self.last_success = None
+        self.completed = 0
+        self.throttled = 0
+        self.errors = 0
+        self._cond = None
+        self._loop = None
+
+    def _condition(self):
+        # One condition per event loop, so a governor outlives asyncio.run()
+        import asyncio
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._cond = asyncio.Condition()
+            self._loop = loop
+        return self._cond
+
+    def _can_start(self):
+        return self.in_flight < int(self.limit) and time.monotonic() >= self.blocked_until
+
+    async def acquire(self):
+        import asyncio
+        cond = self._condition()
+        async with cond:
+            self.waiting += 1
+            try:
+                while not self._can_start():
+                    pause = self.blocked_until - time.monotonic()
+                    if pause > 0:
+                        # Wake when the Retry-After window closes
+                        try:
+                            await asyncio.wait_for(cond.wait(), pause)
+                        except asyncio.TimeoutError:
+                            pass
+                    else:
+                        await cond.wait()
+            finally:
+                self.waiting -= 1
+            self.in_flight += 1
+
+    async def release(self):
+        cond = self._condition()
+        async with cond:
+            self.in_flight -= 1
+            cond.notify_all()
+
+    def _decrease(self, now):
+        window = self.latency or 1.0
+        if now - self.last_decrease >= window:
+            self.limit = max(self.min_limit, self.limit * BACKOFF)
+            self.last_decrease = now
+
+    def on_success(self, elapsed):
+        now = time.monotonic()
+        self.completed += 1
+        self.latency = elapsed if self.latency is None else (
+            EWMA_ALPHA * elapsed + (1 - EWMA_ALPHA) * self.latency)
+        if self.best_latency is None or elapsed < self.best_latency:
+            self.best_latency = elapsed
+        else:
+            # Let the baseline drift up slowly so a permanently slower
+            # provider is not treated as congested forever
+            dt = now - (self.last_success or now)
+            self.best_latency += (elapsed - self.best_latency) * min(dt / BASELINE_DRIFT, 1.0)
+        self.last_success = now
+
+        if self.latency > self.best_latency * LATENCY_TOLERANCE:
+            self._decrease(now)
+        elif self.limit < self.max_limit:
+            self.limit = min(self.max_limit, self.limit + 1.0 / self.limit)
+
+    def on_throttle(self, retry_after):
+        now = time.monotonic()
+        self.throttled += 1
+        self.blocked_until = max(self.blocked_until,
+                                 now + (DEFAULT_RETRY_AFTER if retry_after is None else retry_after))
+        self._decrease(now)
+
+    def on_error(self, congestion):
+        self.errors += 1
+        if congestion:
+            self._decrease(time.monotonic())
+
+    def metrics(self):
+        return {
+            "limit": round(self.limit, 2),
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "latency_ms": None if self.latency is None else round(self.latency * 1000, 1),
+            "best_latency_ms": None if self.best_latency is None else round(self.best_latency * 1000, 1),
+            "blocked_for_s": round(max(self.blocked_until - time.monotonic(), 0.0), 2),
+            "completed": self.completed,
+            "throttled": self.throttled,
+            "errors": self.errors,
+        }
+
+
+class Governor:
+    """Per-provider limiters for one process (see get_governor())."""
+
+    def __init__(self, providers=None):
+        self.config = dict(PROVIDERS if providers is None else providers)
+        self.limiters = {}
+
+    def limiter(self, provider):
+        if provider not in self.limiters:
+            initial, low, high = self.config.get(provider, DEFAULT_LIMITS)
+            self.limiters[provider] = ProviderLimiter(provider, initial, low, high)
+        return self.limiters[provider]
+
+    @asynccontextmanager
+    async def slot(self, provider):
+        """Hold one in-flight slot for `provider` for the body of the block.
+
+        Raise Throttled inside the block on 429/503; timeouts and
+        connection errors also count as congestion.
+        """
+        import asyncio
+        limiter = self.limiter(provider)
+        await limiter.acquire()
+        started = time.monotonic()
+        try:
+            yield limiter
+        except Throttled as e:
+            limiter.on_throttle(e.retry_after)
+            raise
+        except (asyncio.TimeoutError, TimeoutError, ConnectionError):
+            limiter.on_error(congestion=True)
+            raise
+        except Exception:
+            limiter.on_error(congestion=False)
+            raise
+        else:
+            limiter.on_success(time.monotonic() - started)
+        finally:
+            await limiter.release()
+
+    def metrics(self):
+        return {name: limiter.metrics() for name, limiter in self.limiters.items()}
+
+
+_governor = None
+
+
+def get_governor():
+    """Process-wide governor shared by every batch tool in this process."""
+    global _governor
+    if _governor is None:
+        _governor = Governor()
+    return _governor
+
+
+class FakeProvider:
+    """Local stand-in for a rate-limited API.
+
+    Up to `capacity` concurrent calls take `base_latency`; beyond that,
+    latency grows with the overload. A token bucket of `rate` calls/second
+    rejects the excess with Throttled(retry_after), and during any
+    (start, end) window in `throttle_windows` (seconds since creation)
+    every call is rejected.
+    """
+
+    def __init__(self, capacity=8, base_latency=0.05, rate=100.0, burst=None,
+                 throttle_windows=(), retry_after=0.5, error_rate=0.0, seed=None):
+        self.capacity = capacity
+        self.base_latency = base_latency
+        self.rate = rate
+        self.tokens = burst or rate
+        self.burst = burst or rate
+        self.throttle_windows = tuple(throttle_windows)
+        self.retry_after = retry_after
+        self.error_rate = error_rate
+        self.rng = random.Random(seed)
+        self.started = time.monotonic()
+        self.refilled = self.started
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    def _take_token(self):
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.refilled) * self.rate)
+        self.refilled = now
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+    async def call(self):
+        import asyncio
+        t = time.monotonic() - self.started
+        if any(start <= t < end for start, end in self.throttle_windows):
+            raise Throttled(self.retry_after, "injected throttle window")
+        if not self._take_token():
+            raise Throttled(self.retry_after, "rate limit exceeded")
+
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            overload = max(0, self.in_flight - self.capacity) / self.capacity
+            await asyncio.sleep(self.base_latency * (1 + 3 * overload)
+                                * self.rng.uniform(0.9, 1.1))
+            if self.rng.random() < self.error_rate:
+                raise RuntimeError("injected provider error")
+            return "ok"
+        finally:
+            self.in_flight -= 1
+
+
+async def simulate(requests=500, workers=64, report_every=1.0, **provider_options):
+    """Push `requests` calls from `workers` tasks through the governor."""
+    import asyncio
+    governor = Governor({"fake": (2, 1, 64)})
+    provider = FakeProvider(**provider_options)
+    queue = asyncio.Queue()
+    for i in range(requests):
+        queue.put_nowait(i)
+    outcome = {"ok": 0, "throttled": 0, "failed": 0}
+
+    async def worker():
+        while True:
+            try:
+                queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            # Retry throttled calls like a batch tool would
+            while True:
+                try:
+                    async with governor.slot("fake"):
+                        await provider.call()
+                    outcome["ok"] += 1
+                    break
+                except Throttled:
+                    outcome["throttled"] += 1
+                except RuntimeError:
+                    outcome["failed"] += 1
+                    break
+
+    async def reporter():
+        while True:
+            await asyncio.sleep(report_every)
+            m = governor.metrics()["fake"]
+            print(f"{time.monotonic() - provider.started:6.1f}s  limit {m['limit']:5.1f}  "
+                  f"in-flight {m['in_flight']:3}  waiting {m['waiting']:3}  "
+                  f"latency {m['latency_ms'] or 0:6.1f} ms  blocked {m['blocked_for_s']:.2f}s  "
+                  f"done {m['completed']}")
+
+    started = time.monotonic()
+    report = asyncio.create_task(reporter())
+    await asyncio.gather(*(worker() for _ in range(workers)))
+    report.cancel()
+    elapsed = time.monotonic() - started
+    return {
+        **outcome,
+        "elapsed_s": round(elapsed, 2),
+        "throughput_rps": round(outcome["ok"] / elapsed, 1),
+        "peak_in_flight": provider.peak_in_flight,
+        "metrics": governor.metrics()["fake"],
+    }
+
+
+def _window(text):
+    start, _, end = text.partition("-")
+    return float(start), float(end)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="seo_tools governor",
+                                     description="Adaptive concurrency governor")
+    sub = parser.add_subparsers(dest="action", required=True)
+    sim = sub.add_parser("simulate", help="Run the governor against a local fake provider")
+    sim.add_argument("--requests", type=int, default=500)
+    sim.add_argument("--workers", type=int, default=64,
+                     help="Concurrent callers competing for slots")
+    sim.add_argument("--capacity", type=int, default=8,
+                     help="Concurrent calls the fake serves at base latency")
+    sim.add_argument("--latency-ms", type=float, default=50.0)
+    sim.add_argument("--rate", type=float, default=100.0, help="Token-bucket calls/second")
+    sim.add_argument("--throttle", type=_window, action="append", default=[],
+                     metavar="START-END", help="Reject every call in this window (seconds)")
+    sim.add_argument("--retry-after", type=float, default=0.5)
+    sim.add_argument("--error-rate", type=float, default=0.0)
+    sim.add_argument("--seed", type=int)
+    args = parser.parse_args(argv)
+
+    import asyncio
+    result = asyncio.run(simulate(
+        requests=args.requests, workers=args.workers, capacity=args.capacity,
+        base_latency=args.latency_ms / 1000, rate=args.rate,
+        throttle_windows=args.throttle, retry_after=args.retry_after,
+        error_rate=args.error_rate, seed=args.seed,
+    ))
+    print(f"\n📊 {result['ok']} ok, {result['throttled']} throttled, {result['failed']} failed "
+          f"in {result['elapsed_s']}s ({result['throughput_rps']} req/s); "
+          f"peak in-flight {result['peak_in_flight']}, final limit {result['metrics']['limit']}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
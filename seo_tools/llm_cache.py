@@ -0,0 +1,230 @@
+"""
+Content-addressed cache for Perplexity / Claude responses
+
+Same on-disk layout and key as netlify/functions/lib/llm-cache.js, so
+reprocessing runs from Python and the Netlify functions (e.g. under
+`netlify dev`) share entries on the same host:
+
+    <dir>/<key[:2]>/<key>.json    key = sha256(model, template, temperature, prompt)
+
+A hit refreshes the entry's mtime; past the size bound the least recently
+used entries are deleted. Writes keep a running size rather than listing
+the directory: a full scan happens only when that size crosses the bound or
+the last scan (recorded in <dir>/size.json by either side) is older than
+SCAN_INTERVAL. Modes: "use" reads and writes, "refresh" skips the
+read but stores the new response, "bypass" neither reads nor writes.
+"""
+import argparse
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+from datetime import datetime, timezone
+
+MODES = ("use", "refresh", "bypass")
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024
+SIZE_FILE = "size.json"
+SCAN_INTERVAL = 60.0
+_WHITESPACE = re.compile(r"[ \t\n\r\f\v]+")
+
+
+def default_dir():
+    from .config import get_env
+    return get_env("LLM_CACHE_DIR",
+                   default=os.path.join(tempfile.gettempdir(), "3cubed-llm-cache"))
+
+
+def normalize_prompt(messages):
+    text = "\n".join(f"{m['role']}: {m['content']}" for m in messages)
+    return _WHITESPACE.sub(" ", text).strip(" ")
+
+
+def _temperature(value):
+    return "default" if value is None else f"{float(value):.3f}"
+
+
+def cache_key(model, messages, temperature=None, template=""):
+    raw = "\n".join([model, template, _temperature(temperature), normalize_prompt(messages)])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class LLMCache:
+    def __init__(self, directory=None, max_bytes=None):
+        from .config import get_env
+
+        self.directory = directory or default_dir()
+        self.max_bytes = max_bytes or int(get_env("LLM_CACHE_MAX_BYTES",
+                                                  default=DEFAULT_MAX_BYTES))
+        self.hits = 0
+        self.misses = 0
+        self._size = None  # (bytes, scanned_at) as of the last scan plus our writes
+
+    def path(self, key):
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    def get(self, key):
+        path = self.path(key)
+        try:
+            with open(path) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry
+
+    def put(self, key, entry):
+        path = self.path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.{int(time.time() * 1000)}.tmp"
+        data = json.dumps(entry)
+        with open(tmp, "w") as f:
+            f.write(data)
+        os.replace(tmp, path)
+        self._after_write(len(data.encode("utf-8")))
+
+    def _after_write(self, written):
+        """Count `written` bytes; scan only past the bound or when the size is stale."""
+        if self._size is None:
+            self._size = self._read_size_file()
+        if (self._size is None or time.time() - self._size[1] > SCAN_INTERVAL
+                or self._size[0] + written > self.max_bytes):
+            self.evict()
+        else:
+            self._size = (self._size[0] + written, self._size[1])
+
+    def _read_size_file(self):
+        try:
+            with open(os.path.join(self.directory, SIZE_FILE)) as f:
+                state = json.load(f)
+            return float(state["bytes"]), float(state["scanned_at"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _record_size(self, total):
+        self._size = (total, time.time())
+        path = os.path.join(self.directory, SIZE_FILE)
+        tmp = f"{path}.{os.getpid()}.{int(time.time() * 1000)}.tmp"
+        try:
+            with open(tmp, "w") as f:
+                json.dump({"bytes": total, "scanned_at": self._size[1]}, f)
+            os.replace(tmp, path)
+        except OSError:
+            pass
+
+    def entries(self):
+        """(path, size, mtime) for every stored entry."""
+        found = []
+        if not os.path.isdir(self.directory):
+            return found
+        for shard in os.scandir(self.directory):
+            if not shard.is_dir():
+                continue
+            for item in os.scandir(shard.path):
+                if not item.name.endswith(".json"):
+                    continue
+                try:
+                    stat = item.stat()
+                except OSError:
+                    continue
+                found.append((item.path, stat.st_size, stat.st_mtime))
+        return found
+
+    def evict(self, max_bytes=None):
+        """Delete least recently used entries until under 90% of the bound."""
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        if total > max_bytes:
+            for path, size, _ in sorted(entries, key=lambda e: e[2]):
+                if total <= max_bytes * 0.9:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+                total -= size
+                removed += 1
+        if os.path.isdir(self.directory):
+            self._record_size(total)
+        return removed
+
+    def completion(self, model, messages, call, parse=None, temperature=None,
+                   template="", mode="use"):
+        """Return parse(text) for the request, calling `call()` on a miss.
+
+        Only responses that parse are stored, so a malformed answer is
+        retried rather than replayed.
+        """
+        parse = parse or (lambda text: text)
+        mode = mode if mode in MODES else "use"
+        key = cache_key(model, messages, temperature, template)
+
+        if mode == "use":
+            entry = self.get(key)
+            if entry is not None:
+                try:
+                    result = parse(entry["response"])
+                except (KeyError, ValueError, TypeError):
+                    pass
+                else:
+                    self.hits += 1
+                    return result
+
+        self.misses += 1
+        text = call()
+        result = parse(text)
+        if mode != "bypass":
+            try:
+                self.put(key, {
+                    "key": key,
+                    "model": model,
+                    "template": template,
+                    "temperature": temperature,
+                    "created_at": datetime.now(timezone.utc).isoformat(),
+                    "response": text,
+                })
+            except OSError as e:
+                print(f"⚠️ LLM cache write failed: {e}")
+        return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="seo_tools llm-cache",
+                                     description="Inspect or trim the shared LLM response cache")
+    parser.add_argument("action", choices=("stats", "prune", "clear"))
+    parser.add_argument("--dir", help="Cache directory (default: $LLM_CACHE_DIR)")
+    parser.add_argument("--max-mb", type=float, help="Size bound for prune")
+    args = parser.parse_args(argv)
+
+    max_bytes = int(args.max_mb * 1024 * 1024) if args.max_mb else None
+    cache = LLMCache(args.dir, max_bytes)
+    entries = cache.entries()
+
+    if args.action == "stats":
+        total = sum(size for _, size, _ in entries)
+        print(f"📊 {cache.directory}: {len(entries)} entries, "
+              f"{total / 1024 / 1024:.1f} MB of {cache.max_bytes / 1024 / 1024:.0f} MB")
+        if entries:
+            newest = max(mtime for _, _, mtime in entries)
+            oldest = min(mtime for _, _, mtime in entries)
+            print(f"  last used: {datetime.fromtimestamp(newest).isoformat(timespec='seconds')}")
+            print(f"  LRU entry: {datetime.fromtimestamp(oldest).isoformat(timespec='seconds')}")
+    elif args.action == "prune":
+        print(f"✅ Removed {cache.evict()} entries")
+    else:
+        for path, _, _ in entries:
+            os.remove(path)
+        if os.path.isdir(cache.directory):
+            cache._record_size(0)
+        print(f"✅ Removed {len(entries)} entries")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
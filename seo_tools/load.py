@@ -0,0 +1,428 @@
+"""
+Open-loop synthetic load generator for the submission pipeline
+
+Submissions are synthesized from test-data/pharmaceutical-test-data.json and
+the Omnitrope fixtures, varying therapeutic_area, priority_level and the size
+of raw_input_content. Arrival times are drawn up front from the chosen
+profile (constant, ramp or burst) and each request is fired at its scheduled
+time whether or not earlier ones have finished, so a slow pipeline shows up
+as growing queueing delay and latency instead of a quietly lower send rate.
+
+Latency is measured from the *scheduled* time, not the send time, so time
+spent waiting for a free sender is charged to the pipeline.
+
+Targets:
+    local  in-process stand-in with a fixed number of workers and a service
+           time that grows with content size (no network, no credentials)
+    stack  insert into Supabase, then POST the row to the process-submission
+           Netlify function and wait for it to finish
+
+Stack runs write real rows (compliance_id LOAD-<run_id>-NNNNNN) that feed the
+dashboard, rollups, backups and review queue. --cleanup deletes them when the
+run ends (also on Ctrl+C); --clear RUN_ID purges an earlier or partial run.
+"""
+import argparse
+import json
+import math
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURE_FILES = (
+    "test-data/pharmaceutical-test-data.json",
+    "omnitrope-seo-data.json",
+    "omnitrope-fda-enhanced-content.json",
+)
+PROCESS_URL = "https://3cubedai-seo.netlify.app/.netlify/functions/process-submission"
+
+THERAPEUTIC_AREAS = (
+    "Oncology", "Endocrinology", "Neurology", "Cardiology", "Immunology",
+    "Rheumatology", "Infectious Disease", "Hematology", "Dermatology",
+)
+PRIORITY_LEVELS = ("low", "medium", "high")
+# content size name -> (approximate bytes of raw_input_content, weight)
+CONTENT_SIZES = {"small": (1_000, 5), "medium": (4_000, 3), "large": (16_000, 1)}
+
+CLINICAL_LINES = (
+    "Phase 3 trial met its primary endpoint with a statistically significant improvement.",
+    "Median progression-free survival improved versus standard of care (HR 0.72).",
+    "Overall response rate was higher in the treatment arm across prespecified subgroups.",
+    "Most common adverse events were fatigue, nausea and injection-site reactions.",
+    "Grade 3-4 adverse events were manageable with dose modifications.",
+    "Target audience: specialists, primary care physicians and patient advocates.",
+    "Key message: first-in-class option with a convenient dosing schedule.",
+)
+
+DEFAULT_WINDOW = 10
+DEFAULT_MAX_IN_FLIGHT = 256
+
+
+def load_fixtures(root=REPO_ROOT):
+    """Return the base product records found in the fixture files."""
+    fixtures = []
+    for name in FIXTURE_FILES:
+        path = os.path.join(root, name)
+        if not os.path.exists(path):
+            continue
+        with open(path) as f:
+            data = json.load(f)
+        if "test_submissions" in data:
+            fixtures.extend(data["test_submissions"])
+        elif "submission" in data:
+            fixtures.append(data["submission"])
+        else:
+            fixtures.append(data)
+
+    base = []
+    for record in fixtures:
+        base.append({
+            "product_name": record.get("product_name"),
+            "generic_name": record.get("generic_name"),
+            "indication": record.get("indication") or record.get("medical_indication"),
+            "therapeutic_area": record.get("therapeutic_area"),
+            "sponsor": record.get("sponsor"),
+            "line_of_therapy": record.get("line_of_therapy"),
+            "submitter_name": record.get("submitter_name") or "Load Test",
+            "submitter_email": record.get("submitter_email") or "load.test@3cubed.com",
+        })
+    return base
+
+
+def _content(rng, record, size):
+    head = (
+        f"Product: {record['product_name']} ({record['generic_name']})\n"
+        f"Indication: {record['indication']}\n"
+        f"Sponsor: {record.get('sponsor') or 'N/A'}\n"
+        f"Line of therapy: {record.get('line_of_therapy') or 'N/A'}\n\n"
+    )
+    lines = [head]
+    length = len(head)
+    while length < size:
+        line = rng.choice(CLINICAL_LINES) + "\n"
+        lines.append(line)
+        length += len(line)
+    return "".join(lines)
+
+
+class SubmissionFactory:
+    """Deterministic (per seed) stream of varied synthetic submissions."""
+
+    def __init__(self, fixtures, seed=None, run_id=None):
+        if not fixtures:
+            raise ValueError("No fixtures found to synthesize submissions from")
+        self.fixtures = fixtures
+        self.rng = random.Random(seed)
+        self.run_id = run_id or time.strftime("%Y%m%d%H%M%S")
+        self.sizes = list(CONTENT_SIZES)
+        self.size_weights = [weight for _, weight in CONTENT_SIZES.values()]
+
+    def make(self, seq):
+        rng = self.rng
+        record = rng.choice(self.fixtures)
+        size = rng.choices(self.sizes, self.size_weights)[0]
+        # Mostly keep the fixture's own area so content stays plausible
+        area = record["therapeutic_area"] if rng.random() < 0.6 else rng.choice(THERAPEUTIC_AREAS)
+        submission = {
+            **record,
+            "therapeutic_area": area,
+            "priority_level": rng.choice(PRIORITY_LEVELS),
+            "compliance_id": f"LOAD-{self.run_id}-{seq:06d}",
+            "workflow_stage": "draft",
+            "ai_processing_status": "pending",
+            "raw_input_content": _content(rng, record, CONTENT_SIZES[size][0]),
+        }
+        return size, submission
+
+
+def rate_function(profile, rate, peak=None, duration=60.0, burst_every=30.0, burst_length=5.0):
+    """Return rate(t) in requests/second for the named profile."""
+    peak = rate if peak is None else peak
+    if profile == "constant":
+        return lambda t: rate
+    if profile == "ramp":
+        return lambda t: rate + (peak - rate) * min(t / duration, 1.0)
+    if profile == "burst":
+        return lambda t: peak if (t % burst_every) < burst_length else rate
+    raise ValueError(f"Unknown profile: {profile}")
+
+
+def arrival_times(rate_fn, duration, rng, poisson=True):
+    """Offsets (seconds from start) of every request, fixed before sending.
+
+    Poisson arrivals use thinning against the profile's maximum rate, so the
+    schedule follows rate(t) exactly even as it changes.
+    """
+    samples = max(int(duration * 10), 1)
+    max_rate = max(rate_fn(duration * i / samples) for i in range(samples + 1))
+    if max_rate <= 0:
+        return []
+
+    times = []
+    t = 0.0
+    if poisson:
+        while True:
+            t += rng.expovariate(max_rate)
+            if t >= duration:
+                return times
+            if rng.random() * max_rate <= rate_fn(t):
+                times.append(t)
+    # Evenly spaced: place a request each time the integrated rate crosses 1
+    step = 1.0 / (max_rate * 20)
+    owed = 0.0
+    while t < duration:
+        owed += rate_fn(t) * step
+        if owed >= 1.0:
+            owed -= 1.0
+            times.append(t)
+        t += step
+    return times
+
+
+class LocalPipeline:
+    """Stand-in for the pipeline: `workers` servers, log-normal service time.
+
+    Service time is base_ms plus per_kb_ms for every KB of raw_input_content;
+    requests waiting longer than `timeout` for a worker fail like a function
+    timeout would.
+    """
+
+    def __init__(self, workers=4, base_ms=800.0, per_kb_ms=60.0, jitter=0.35,
+                 error_rate=0.01, timeout=26.0, seed=None):
+        self.slots = threading.Semaphore(workers)
+        self.base_ms = base_ms
+        self.per_kb_ms = per_kb_ms
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.timeout = timeout
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+
+    def __call__(self, submission):
+        queued = time.monotonic()
+        if not self.slots.acquire(timeout=self.timeout):
+            raise TimeoutError("no worker available before timeout")
+        try:
+            wait = time.monotonic() - queued
+            kb = len(submission["raw_input_content"]) / 1024
+            with self.lock:
+                noise = self.rng.lognormvariate(0, self.jitter)
+                failed = self.rng.random() < self.error_rate
+            time.sleep((self.base_ms + self.per_kb_ms * kb) * noise / 1000)
+            if failed:
+                raise RuntimeError("simulated processing failure")
+            return wait
+        finally:
+            self.slots.release()
+
+
+class StackPipeline:
+    """Real stack: insert into Supabase, then call process-submission."""
+
+    def __init__(self, process_url=PROCESS_URL, timeout=60.0):
+        from .config import get_supabase
+        import requests
+
+        self.client = get_supabase()
+        self.session = requests.Session()
+        self.process_url = process_url
+        self.timeout = timeout
+
+    def __call__(self, submission):
+        result = self.client.table("submissions").insert(submission).execute()
+        if not result.data:
+            raise RuntimeError("insert returned no row")
+        row = result.data[0]
+        response = self.session.post(
+            self.process_url,
+            json={**row, "medical_indication": row.get("indication")},
+            timeout=self.timeout,
+        )
+        if response.status_code >= 400:
+            raise RuntimeError(f"HTTP {response.status_code}")
+        # Server-side queueing is not observable from here
+        return None
+
+
+def clear_run(client, run_id):
+    """Delete the submissions a stack run inserted; returns how many."""
+    result = (
+        client.table("submissions")
+        .delete()
+        .like("compliance_id", f"LOAD-{run_id}-%")
+        .execute()
+    )
+    return len(result.data or [])
+
+
+def _percentile(values, pct):
+    if not values:
+        return None
+    ordered = sorted(values)
+    k = (len(ordered) - 1) * pct / 100
+    lo, hi = math.floor(k), math.ceil(k)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (k - lo)
+
+
+def run_load(pipeline, factory, schedule, max_in_flight=DEFAULT_MAX_IN_FLIGHT):
+    """Fire one request per scheduled offset; returns a result dict per request.
+
+    Each result records the scheduled offset, dispatch lag (sender fell
+    behind), queue delay (waiting inside the pipeline, when observable),
+    latency from the scheduled time to completion, and any error.
+    """
+    results = []
+    lock = threading.Lock()
+    start = time.monotonic()
+
+    def fire(seq, offset, size, submission):
+        sent = time.monotonic() - start
+        record = {"seq": seq, "scheduled": offset, "size": size,
+                  "therapeutic_area": submission["therapeutic_area"],
+                  "priority_level": submission["priority_level"],
+                  "dispatch_lag": sent - offset, "queue": None, "error": None}
+        try:
+            record["queue"] = pipeline(submission)
+        except Exception as e:
+            record["error"] = f"{type(e).__name__}: {e}"
+        record["latency"] = time.monotonic() - start - offset
+        with lock:
+            results.append(record)
+
+    with ThreadPoolExecutor(max_workers=max_in_flight) as pool:
+        for seq, offset in enumerate(schedule):
+            size, submission = factory.make(seq)
+            delay = start + offset - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            pool.submit(fire, seq, offset, size, submission)
+    return sorted(results, key=lambda r: r["seq"])
+
+
+def summarize(results, window=DEFAULT_WINDOW):
+    """Aggregate results into fixed windows of scheduled time."""
+    buckets = {}
+    for r in results:
+        buckets.setdefault(int(r["scheduled"] // window), []).append(r)
+
+    rows = []
+    for index in sorted(buckets):
+        group = buckets[index]
+        ok = [r["latency"] for r in group if not r["error"]]
+        queues = [r["queue"] for r in group if r["queue"] is not None]
+        errors = sum(1 for r in group if r["error"])
+        rows.append({
+            "t": index * window,
+            "offered_rps": len(group) / window,
+            "completed": len(ok),
+            "errors": errors,
+            "error_rate": errors / len(group),
+            "p50": _percentile(ok, 50),
+            "p95": _percentile(ok, 95),
+            "p99": _percentile(ok, 99),
+            "queue_p95": _percentile(queues, 95),
+            "lag_max": max(r["dispatch_lag"] for r in group),
+        })
+    return rows
+
+
+def _fmt(seconds):
+    return "     -" if seconds is None else f"{seconds * 1000:6.0f}"
+
+
+def print_summary(rows, results):
+    print(f"{'t(s)':>6} {'rps':>6} {'ok':>5} {'err%':>6} "
+          f"{'p50ms':>6} {'p95ms':>6} {'p99ms':>6} {'q95ms':>6} {'lagms':>6}")
+    for row in rows:
+        print(f"{row['t']:>6} {row['offered_rps']:6.1f} {row['completed']:>5} "
+              f"{row['error_rate'] * 100:6.1f} {_fmt(row['p50'])} {_fmt(row['p95'])} "
+              f"{_fmt(row['p99'])} {_fmt(row['queue_p95'])} {_fmt(row['lag_max'])}")
+
+    errors = [r for r in results if r["error"]]
+    ok = [r["latency"] for r in results if not r["error"]]
+    print(f"\n📊 {len(results)} requests, {len(errors)} errors "
+          f"({len(errors) / max(len(results), 1):.1%}), "
+          f"p95 latency {_fmt(_percentile(ok, 95)).strip()} ms")
+    if any(r["dispatch_lag"] > 0.1 for r in results):
+        print("⚠️ Sender fell behind schedule; raise --max-in-flight for a true open loop")
+    if errors:
+        print(f"❌ Most recent error: {errors[-1]['error']}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="seo_tools load",
+                                     description="Open-loop load test of the submission pipeline")
+    parser.add_argument("--target", choices=("local", "stack"), default="local")
+    parser.add_argument("--profile", choices=("constant", "ramp", "burst"), default="constant")
+    parser.add_argument("--rate", type=float, default=2.0,
+                        help="Requests/second (start rate for ramp, base rate for burst)")
+    parser.add_argument("--peak", type=float,
+                        help="End rate for ramp, burst rate for burst")
+    parser.add_argument("--duration", type=float, default=60.0, help="Seconds of arrivals")
+    parser.add_argument("--burst-every", type=float, default=30.0)
+    parser.add_argument("--burst-length", type=float, default=5.0)
+    parser.add_argument("--even", action="store_true",
+                        help="Evenly spaced arrivals instead of Poisson")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--window", type=float, default=DEFAULT_WINDOW,
+                        help="Seconds per reporting window")
+    parser.add_argument("--max-in-flight", type=int, default=DEFAULT_MAX_IN_FLIGHT)
+    parser.add_argument("--workers", type=int, default=4,
+                        help="Local stand-in: concurrent pipeline workers")
+    parser.add_argument("--service-ms", type=float, default=800.0,
+                        help="Local stand-in: base service time per request")
+    parser.add_argument("--error-rate", type=float, default=0.01,
+                        help="Local stand-in: injected failure probability")
+    parser.add_argument("--process-url", default=PROCESS_URL,
+                        help="Stack target: process-submission function URL")
+    parser.add_argument("--cleanup", action="store_true",
+                        help="Stack target: delete this run's submissions when done")
+    parser.add_argument("--clear", metavar="RUN_ID",
+                        help="Delete the submissions of an earlier stack run and exit")
+    parser.add_argument("--out", help="Write per-request results as JSON lines")
+    args = parser.parse_args(argv)
+
+    if args.clear:
+        from .config import get_supabase
+        print(f"✅ Deleted {clear_run(get_supabase(), args.clear)} submission(s) "
+              f"from load run {args.clear}")
+        return 0
+
+    if args.target == "stack":
+        pipeline = StackPipeline(args.process_url)
+    else:
+        pipeline = LocalPipeline(workers=args.workers, base_ms=args.service_ms,
+                                 error_rate=args.error_rate,
+                                 seed=args.seed)
+
+    rng = random.Random(args.seed)
+    rate_fn = rate_function(args.profile, args.rate, args.peak, args.duration,
+                            args.burst_every, args.burst_length)
+    schedule = arrival_times(rate_fn, args.duration, rng, poisson=not args.even)
+    factory = SubmissionFactory(load_fixtures(), seed=args.seed)
+
+    print(f"🚀 {len(schedule)} requests over {args.duration:.0f}s "
+          f"({args.profile}, target {args.target}, run {factory.run_id})\n")
+    try:
+        results = run_load(pipeline, factory, schedule, args.max_in_flight)
+    finally:
+        if args.target == "stack":
+            if args.cleanup:
+                deleted = clear_run(pipeline.client, factory.run_id)
+                print(f"✅ Deleted {deleted} submission(s) from load run {factory.run_id}")
+            else:
+                print(f"⚠️ Load rows left in submissions; remove them with "
+                      f"`seo_tools load --clear {factory.run_id}`")
+
+    if args.out:
+        with open(args.out, "w") as f:
+            for r in results:
+                f.write(json.dumps(r) + "\n")
+    print_summary(summarize(results, args.window), results)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,171 @@
+"""
+Client for the railway-api submissions endpoints
+
+Listing follows the X-Next-Cursor header lazily, one page per request, so a
+caller that stops early never downloads the rest. Every GET is conditional:
+responses are kept with their ETag in a small local cache (optionally saved
+to disk between runs) and revalidated with If-None-Match, so unchanged pages
+come back as an empty 304 instead of the full body.
+"""
+import argparse
+import json
+import os
+from collections import OrderedDict
+from itertools import islice
+from urllib.parse import urlencode
+
+DEFAULT_URL = "https://3cubed-seo-production.up.railway.app"
+API_URL_VARS = ("RAILWAY_API_URL", "VITE_API_BASE_URL")
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "seo_tools", "railway.json")
+DEFAULT_PAGE_SIZE = 100
+MAX_CACHE_ENTRIES = 500
+
+
+class ConditionalCache:
+    """LRU of url -> (etag, body, next cursor), optionally persisted as JSON."""
+
+    def __init__(self, path=None, max_entries=MAX_CACHE_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        if path and os.path.exists(path):
+            try:
+                with open(path) as f:
+                    self.entries.update(json.load(f))
+            except (OSError, ValueError):
+                self.entries.clear()
+
+    def get(self, url):
+        entry = self.entries.get(url)
+        if entry is not None:
+            self.entries.move_to_end(url)
+        return entry
+
+    def put(self, url, etag, body, next_cursor):
+        self.entries[url] = {"etag": etag, "body": body, "next": next_cursor}
+        self.entries.move_to_end(url)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def save(self):
+        if not self.path:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp = self.path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(self.entries, f)
+        os.replace(tmp, self.path)
+
+
+class RailwayClient:
+    def __init__(self, base_url=None, cache=None, timeout=30):
+        import requests
+        from .config import get_env
+
+        self.base_url = (base_url or get_env(*API_URL_VARS, default=DEFAULT_URL)).rstrip("/")
+        self.cache = cache if cache is not None else ConditionalCache()
+        self.session = requests.Session()
+        self.timeout = timeout
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.cache.save()
+        self.session.close()
+
+    def _get(self, path, params=None):
+        """Conditional GET; returns (body, next cursor) or (None, None) on 404."""
+        query = urlencode(sorted((k, v) for k, v in (params or {}).items() if v is not None))
+        url = f"{self.base_url}{path}" + (f"?{query}" if query else "")
+
+        cached = self.cache.get(url)
+        headers = {"If-None-Match": cached["etag"]} if cached and cached["etag"] else {}
+        response = self.session.get(url, headers=headers, timeout=self.timeout)
+
+        if response.status_code == 304 and cached:
+            self.cache.hits += 1
+            return cached["body"], cached["next"]
+        if response.status_code == 404:
+            return None, None
+        response.raise_for_status()
+
+        self.cache.misses += 1
+        body = response.json()
+        next_cursor = response.headers.get("X-Next-Cursor")
+        self.cache.put(url, response.headers.get("ETag"), body, next_cursor)
+        return body, next_cursor
+
+    def iter_submissions(self, stage=None, status=None, area=None, fields=None,
+                         page_size=DEFAULT_PAGE_SIZE):
+        """Yield submissions newest first, fetching the next page on demand.
+
+        Filters and fields take a string or a list (any of the values).
+        """
+        def joined(value):
+            return ",".join(value) if isinstance(value, (list, tuple)) else value
+
+        params = {"stage": joined(stage), "status": joined(status), "area": joined(area),
+                  "fields": joined(fields), "limit": page_size}
+        cursor = None
+        while True:
+            rows, cursor = self._get("/api/submissions", {**params, "cursor": cursor})
+            yield from rows or []
+            if not cursor:
+                return
+
+    def get_submission(self, submission_id, fields=None):
+        if isinstance(fields, (list, tuple)):
+            fields = ",".join(fields)
+        body, _ = self._get(f"/api/submissions/{submission_id}", {"fields": fields})
+        return body
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="seo_tools api-submissions",
+                                     description="List submissions through the Railway API")
+    parser.add_argument("submission_id", nargs="?", help="Fetch a single submission")
+    parser.add_argument("--stage", help="workflow_stage (comma-separated for any of)")
+    parser.add_argument("--status", help="ai_processing_status")
+    parser.add_argument("--area", help="therapeutic_area")
+    parser.add_argument("--fields", help="Comma-separated columns to return")
+    parser.add_argument("--limit", type=int, help="Stop after this many rows")
+    parser.add_argument("--page-size", type=int, default=DEFAULT_PAGE_SIZE)
+    parser.add_argument("--url", help="API base URL (default: $RAILWAY_API_URL)")
+    parser.add_argument("--cache", default=DEFAULT_CACHE_PATH,
+                        help="Conditional-request cache file")
+    parser.add_argument("--no-cache", action="store_true", help="Do not read or save the cache")
+    parser.add_argument("--json", action="store_true", help="Print rows as JSON")
+    args = parser.parse_args(argv)
+
+    cache = ConditionalCache(None if args.no_cache else args.cache)
+    with RailwayClient(args.url, cache) as client:
+        if args.submission_id:
+            row = client.get_submission(args.submission_id, args.fields)
+            if row is None:
+                print(f"❌ Submission {args.submission_id} not found")
+                return 1
+            rows = [row]
+        else:
+            rows = list(islice(client.iter_submissions(
+                args.stage, args.status, args.area, args.fields, args.page_size
+            ), args.limit))
+
+    if args.json:
+        print(json.dumps(rows, indent=2, default=str))
+        return 0
+    for row in rows:
+        print(f"{row.get('id')}  {row.get('workflow_stage') or '-':<18} "
+              f"{row.get('product_name') or ''}")
+    print(f"\n📊 {len(rows)} row(s); {cache.hits} page(s) revalidated from cache, "
+          f"{cache.misses} downloaded")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,71 @@
+"""
+Incremental refresher for the analytics dashboard rollups
+
+Calls refresh_analytics_rollups() (supabase/07-analytics-rollups.sql) in
+batches until every submission changed since the last run has been folded in.
+Each batch only touches rows whose updated_at moved, so a refresh costs time
+proportional to the changes, not to the size of submissions.
+"""
+import argparse
+import time
+
+DEFAULT_BATCH_SIZE = 5000
+DEFAULT_INTERVAL = 60
+
+
+def refresh_rollups(client, batch_size=DEFAULT_BATCH_SIZE, max_batches=None):
+    """Apply pending changes to the rollups; returns totals for the run."""
+    totals = {"applied": 0, "deleted": 0, "batches": 0, "watermark": None}
+    while max_batches is None or totals["batches"] < max_batches:
+        result = client.rpc(
+            "refresh_analytics_rollups", {"batch_size": batch_size}
+        ).execute()
+        row = (result.data or [{}])[0]
+        totals["batches"] += 1
+        totals["applied"] += row.get("applied") or 0
+        totals["deleted"] += row.get("deleted") or 0
+        totals["watermark"] = row.get("watermark")
+        if (row.get("applied") or 0) < batch_size:
+            break
+    return totals
+
+
+def reset_rollups(client):
+    """Empty the rollups so the next refresh rebuilds them from submissions."""
+    client.rpc("reset_analytics_rollups", {}).execute()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="seo_tools rollups",
+                                     description="Refresh analytics rollups")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--rebuild", action="store_true",
+                        help="Reset the rollups and rebuild them from scratch")
+    parser.add_argument("--watch", action="store_true",
+                        help="Keep refreshing every --interval seconds")
+    parser.add_argument("--interval", type=float, default=DEFAULT_INTERVAL)
+    args = parser.parse_args(argv)
+
+    from .config import get_supabase
+    client = get_supabase()
+
+    if args.rebuild:
+        print("Resetting analytics rollups...")
+        reset_rollups(client)
+
+    while True:
+        started = time.monotonic()
+        totals = refresh_rollups(client, args.batch_size)
+        elapsed = time.monotonic() - started
+        print(
+            f"✅ Applied {totals['applied']} changed / {totals['deleted']} deleted "
+            f"submissions in {totals['batches']} batch(es), {elapsed:.2f}s "
+            f"(watermark {totals['watermark']})"
+        )
+        if not args.watch:
+            return 0
+        time.sleep(args.interval)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
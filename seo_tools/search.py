@@ -0,0 +1,295 @@
+"""
+Hybrid submission search with batched queries and an invalidating result cache
+
+Wraps the search_submissions_batch RPC (supabase/03-vector-embeddings-search.sql)
+so that many competitor / indication lookups cost a single round trip, and
+repeated lookups are served from a bounded LRU until one of the rows they
+returned changes.
+"""
+import hashlib
+import re
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+DEFAULT_MATCH_COUNT = 10
+DEFAULT_TEXT_WEIGHT = 0.5
+DEFAULT_VECTOR_WEIGHT = 0.5
+REFRESH_PAGE_SIZE = 1000
+REFRESH_LOOKBACK = timedelta(minutes=5)
+EPOCH = "1970-01-01T00:00:00+00:00"
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _parse_ts(value):
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def normalize_query(text):
+    """Collapse case and whitespace so equivalent queries share a cache entry."""
+    return _WHITESPACE.sub(" ", (text or "").strip().lower())
+
+
+@dataclass(frozen=True)
+class SearchQuery:
+    text: str
+    embedding: Optional[Tuple[float, ...]] = None
+    match_count: int = DEFAULT_MATCH_COUNT
+    text_weight: float = DEFAULT_TEXT_WEIGHT
+    vector_weight: float = DEFAULT_VECTOR_WEIGHT
+
+    def cache_key(self):
+        embedding_digest = None
+        if self.embedding is not None:
+            raw = ",".join(repr(float(x)) for x in self.embedding)
+            embedding_digest = hashlib.sha1(raw.encode()).hexdigest()
+        return (
+            normalize_query(self.text),
+            embedding_digest,
+            self.match_count,
+            round(self.text_weight, 6),
+            round(self.vector_weight, 6),
+        )
+
+    def to_rpc(self):
+        payload = {
+            "search_query": self.text,
+            "match_count": self.match_count,
+            "text_weight": self.text_weight,
+            "vector_weight": self.vector_weight,
+        }
+        if self.embedding is not None:
+            payload["query_embedding"] = list(self.embedding)
+        return payload
+
+
+class ResultCache:
+    """Bounded LRU of search results that remembers which rows each entry watched."""
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._watchers: Dict[str, set] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key, rows):
+        if key in self._entries:
+            self._forget(key)
+        watched = {row["id"]: row.get("updated_at") for row in rows}
+        self._entries[key] = (rows, watched)
+        for row_id in watched:
+            self._watchers.setdefault(row_id, set()).add(key)
+        while len(self._entries) > self.maxsize:
+            oldest = next(iter(self._entries))
+            self._forget(oldest)
+
+    def invalidate_rows(self, changes):
+        """Drop entries whose watched rows now carry a different updated_at.
+
+        `changes` maps row id to its current updated_at. Returns the number of
+        entries dropped.
+        """
+        stale = set()
+        for row_id, updated_at in changes.items():
+            for key in self._watchers.get(row_id, ()):
+                if self._entries[key][1].get(row_id) != updated_at:
+                    stale.add(key)
+        for key in stale:
+            self._forget(key)
+        return len(stale)
+
+    def clear(self):
+        self._entries.clear()
+        self._watchers.clear()
+
+    def _forget(self, key):
+        _, watched = self._entries.pop(key)
+        for row_id in watched:
+            keys = self._watchers.get(row_id)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._watchers[row_id]
+
+
+class SubmissionSearch:
+    """Batched, cached client for search_submissions_batch.
+
+    Call refresh() periodically (or before a burst of lookups) to pull rows
+    changed since the last refresh and evict the cache entries that returned
+    them. New submissions can match any query, so an insert clears the cache.
+    """
+
+    def __init__(self, client=None, cache_size=256,
+                 text_weight=DEFAULT_TEXT_WEIGHT, vector_weight=DEFAULT_VECTOR_WEIGHT):
+        if client is None:
+            from .config import get_supabase
+            client = get_supabase()
+        self.client = client
+        self.cache = ResultCache(cache_size)
+        self.text_weight = text_weight
+        self.vector_weight = vector_weight
+        self._watermark = None
+        self._seen: Dict[str, str] = {}
+
+    def make_query(self, text, embedding=None, match_count=DEFAULT_MATCH_COUNT,
+                   text_weight=None, vector_weight=None):
+        return SearchQuery(
+            text=text,
+            embedding=tuple(embedding) if embedding is not None else None,
+            match_count=match_count,
+            text_weight=self.text_weight if text_weight is None else text_weight,
+            vector_weight=self.vector_weight if vector_weight is None else vector_weight,
+        )
+
+    def search(self, text, embedding=None, match_count=DEFAULT_MATCH_COUNT,
+               text_weight=None, vector_weight=None):
+        query = self.make_query(text, embedding, match_count, text_weight, vector_weight)
+        return self.search_many([query])[0]
+
+    def search_many(self, queries: Iterable) -> List[List[dict]]:
+        """Run many searches, fetching every cache miss in one RPC call.
+
+        Accepts SearchQuery objects or plain strings (searched with the
+        client's default weights). Results come back in input order.
+        """
+        queries = [q if isinstance(q, SearchQuery) else self.make_query(q) for q in queries]
+        results: List[Optional[List[dict]]] = [None] * len(queries)
+        pending: Dict[tuple, List[int]] = OrderedDict()
+
+        for i, query in enumerate(queries):
+            key = query.cache_key()
+            cached = self.cache.get(key)
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending.setdefault(key, []).append(i)
+
+        if pending:
+            batch = [queries[positions[0]] for positions in pending.values()]
+            fetched = self._fetch(batch)
+            for (key, positions), rows in zip(pending.items(), fetched):
+                self.cache.put(key, rows)
+                for i in positions:
+                    results[i] = rows
+
+        return results
+
+    def refresh(self):
+        """Evict cache entries affected by rows changed since the last refresh.
+
+        Rows are read in (updated_at, id) keyset order starting REFRESH_LOOKBACK
+        behind the watermark, so rows sharing an updated_at across a page
+        boundary and late commits with an older updated_at are still seen;
+        versions already handled are skipped. Returns the number of entries
+        dropped.
+        """
+        if self._watermark is None:
+            latest = (
+                self.client.table("submissions")
+                .select("updated_at")
+                .order("updated_at", desc=True)
+                .limit(1)
+                .execute()
+            )
+            self._watermark = latest.data[0]["updated_at"] if latest.data else EPOCH
+            return 0
+
+        window_start = _parse_ts(self._watermark) - REFRESH_LOOKBACK
+        changed = []
+        cursor = None
+        while True:
+            query = self.client.table("submissions").select("id, created_at, updated_at")
+            if cursor is None:
+                query = query.gte("updated_at", window_start.isoformat())
+            else:
+                query = query.or_(
+                    f'updated_at.gt."{cursor[0]}",'
+                    f'and(updated_at.eq."{cursor[0]}",id.gt.{cursor[1]})'
+                )
+            page = (
+                query.order("updated_at").order("id")
+                .limit(REFRESH_PAGE_SIZE)
+                .execute()
+                .data or []
+            )
+            for row in page:
+                if self._seen.get(row["id"]) != row["updated_at"]:
+                    changed.append(row)
+            if page:
+                cursor = (page[-1]["updated_at"], page[-1]["id"])
+            if len(page) < REFRESH_PAGE_SIZE:
+                break
+
+        if cursor is not None and cursor[0] > self._watermark:
+            self._watermark = cursor[0]
+        new_rows = [row for row in changed if row["id"] not in self._seen]
+        for row in changed:
+            self._seen[row["id"]] = row["updated_at"]
+        # Only versions inside the next lookback window can be re-read
+        cutoff = _parse_ts(self._watermark) - REFRESH_LOOKBACK
+        self._seen = {row_id: updated_at for row_id, updated_at in self._seen.items()
+                      if _parse_ts(updated_at) >= cutoff}
+
+        if not changed:
+            return 0
+        if any(_parse_ts(row["created_at"]) >= window_start for row in new_rows):
+            dropped = len(self.cache)
+            self.cache.clear()
+            return dropped
+        return self.cache.invalidate_rows(
+            {row["id"]: row["updated_at"] for row in changed}
+        )
+
+    def _fetch(self, queries: Sequence[SearchQuery]) -> List[List[dict]]:
+        if self._watermark is None:
+            # Pin the watermark before the first results are cached so that
+            # later refreshes see every change made after this fetch.
+            self.refresh()
+        response = self.client.rpc(
+            "search_submissions_batch",
+            {"queries": [q.to_rpc() for q in queries]},
+        ).execute()
+
+        grouped: List[List[dict]] = [[] for _ in queries]
+        for row in response.data or []:
+            index = row.pop("query_index")
+            grouped[index].append(row)
+        return grouped
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="seo_tools search",
+                                     description="Hybrid search over submissions")
+    parser.add_argument("queries", nargs="+", help="One or more search phrases")
+    parser.add_argument("--limit", type=int, default=DEFAULT_MATCH_COUNT)
+    parser.add_argument("--text-weight", type=float, default=DEFAULT_TEXT_WEIGHT)
+    parser.add_argument("--vector-weight", type=float, default=DEFAULT_VECTOR_WEIGHT)
+    args = parser.parse_args(argv)
+
+    search = SubmissionSearch(text_weight=args.text_weight,
+                              vector_weight=args.vector_weight)
+    queries = [search.make_query(text, match_count=args.limit) for text in args.queries]
+    for text, rows in zip(args.queries, search.search_many(queries)):
+        print(f"\n🔍 {text}: {len(rows)} match(es)")
+        for row in rows:
+            print(f"  {row['combined_score']:.3f}  {row.get('product_name')} - "
+                  f"{row.get('indication')} ({row.get('therapeutic_area')})  {row['id']}")
+    return 0
@@ -0,0 +1,102 @@
+"""
+Startup-time budget for the CLI, measured with `python -X importtime`
+
+Runs the CLI in a fresh interpreter, sums the import time of everything it
+pulls in beyond the bare interpreter, and fails if that exceeds the budget
+or if a heavy dependency is imported before a command actually needs it.
+Wire `python -m seo_tools startup-check` into CI to catch regressions.
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+DEFAULT_BUDGET_MS = 25.0
+DEFAULT_COMMAND_BUDGET_MS = 75.0
+DEFAULT_RUNS = 5
+
+# Must never be imported just to parse arguments or print help
+HEAVY_MODULES = (
+    "supabase", "postgrest", "gotrue", "realtime", "storage3", "httpx",
+    "dotenv", "requests", "psycopg", "psycopg2",
+)
+
+
+def _import_times(args):
+    """Return {module: self_us} for modules imported by `python -m seo_tools args`."""
+    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=repo_root + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "seo_tools", *args],
+        capture_output=True, text=True, env=env, cwd=repo_root,
+    )
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(self_us)
+    return times
+
+
+def _baseline():
+    """Modules the bare interpreter imports on its own (site, encodings, ...)."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "pass"],
+        capture_output=True, text=True,
+    )
+    return {
+        line.split("|")[-1].strip()
+        for line in proc.stderr.splitlines()
+        if line.startswith("import time:") and "self [us]" not in line
+    }
+
+
+def measure(args, runs=DEFAULT_RUNS):
+    """Best-of-`runs` import cost in ms, plus the modules that were imported."""
+    baseline = _baseline()
+    best = None
+    modules = set()
+    for _ in range(runs):
+        times = _import_times(args)
+        extra = {name: us for name, us in times.items() if name not in baseline}
+        total_ms = sum(extra.values()) / 1000
+        if best is None or total_ms < best:
+            best = total_ms
+        modules = set(extra)
+    return best, modules
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="seo_tools startup-check",
+                                     description="Check CLI import time against a budget")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--command-budget-ms", type=float, default=DEFAULT_COMMAND_BUDGET_MS)
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    parser.add_argument("--command", action="append", default=None,
+                        help="Also check `<command> --help` (repeatable; default: all)")
+    args = parser.parse_args(argv)
+
+    from .cli import COMMANDS
+    commands = args.command or [name for name in COMMANDS if name != "startup-check"]
+    cases = [["--help"]] + [[name, "--help"] for name in commands]
+
+    failed = False
+    for case in cases:
+        cost, modules = measure(case, args.runs)
+        heavy = sorted(m for m in modules if m.split(".")[0] in HEAVY_MODULES)
+        label = " ".join(case)
+        status = "✅"
+        if heavy:
+            status = "❌"
+            failed = True
+        # Command --help also pays for argparse and the command module
+        budget = args.budget_ms if case == ["--help"] else args.command_budget_ms
+        if cost > budget:
+            status = "❌"
+            failed = True
+        print(f"{status} {label:<32} {cost:7.2f} ms  {len(modules)} modules")
+        if heavy:
+            print(f"   heavy imports: {', '.join(heavy)}")
+
+    return 1 if failed else 0
@@ -0,0 +1,340 @@
+"""
+Multi-term medical terminology annotator
+
+Loads terminology dictionaries (SNOMED, ICD-10, RxNorm, ...) from local
+files into one Aho-Corasick automaton over every term and synonym, then
+annotates a text in a single left-to-right pass: the cost grows with the
+length of the text, not with the number of terms in the dictionary. This
+replaces one-term-at-a-time lookups like MedicalTerminologyNode's in-code
+termDatabase.
+
+Dictionary files:
+
+    .tsv   system<TAB>code<TAB>display<TAB>term|synonym|...   (# comments)
+    .json  [{"system", "code", "display", "terms": [...]}, ...]
+
+The first term on a line is the preferred term. Matching is
+case-insensitive and only on word boundaries; overlapping matches resolve
+to the leftmost, then longest, unless overlapping=True.
+"""
+import argparse
+import json
+import os
+from collections import deque
+from dataclasses import asdict, dataclass
+
+DEFAULT_DICTIONARY = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                  "data", "terminology.tsv")
+TEXT_FIELDS = ("indication", "raw_input_content")
+PAGE_SIZE = 500
+
+
+@dataclass(frozen=True)
+class Concept:
+    system: str
+    code: str
+    display: str
+    preferred_term: str
+
+
+@dataclass(frozen=True)
+class Annotation:
+    start: int
+    end: int
+    text: str
+    term: str
+    system: str
+    code: str
+    display: str
+    preferred: bool
+
+
+def _fold(text):
+    """Lowercase without changing length, so spans index the original text."""
+    return "".join(c if len(c.lower()) != 1 else c.lower() for c in text)
+
+
+def _normalize_term(term):
+    return " ".join(_fold(term).split())
+
+
+def _normalize_text(text):
+    """Fold case and collapse whitespace runs to one space.
+
+    Returns the normalized text and, for each of its characters, the index
+    of the original character it came from.
+    """
+    chars, offsets = [], []
+    previous_space = False
+    for i, char in enumerate(_fold(text)):
+        if char.isspace():
+            if previous_space:
+                continue
+            char, previous_space = " ", True
+        else:
+            previous_space = False
+        chars.append(char)
+        offsets.append(i)
+    return "".join(chars), offsets
+
+
+def read_dictionary(path):
+    """Yield (Concept, [terms]) from one .tsv or .json dictionary file."""
+    if path.endswith(".json"):
+        with open(path) as f:
+            for entry in json.load(f):
+                terms = [t for t in entry.get("terms", []) if t]
+                if terms:
+                    yield Concept(entry["system"], str(entry["code"]),
+                                  entry.get("display") or terms[0], terms[0]), terms
+        return
+
+    with open(path) as f:
+        for line in f:
+            line = line.rstrip("\n")
+            if not line.strip() or line.startswith("#"):
+                continue
+            system, code, display, terms = (line.split("\t") + ["", "", ""])[:4]
+            terms = [t.strip() for t in terms.split("|") if t.strip()]
+            if terms:
+                yield Concept(system, code, display or terms[0], terms[0]), terms
+
+
+def dictionary_paths(extra=()):
+    """Bundled seed dictionary, TERMINOLOGY_PATH entries, then `extra`."""
+    from .config import get_env
+
+    paths = [DEFAULT_DICTIONARY]
+    env = get_env("TERMINOLOGY_PATH")
+    for item in list(env.split(os.pathsep) if env else []) + list(extra):
+        if os.path.isdir(item):
+            paths.extend(os.path.join(item, name) for name in sorted(os.listdir(item))
+                         if name.endswith((".tsv", ".json")))
+        elif item:
+            paths.append(item)
+    return paths
+
+
+class TerminologyIndex:
+    """Aho-Corasick automaton over every term, mapping matches to concepts.
+
+    States are integers; goto is one dict per state, fail and output are
+    flat lists, and each distinct normalized term is stored once with the
+    concepts that use it.
+    """
+
+    def __init__(self):
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [()]
+        self.terms = []          # term id -> normalized term
+        self.term_ids = {}       # normalized term -> term id
+        self.concepts = []       # term id -> [(Concept, is_preferred)]
+        self._built = False
+
+    @classmethod
+    def from_files(cls, paths):
+        index = cls()
+        for path in paths:
+            for concept, terms in read_dictionary(path):
+                for position, term in enumerate(terms):
+                    index.add(term, concept, preferred=position == 0)
+        index.build()
+        return index
+
+    def add(self, term, concept, preferred=False):
+        term = _normalize_term(term)
+        if not term:
+            return
+        term_id = self.term_ids.get(term)
+        if term_id is None:
+            term_id = len(self.terms)
+            self.terms.append(term)
+            self.term_ids[term] = term_id
+            self.concepts.append([])
+            state = 0
+            for char in term:
+                nxt = self.goto[state].get(char)
+                if nxt is None:
+                    nxt = len(self.goto)
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append(())
+                    self.goto[state][char] = nxt
+                state = nxt
+            self.output[state] = (term_id,)
+            self._built = False
+        if (concept, preferred) not in self.concepts[term_id]:
+            self.concepts[term_id].append((concept, preferred))
+
+    def build(self):
+        """Compute failure links breadth-first and merge outputs along them."""
+        queue = deque()
+        for state in self.goto[0].values():
+            self.fail[state] = 0
+            queue.append(state)
+        while queue:
+            state = queue.popleft()
+            for char, nxt in self.goto[state].items():
+                queue.append(nxt)
+                f = self.fail[state]
+                while f and char not in self.goto[f]:
+                    f = self.fail[f]
+                self.fail[nxt] = self.goto[f].get(char, 0)
+                self.output[nxt] = self.output[nxt] + self.output[self.fail[nxt]]
+        self._built = True
+
+    def __len__(self):
+        return len(self.terms)
+
+    def _matches(self, folded):
+        """Yield (start, end, term_id) for every dictionary term in `folded`."""
+        goto, fail, output, terms = self.goto, self.fail, self.output, self.terms
+        state = 0
+        for i, char in enumerate(folded):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for term_id in output[state]:
+                yield i + 1 - len(terms[term_id]), i + 1, term_id
+
+    def annotate(self, text, systems=None, overlapping=False):
+        """Return Annotations for every concept mentioned in `text`."""
+        if not self._built:
+            self.build()
+        if not text:
+            return []
+        folded, offsets = _normalize_text(text)
+        size = len(folded)
+
+        spans = [
+            (start, end, term_id) for start, end, term_id in self._matches(folded)
+            if (start == 0 or not folded[start - 1].isalnum())
+            and (end == size or not folded[end].isalnum())
+        ]
+        if not overlapping:
+            spans.sort(key=lambda s: (s[0], -s[1]))
+            kept, last_end = [], -1
+            for span in spans:
+                if span[0] >= last_end:
+                    kept.append(span)
+                    last_end = span[1]
+            spans = kept
+
+        annotations = []
+        for start, end, term_id in spans:
+            start, end = offsets[start], offsets[end - 1] + 1
+            for concept, preferred in self.concepts[term_id]:
+                if systems and concept.system not in systems:
+                    continue
+                annotations.append(Annotation(
+                    start, end, text[start:end], self.terms[term_id],
+                    concept.system, concept.code, concept.display, preferred,
+                ))
+        return annotations
+
+    def annotate_many(self, texts, systems=None, overlapping=False):
+        """Annotate an iterable of (key, text) pairs; yields (key, annotations)."""
+        for key, text in texts:
+            yield key, self.annotate(text, systems, overlapping)
+
+
+_index = None
+
+
+def get_index(extra_paths=()):
+    """Index over the default dictionaries (cached) or over extra files too."""
+    global _index
+    if extra_paths:
+        return TerminologyIndex.from_files(dictionary_paths(extra_paths))
+    if _index is None:
+        _index = TerminologyIndex.from_files(dictionary_paths())
+    return _index
+
+
+def iter_submission_texts(client, fields=TEXT_FIELDS, stage=None, ids=None, page_size=PAGE_SIZE):
+    """Yield ((submission_id, field), text) for submissions, keyset-paged by id."""
+    last_id = None
+    while True:
+        query = client.table("submissions").select(", ".join(("id",) + tuple(fields)))
+        if ids:
+            query = query.in_("id", list(ids))
+        if stage:
+            query = query.eq("workflow_stage", stage)
+        if last_id is not None:
+            query = query.gt("id", last_id)
+        page = query.order("id").limit(page_size).execute().data or []
+        for row in page:
+            for field in fields:
+                if row.get(field):
+                    yield (row["id"], field), row[field]
+        if len(page) < page_size:
+            return
+        last_id = page[-1]["id"]
+
+
+def annotate_submissions(client, index=None, fields=TEXT_FIELDS, stage=None, ids=None,
+                         systems=None):
+    """{submission_id: {field: [Annotation, ...]}} across many submissions."""
+    index = index or get_index()
+    results = {}
+    for (submission_id, field), annotations in index.annotate_many(
+            iter_submission_texts(client, fields, stage, ids), systems):
+        results.setdefault(submission_id, {})[field] = annotations
+    return results
+
+
+def _print_annotations(label, annotations):
+    print(f"\n🔍 {label}: {len(annotations)} match(es)")
+    for a in annotations:
+        marker = "" if a.preferred else f" (synonym of {a.display})"
+        print(f"  [{a.start}:{a.end}] {a.text!r:<28} {a.system}:{a.code}{marker}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="seo_tools terminology",
+                                     description="Annotate text with medical terminology codes")
+    parser.add_argument("submission_ids", nargs="*", help="Submissions to annotate")
+    parser.add_argument("--text", help="Annotate this text instead of submissions")
+    parser.add_argument("--stage", help="Annotate every submission in this workflow_stage")
+    parser.add_argument("--field", action="append", choices=TEXT_FIELDS,
+                        help="Fields to annotate (default: both)")
+    parser.add_argument("--system", action="append",
+                        help="Only report these systems (snomed, icd10, rxnorm, ...)")
+    parser.add_argument("--dict", action="append", default=[],
+                        help="Extra dictionary file or directory (repeatable)")
+    parser.add_argument("--overlapping", action="store_true",
+                        help="Report overlapping matches instead of leftmost-longest")
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args(argv)
+
+    index = get_index(args.dict)
+
+    if args.text:
+        annotations = index.annotate(args.text, args.system, args.overlapping)
+        if args.json:
+            print(json.dumps([asdict(a) for a in annotations], indent=2))
+        else:
+            print(f"📊 {len(index)} terms indexed")
+            _print_annotations("text", annotations)
+        return 0
+
+    if not args.submission_ids and not args.stage:
+        parser.error("give submission ids, --stage or --text")
+
+    from .config import get_supabase
+    results = annotate_submissions(get_supabase(), index, tuple(args.field or TEXT_FIELDS),
+                                   args.stage, args.submission_ids or None, args.system)
+    if args.json:
+        print(json.dumps({sid: {field: [asdict(a) for a in anns] for field, anns in fields.items()}
+                          for sid, fields in results.items()}, indent=2))
+        return 0
+    print(f"📊 {len(index)} terms indexed, {len(results)} submission(s) annotated")
+    for submission_id, fields in results.items():
+        for field, annotations in fields.items():
+            _print_annotations(f"{submission_id} {field}", annotations)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
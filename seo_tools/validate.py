@@ -0,0 +1,230 @@
+"""
+Bulk validator for generated SEO/GEO output
+
+Checks the hard constraints from the generation prompt in
+netlify/functions/process-submission.js across every submission with SEO
+output. Rows are streamed in id-ordered pages with only the projected SEO
+columns, and each rule is evaluated column-wise over the whole page with
+map()/operator built-ins instead of branching per row.
+"""
+import argparse
+import json
+import operator
+from collections import Counter
+from itertools import compress, repeat
+
+PAGE_SIZE = 1000
+
+SEO_TITLE_MAX = 60
+META_DESCRIPTION_MAX = 155
+KEYWORDS_MIN, KEYWORDS_MAX = 5, 7
+H1_COUNT = 3
+H2_COUNT = 5
+
+COLUMNS = (
+    "id, product_name, workflow_stage, seo_title, meta_description, "
+    "primary_keywords, long_tail_keywords, h1_tags, h2_tags"
+)
+
+RULES = (
+    "seo_title_missing",
+    "seo_title_too_long",
+    "meta_description_too_long",
+    "primary_keywords_count",
+    "long_tail_keywords_count",
+    "h1_tags_count",
+    "h2_tags_count",
+    "duplicate_keywords",
+    "product_not_in_title",
+)
+
+# Stages whose rows may be sent back when they violate a rule
+GATEABLE_STAGES = ("ai_complete", "qa_review", "seo_review")
+GATE_STAGE = "revision_requested"
+
+
+def _as_list(value):
+    """Array columns arrive as lists, JSON strings or comma-separated text."""
+    if value is None:
+        return []
+    if isinstance(value, list):
+        return value
+    if isinstance(value, str):
+        text = value.strip()
+        if text.startswith("["):
+            try:
+                parsed = json.loads(text)
+            except ValueError:
+                parsed = None
+            if isinstance(parsed, list):
+                return parsed
+        return [part.strip() for part in text.split(",") if part.strip()]
+    return [value]
+
+
+def _outside(counts, low, high):
+    return list(map(operator.or_,
+                    map(operator.lt, counts, repeat(low)),
+                    map(operator.gt, counts, repeat(high))))
+
+
+def to_columns(rows):
+    """Transpose a page of row dicts into normalized columns."""
+    def column(name):
+        return list(map(dict.get, rows, repeat(name)))
+
+    return {
+        "id": column("id"),
+        "workflow_stage": column("workflow_stage"),
+        "product_name": [s or "" for s in column("product_name")],
+        "seo_title": [s or "" for s in column("seo_title")],
+        "meta_description": [s or "" for s in column("meta_description")],
+        "primary_keywords": list(map(_as_list, column("primary_keywords"))),
+        "long_tail_keywords": list(map(_as_list, column("long_tail_keywords"))),
+        "h1_tags": list(map(_as_list, column("h1_tags"))),
+        "h2_tags": list(map(_as_list, column("h2_tags"))),
+    }
+
+
+def check_columns(cols):
+    """Return {rule: [bool per row]} for one page of columns."""
+    title_len = list(map(len, cols["seo_title"]))
+    primary_n = list(map(len, cols["primary_keywords"]))
+    long_tail_n = list(map(len, cols["long_tail_keywords"]))
+
+    keywords = list(map(operator.add, cols["primary_keywords"], cols["long_tail_keywords"]))
+    lowered = [list(map(str.lower, map(str.strip, map(str, kw)))) for kw in keywords]
+    unique_n = list(map(len, map(set, lowered)))
+
+    titles = list(map(str.lower, cols["seo_title"]))
+    products = list(map(str.lower, map(str.strip, cols["product_name"])))
+    has_product = list(map(operator.contains, titles, products))
+
+    return {
+        "seo_title_missing": list(map(operator.eq, title_len, repeat(0))),
+        "seo_title_too_long": list(map(operator.gt, title_len, repeat(SEO_TITLE_MAX))),
+        "meta_description_too_long": list(map(
+            operator.gt, map(len, cols["meta_description"]), repeat(META_DESCRIPTION_MAX))),
+        "primary_keywords_count": _outside(primary_n, KEYWORDS_MIN, KEYWORDS_MAX),
+        "long_tail_keywords_count": _outside(long_tail_n, KEYWORDS_MIN, KEYWORDS_MAX),
+        "h1_tags_count": list(map(operator.ne, map(len, cols["h1_tags"]), repeat(H1_COUNT))),
+        "h2_tags_count": list(map(operator.ne, map(len, cols["h2_tags"]), repeat(H2_COUNT))),
+        "duplicate_keywords": list(map(operator.lt, unique_n, map(len, lowered))),
+        "product_not_in_title": list(map(operator.and_,
+                                         map(bool, products),
+                                         map(operator.not_, has_product))),
+    }
+
+
+def iter_pages(client, page_size=PAGE_SIZE, stage=None):
+    """Yield pages of projected SEO columns, keyset-paginated by id."""
+    last_id = None
+    while True:
+        query = (
+            client.table("submissions")
+            .select(COLUMNS)
+            .not_.is_("seo_title", "null")
+        )
+        if stage:
+            query = query.in_("workflow_stage", stage)
+        if last_id is not None:
+            query = query.gt("id", last_id)
+        page = query.order("id").limit(page_size).execute().data or []
+        if page:
+            yield page
+            last_id = page[-1]["id"]
+        if len(page) < page_size:
+            return
+
+
+class ValidationReport:
+    def __init__(self):
+        self.checked = 0
+        self.rule_counts = Counter()
+        self.violations = {}
+        self.stages = {}
+
+    def add_page(self, cols, results):
+        self.checked += len(cols["id"])
+        for rule in RULES:
+            flagged = list(compress(cols["id"], results[rule]))
+            self.rule_counts[rule] += len(flagged)
+            for row_id in flagged:
+                self.violations.setdefault(row_id, []).append(rule)
+        any_flag = list(map(any, zip(*(results[rule] for rule in RULES))))
+        for row_id, stage in zip(compress(cols["id"], any_flag),
+                                 compress(cols["workflow_stage"], any_flag)):
+            self.stages[row_id] = stage
+
+    def summary(self):
+        return {
+            "checked": self.checked,
+            "failing_rows": len(self.violations),
+            "rule_counts": {rule: self.rule_counts[rule] for rule in RULES},
+        }
+
+
+def validate(client, page_size=PAGE_SIZE, stage=None):
+    report = ValidationReport()
+    for page in iter_pages(client, page_size, stage):
+        cols = to_columns(page)
+        report.add_page(cols, check_columns(cols))
+    return report
+
+
+def gate(client, report, to_stage=GATE_STAGE, from_stages=GATEABLE_STAGES, chunk=200):
+    """Move failing rows still in a reviewable stage to `to_stage`.
+
+    The scan can take a while, so each update is also conditioned on the
+    row's current stage; rows approved or moved on since are left alone.
+    Returns the number of rows actually moved.
+    """
+    ids = [row_id for row_id, stage in report.stages.items() if stage in from_stages]
+    moved = 0
+    for start in range(0, len(ids), chunk):
+        result = (
+            client.table("submissions")
+            .update({"workflow_stage": to_stage})
+            .in_("id", ids[start:start + chunk])
+            .in_("workflow_stage", list(from_stages))
+            .execute()
+        )
+        moved += len(result.data or [])
+    return moved
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="seo_tools validate-seo",
+                                     description="Validate generated SEO output constraints")
+    parser.add_argument("--stage", action="append",
+                        help="Only check rows in this workflow_stage (repeatable)")
+    parser.add_argument("--page-size", type=int, default=PAGE_SIZE)
+    parser.add_argument("--json", action="store_true",
+                        help="Print the full report as JSON")
+    parser.add_argument("--gate", action="store_true",
+                        help=f"Move failing rows in {', '.join(GATEABLE_STAGES)} "
+                             f"to {GATE_STAGE}")
+    args = parser.parse_args(argv)
+
+    from .config import get_supabase
+    client = get_supabase()
+    report = validate(client, args.page_size, args.stage)
+
+    if args.json:
+        print(json.dumps({**report.summary(), "violations": report.violations}, indent=2))
+    else:
+        summary = report.summary()
+        print(f"📊 Checked {summary['checked']} submissions, "
+              f"{summary['failing_rows']} with violations\n")
+        for rule, count in summary["rule_counts"].items():
+            if count:
+                print(f"  {rule:<28} {count}")
+        if report.violations:
+            print()
+            for row_id, rules in report.violations.items():
+                print(f"{row_id}  [{report.stages.get(row_id)}]  {', '.join(rules)}")
+
+    if args.gate:
+        moved = gate(client, report)
+        print(f"\n⚠️ Moved {moved} submission(s) to {GATE_STAGE}")
+    return 1 if report.violations else 0
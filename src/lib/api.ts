@@ -1,6 +1,41 @@
 // Railway API client
 const API_BASE_URL = import.meta.env.VITE_API_BASE_URL || 'https://3cubed-seo-production.up.railway.app';
 
+export interface SubmissionListParams {
+  stage?: string;
+  status?: string;
+  area?: string;
+  fields?: string;
+  limit?: number;
+  cursor?: string;
+}
+
+// Page size getSubmissions asks for while following cursors
+const LIST_PAGE_SIZE = 200;
+
+// Get one page of submissions, newest first. Filters accept comma-separated
+// values; pass the returned nextCursor back to get the following page.
+async function fetchSubmissionsPage(
+  params: SubmissionListParams = {}
+): Promise<{ rows: any[]; nextCursor: string | null }> {
+  const query = new URLSearchParams();
+  for (const [key, value] of Object.entries(params)) {
+    if (value !== undefined && value !== null && value !== '') {
+      query.set(key, String(value));
+    }
+  }
+  const response = await fetch(`${API_BASE_URL}/api/submissions?${query}`);
+
+  if (!response.ok) {
+    throw new Error('Failed to fetch submissions');
+  }
+
+  return {
+    rows: await response.json(),
+    nextCursor: response.headers.get('X-Next-Cursor'),
+  };
+}
+
 export const api = {
   // Submit new pharmaceutical
   async createSubmission(data: any) {
@@ -20,15 +55,22 @@ export const api = {
     return response.json();
   },
 
-  // Get all submissions
-  async getSubmissions() {
-    const response = await fetch(`${API_BASE_URL}/api/submissions`);
-    
-    if (!response.ok) {
-      throw new Error('Failed to fetch submissions');
-    }
+  getSubmissionsPage: fetchSubmissionsPage,
 
-    return response.json();
+  // Get every submission matching the filters, following cursors
+  async getSubmissions(params: Omit<SubmissionListParams, 'cursor'> = {}) {
+    const rows: any[] = [];
+    let cursor: string | null = null;
+    do {
+      const page = await fetchSubmissionsPage({
+        limit: LIST_PAGE_SIZE,
+        ...params,
+        cursor: cursor ?? undefined,
+      });
+      rows.push(...page.rows);
+      cursor = page.nextCursor;
+    } while (cursor);
+    return rows;
   },
 
   // Get single submission
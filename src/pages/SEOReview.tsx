@@ -87,7 +87,7 @@ export default function SEOReview() {
     queryKey: ['seo-review-queue'],
     queryFn: async () => {
       try {
-        const data = await api.getSubmissions()
+        const data = await api.getSubmissions({ stage: 'seo_review' })
         // If no data from API or error, use mock data
         if (!data || data.length === 0) {
           const mockData = await import('../data/mock-submissions.json')
@@ -90,10 +90,11 @@ AS $$
     s.product_name,
     s.indication,
     s.therapeutic_area,
-    ts_rank(s.search_vector, plainto_tsquery('english', search_query)) AS rank
-  FROM submissions s
-  WHERE s.search_vector @@ plainto_tsquery('english', search_query)
-  ORDER BY ts_rank(s.search_vector, plainto_tsquery('english', search_query)) DESC
+    ts_rank(s.search_vector, q.tsq) AS rank
+  FROM submissions s,
+       plainto_tsquery('english', search_query) AS q(tsq)
+  WHERE s.search_vector @@ q.tsq
+  ORDER BY rank DESC
   LIMIT match_count;
 $$;
 
@@ -147,5 +148,72 @@ AS $$
   LIMIT match_count;
 $$;
 
+-- Function for running many hybrid searches in one round trip
+-- Each element of queries is an object with search_query and optional
+-- query_embedding, match_count, text_weight and vector_weight keys.
+-- Rows are tagged with the zero-based position of their query and carry
+-- updated_at so callers can cache results and detect stale entries.
+CREATE OR REPLACE FUNCTION search_submissions_batch(queries jsonb)
+RETURNS TABLE (
+  query_index int,
+  id uuid,
+  product_name text,
+  indication text,
+  therapeutic_area text,
+  updated_at timestamptz,
+  text_score float,
+  vector_score float,
+  combined_score float
+)
+LANGUAGE sql
+STABLE
+AS $$
+  WITH q AS (
+    SELECT
+      (t.ord - 1)::int AS query_index,
+      plainto_tsquery('english', COALESCE(t.elem ->> 'search_query', '')) AS tsq,
+      CASE WHEN jsonb_typeof(t.elem -> 'query_embedding') = 'array'
+           THEN (t.elem ->> 'query_embedding')::vector(1536)
+      END AS embedding,
+      COALESCE((t.elem ->> 'match_count')::int, 10) AS match_count,
+      COALESCE((t.elem ->> 'text_weight')::float, 0.5) AS text_weight,
+      COALESCE((t.elem ->> 'vector_weight')::float, 0.5) AS vector_weight
+    FROM jsonb_array_elements(queries) WITH ORDINALITY AS t(elem, ord)
+  )
+  SELECT
+    q.query_index,
+    r.id,
+    s.product_name,
+    s.indication,
+    s.therapeutic_area,
+    s.updated_at,
+    r.text_score,
+    r.vector_score,
+    r.combined_score
+  FROM q
+  CROSS JOIN LATERAL (
+    SELECT
+      COALESCE(t.id, v.id) AS id,
+      COALESCE(t.text_score, 0)::float AS text_score,
+      COALESCE(v.vector_score, 0)::float AS vector_score,
+      (COALESCE(t.text_score, 0) * q.text_weight + COALESCE(v.vector_score, 0) * q.vector_weight) AS combined_score
+    FROM (
+      SELECT s.id, ts_rank(s.search_vector, q.tsq) AS text_score
+      FROM submissions s
+      WHERE s.search_vector @@ q.tsq
+    ) t
+    FULL OUTER JOIN (
+      SELECT s.id, 1 - (s.content_embedding <=> q.embedding) AS vector_score
+      FROM submissions s
+      WHERE q.embedding IS NOT NULL
+        AND s.content_embedding IS NOT NULL
+    ) v ON t.id = v.id
+    ORDER BY combined_score DESC
+    LIMIT q.match_count
+  ) r
+  JOIN submissions s ON s.id = r.id
+  ORDER BY q.query_index, r.combined_score DESC;
+$$;
+
 -- Update existing records to populate search vectors
 UPDATE submissions SET updated_at = NOW() WHERE search_vector IS NULL;
\ No newline at end of file
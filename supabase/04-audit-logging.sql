@@ -178,6 +178,50 @@ BEGIN
 END;
 $$ LANGUAGE plpgsql;
 
+-- Keyset indexes for cursor pagination over (created_at, id)
+CREATE INDEX IF NOT EXISTS audit_logs_created_at_id_idx
+  ON audit_logs (created_at, id);
+CREATE INDEX IF NOT EXISTS audit_logs_record_created_at_id_idx
+  ON audit_logs (table_name, record_id, created_at DESC, id DESC);
+
+-- Paginated audit trail for busy submissions
+-- Pass the created_at/id of the last row from the previous page to continue;
+-- leave both NULL for the newest page.
+CREATE OR REPLACE FUNCTION get_submission_audit_trail_page(
+  submission_id uuid,
+  before_created_at timestamptz DEFAULT NULL,
+  before_id uuid DEFAULT NULL,
+  page_size int DEFAULT 200
+)
+RETURNS TABLE (
+  id uuid,
+  action text,
+  changed_fields text[],
+  user_email text,
+  user_role text,
+  compliance_impact text,
+  created_at timestamptz
+) AS $$
+BEGIN
+  RETURN QUERY
+  SELECT 
+    a.id,
+    a.action,
+    a.changed_fields,
+    a.user_email,
+    a.user_role,
+    a.compliance_impact,
+    a.created_at
+  FROM audit_logs a
+  WHERE a.table_name = 'submissions' 
+    AND a.record_id = submission_id
+    AND (before_created_at IS NULL
+         OR (a.created_at, a.id) < (before_created_at, before_id))
+  ORDER BY a.created_at DESC, a.id DESC
+  LIMIT LEAST(GREATEST(page_size, 1), 1000);
+END;
+$$ LANGUAGE plpgsql;
+
 -- Function to get compliance-critical audit events
 CREATE OR REPLACE FUNCTION get_critical_audit_events(
   start_date timestamptz DEFAULT now() - interval '30 days',
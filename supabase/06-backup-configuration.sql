@@ -161,4 +161,51 @@ BEGIN
     );
   END IF;
 END;
-$$ LANGUAGE plpgsql;
\ No newline at end of file
+$$ LANGUAGE plpgsql;
+
+-- Register a data-bearing backup written by seo_tools/backup.py
+-- The manifest describes the chunk files (path, sha256, row count) and the
+-- updated_at watermark, so the recovery point can actually be restored with
+-- `python -m seo_tools backup restore --to <point_name>`.
+CREATE OR REPLACE FUNCTION register_backup_recovery_point(
+  point_name text,
+  backup_type text,
+  backup_location text,
+  size_bytes bigint,
+  manifest jsonb
+)
+RETURNS uuid AS $$
+DECLARE
+  recovery_id uuid;
+BEGIN
+  INSERT INTO backup_status (
+    backup_type,
+    status,
+    completed_at,
+    size_bytes,
+    backup_location,
+    metadata
+  ) VALUES (
+    backup_type,
+    'completed',
+    now(),
+    size_bytes,
+    backup_location,
+    manifest - 'chunks'
+  );
+
+  INSERT INTO recovery_points (
+    point_name,
+    description,
+    submission_count,
+    data_snapshot
+  ) VALUES (
+    point_name,
+    'Chunked ' || backup_type || ' backup at ' || backup_location,
+    (manifest ->> 'row_count')::integer,
+    manifest
+  ) RETURNING id INTO recovery_id;
+
+  RETURN recovery_id;
+END;
+$$ LANGUAGE plpgsql;
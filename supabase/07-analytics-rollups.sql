@@ -0,0 +1,487 @@
+-- Incrementally maintained rollups behind the analytics dashboard
+-- Replaces the full-scan views from 05-analytics-dashboard.sql with views over
+-- small aggregate tables. refresh_analytics_rollups() folds in only the
+-- submissions whose updated_at moved since the last run; it is driven by
+-- seo_tools/rollups.py (python -m seo_tools rollups --watch).
+
+-- Refresh watermark (single row)
+CREATE TABLE IF NOT EXISTS analytics_rollup_state (
+  id boolean PRIMARY KEY DEFAULT true CHECK (id),
+  watermark timestamptz NOT NULL DEFAULT '-infinity',
+  last_refreshed_at timestamptz,
+  rows_applied bigint NOT NULL DEFAULT 0
+);
+
+INSERT INTO analytics_rollup_state (id) VALUES (true) ON CONFLICT (id) DO NOTHING;
+
+-- Last contribution applied for each submission, so a change can be
+-- subtracted before the new values are added
+CREATE TABLE IF NOT EXISTS analytics_submission_facts (
+  submission_id uuid PRIMARY KEY,
+  updated_at timestamptz,
+  day date NOT NULL,
+  therapeutic_area text NOT NULL,
+  markets text[] NOT NULL DEFAULT '{}',
+  workflow_stage text NOT NULL,
+  ai_processing_status text NOT NULL,
+  is_completed int NOT NULL,
+  is_ai_processed int NOT NULL,
+  is_approved int NOT NULL,
+  has_fda_data int NOT NULL,
+  qa_score numeric,
+  medical_accuracy_score numeric,
+  fda_data_quality_score numeric,
+  ai_readiness_score numeric,
+  engagement_rate float,
+  age_seconds float
+);
+
+-- Submissions deleted since the last refresh
+CREATE TABLE IF NOT EXISTS analytics_rollup_deletes (
+  submission_id uuid PRIMARY KEY,
+  deleted_at timestamptz DEFAULT now()
+);
+
+-- Per-day, per-therapeutic-area aggregates ('' = no therapeutic area)
+CREATE TABLE IF NOT EXISTS analytics_daily_area_rollup (
+  day date NOT NULL,
+  therapeutic_area text NOT NULL,
+  submission_count bigint NOT NULL DEFAULT 0,
+  completed_count bigint NOT NULL DEFAULT 0,
+  ai_processed_count bigint NOT NULL DEFAULT 0,
+  approved_count bigint NOT NULL DEFAULT 0,
+  fda_data_count bigint NOT NULL DEFAULT 0,
+  high_quality_fda_count bigint NOT NULL DEFAULT 0,
+  qa_score_sum numeric NOT NULL DEFAULT 0,
+  qa_score_count bigint NOT NULL DEFAULT 0,
+  medical_accuracy_sum numeric NOT NULL DEFAULT 0,
+  medical_accuracy_count bigint NOT NULL DEFAULT 0,
+  fda_quality_sum numeric NOT NULL DEFAULT 0,
+  fda_quality_count bigint NOT NULL DEFAULT 0,
+  PRIMARY KEY (day, therapeutic_area)
+);
+
+-- Per-day, per-market aggregates (markets split from geographic_markets)
+CREATE TABLE IF NOT EXISTS analytics_daily_market_rollup (
+  day date NOT NULL,
+  market text NOT NULL,
+  submission_count bigint NOT NULL DEFAULT 0,
+  approved_count bigint NOT NULL DEFAULT 0,
+  qa_score_sum numeric NOT NULL DEFAULT 0,
+  qa_score_count bigint NOT NULL DEFAULT 0,
+  engagement_sum float NOT NULL DEFAULT 0,
+  engagement_count bigint NOT NULL DEFAULT 0,
+  PRIMARY KEY (day, market)
+);
+
+-- Per-stage aggregates ('' = no stage/status)
+CREATE TABLE IF NOT EXISTS analytics_stage_rollup (
+  workflow_stage text NOT NULL,
+  ai_processing_status text NOT NULL,
+  submission_count bigint NOT NULL DEFAULT 0,
+  age_seconds_sum float NOT NULL DEFAULT 0,
+  age_count bigint NOT NULL DEFAULT 0,
+  ai_readiness_sum numeric NOT NULL DEFAULT 0,
+  ai_readiness_count bigint NOT NULL DEFAULT 0,
+  PRIMARY KEY (workflow_stage, ai_processing_status)
+);
+
+-- Index used to find changed rows
+CREATE INDEX IF NOT EXISTS submissions_updated_at_idx ON submissions (updated_at);
+
+-- Queue deletes so their contribution can be subtracted
+CREATE OR REPLACE FUNCTION queue_analytics_rollup_delete()
+RETURNS TRIGGER AS $$
+BEGIN
+  INSERT INTO analytics_rollup_deletes (submission_id)
+  VALUES (OLD.id)
+  ON CONFLICT (submission_id) DO NOTHING;
+  RETURN OLD;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS analytics_rollup_delete_trigger ON submissions;
+CREATE TRIGGER analytics_rollup_delete_trigger
+  AFTER DELETE ON submissions
+  FOR EACH ROW
+  EXECUTE FUNCTION queue_analytics_rollup_delete();
+
+-- Apply one batch of changed submissions to the rollups
+-- Rows within `lookback` of the watermark are re-examined so that late commits
+-- with an older updated_at are not missed; rows whose applied updated_at
+-- already matches are skipped, which keeps repeated runs idempotent.
+CREATE OR REPLACE FUNCTION refresh_analytics_rollups(
+  batch_size int DEFAULT 5000,
+  lookback interval DEFAULT interval '5 minutes'
+)
+RETURNS TABLE (
+  applied integer,
+  deleted integer,
+  watermark timestamptz
+) AS $$
+DECLARE
+  v_watermark timestamptz;
+  v_applied integer;
+  v_deleted integer;
+BEGIN
+  -- Lock the state row so concurrent refreshers serialize
+  SELECT st.watermark INTO v_watermark
+  FROM analytics_rollup_state st
+  WHERE st.id
+  FOR UPDATE;
+
+  -- Deletes are taken first and excluded from the changed set. Each statement
+  -- gets its own snapshot under READ COMMITTED; a delete that commits after
+  -- this one is left queued for the next run, so a submission is never both
+  -- re-added from rollup_changed and removed in the same run.
+  DROP TABLE IF EXISTS pg_temp.rollup_removed;
+  CREATE TEMP TABLE rollup_removed ON COMMIT DROP AS
+  SELECT d.submission_id FROM analytics_rollup_deletes d;
+
+  DROP TABLE IF EXISTS pg_temp.rollup_changed;
+  CREATE TEMP TABLE rollup_changed ON COMMIT DROP AS
+  SELECT
+    s.id AS submission_id,
+    s.updated_at,
+    DATE(s.created_at) AS day,
+    COALESCE(s.therapeutic_area, '') AS therapeutic_area,
+    COALESCE(string_to_array(s.geographic_markets, ', '), '{}') AS markets,
+    COALESCE(s.workflow_stage, '') AS workflow_stage,
+    COALESCE(s.ai_processing_status, '') AS ai_processing_status,
+    COALESCE((s.workflow_stage = 'completed')::int, 0) AS is_completed,
+    COALESCE((s.ai_processing_status = 'completed')::int, 0) AS is_ai_processed,
+    COALESCE((s.qa_status = 'approved')::int, 0) AS is_approved,
+    (s.fda_comprehensive_data IS NOT NULL)::int AS has_fda_data,
+    s.qa_score::numeric AS qa_score,
+    s.medical_accuracy_score::numeric AS medical_accuracy_score,
+    s.fda_data_quality_score::numeric AS fda_data_quality_score,
+    s.ai_readiness_score::numeric AS ai_readiness_score,
+    CASE WHEN s.geo_performance_metrics IS NOT NULL
+      THEN (s.geo_performance_metrics::jsonb ->> 'engagement_rate')::float
+    END AS engagement_rate,
+    EXTRACT(EPOCH FROM (s.updated_at - s.created_at))::float AS age_seconds
+  FROM submissions s
+  LEFT JOIN analytics_submission_facts f ON f.submission_id = s.id
+  -- Rows without an updated_at have no place on the watermark; they are
+  -- picked up once, when they have no facts yet
+  WHERE (
+      (s.updated_at >= v_watermark - lookback AND f.updated_at IS DISTINCT FROM s.updated_at)
+      OR (s.updated_at IS NULL AND f.submission_id IS NULL)
+    )
+    AND s.id NOT IN (SELECT submission_id FROM rollup_removed)
+  ORDER BY s.updated_at
+  LIMIT batch_size;
+
+  -- Old contributions are subtracted, new ones added
+  DROP TABLE IF EXISTS pg_temp.rollup_signed;
+  CREATE TEMP TABLE rollup_signed ON COMMIT DROP AS
+  SELECT -1 AS sign, f.day, f.therapeutic_area, f.markets, f.workflow_stage,
+         f.ai_processing_status, f.is_completed, f.is_ai_processed, f.is_approved,
+         f.has_fda_data, f.qa_score, f.medical_accuracy_score, f.fda_data_quality_score,
+         f.ai_readiness_score, f.engagement_rate, f.age_seconds
+  FROM analytics_submission_facts f
+  WHERE f.submission_id IN (SELECT submission_id FROM rollup_changed)
+     OR f.submission_id IN (SELECT submission_id FROM rollup_removed)
+  UNION ALL
+  SELECT 1 AS sign, c.day, c.therapeutic_area, c.markets, c.workflow_stage,
+         c.ai_processing_status, c.is_completed, c.is_ai_processed, c.is_approved,
+         c.has_fda_data, c.qa_score, c.medical_accuracy_score, c.fda_data_quality_score,
+         c.ai_readiness_score, c.engagement_rate, c.age_seconds
+  FROM rollup_changed c;
+
+  INSERT INTO analytics_daily_area_rollup AS r (
+    day, therapeutic_area, submission_count, completed_count, ai_processed_count,
+    approved_count, fda_data_count, high_quality_fda_count, qa_score_sum,
+    qa_score_count, medical_accuracy_sum, medical_accuracy_count,
+    fda_quality_sum, fda_quality_count
+  )
+  SELECT
+    d.day,
+    d.therapeutic_area,
+    SUM(d.sign),
+    SUM(d.sign * d.is_completed),
+    SUM(d.sign * d.is_ai_processed),
+    SUM(d.sign * d.is_approved),
+    SUM(d.sign * d.has_fda_data),
+    SUM(d.sign * COALESCE((d.fda_data_quality_score >= 80)::int, 0)),
+    COALESCE(SUM(d.sign * d.qa_score), 0),
+    COUNT(d.qa_score) FILTER (WHERE d.sign > 0) - COUNT(d.qa_score) FILTER (WHERE d.sign < 0),
+    COALESCE(SUM(d.sign * d.medical_accuracy_score), 0),
+    COUNT(d.medical_accuracy_score) FILTER (WHERE d.sign > 0) - COUNT(d.medical_accuracy_score) FILTER (WHERE d.sign < 0),
+    COALESCE(SUM(d.sign * d.fda_data_quality_score), 0),
+    COUNT(d.fda_data_quality_score) FILTER (WHERE d.sign > 0) - COUNT(d.fda_data_quality_score) FILTER (WHERE d.sign < 0)
+  FROM rollup_signed d
+  GROUP BY d.day, d.therapeutic_area
+  ON CONFLICT (day, therapeutic_area) DO UPDATE SET
+    submission_count = r.submission_count + EXCLUDED.submission_count,
+    completed_count = r.completed_count + EXCLUDED.completed_count,
+    ai_processed_count = r.ai_processed_count + EXCLUDED.ai_processed_count,
+    approved_count = r.approved_count + EXCLUDED.approved_count,
+    fda_data_count = r.fda_data_count + EXCLUDED.fda_data_count,
+    high_quality_fda_count = r.high_quality_fda_count + EXCLUDED.high_quality_fda_count,
+    qa_score_sum = r.qa_score_sum + EXCLUDED.qa_score_sum,
+    qa_score_count = r.qa_score_count + EXCLUDED.qa_score_count,
+    medical_accuracy_sum = r.medical_accuracy_sum + EXCLUDED.medical_accuracy_sum,
+    medical_accuracy_count = r.medical_accuracy_count + EXCLUDED.medical_accuracy_count,
+    fda_quality_sum = r.fda_quality_sum + EXCLUDED.fda_quality_sum,
+    fda_quality_count = r.fda_quality_count + EXCLUDED.fda_quality_count;
+
+  INSERT INTO analytics_daily_market_rollup AS r (
+    day, market, submission_count, approved_count, qa_score_sum,
+    qa_score_count, engagement_sum, engagement_count
+  )
+  SELECT
+    d.day,
+    m.market,
+    SUM(d.sign),
+    SUM(d.sign * d.is_approved),
+    COALESCE(SUM(d.sign * d.qa_score), 0),
+    COUNT(d.qa_score) FILTER (WHERE d.sign > 0) - COUNT(d.qa_score) FILTER (WHERE d.sign < 0),
+    COALESCE(SUM(d.sign * d.engagement_rate), 0),
+    COUNT(d.engagement_rate) FILTER (WHERE d.sign > 0) - COUNT(d.engagement_rate) FILTER (WHERE d.sign < 0)
+  FROM rollup_signed d
+  CROSS JOIN LATERAL unnest(d.markets) AS m(market)
+  GROUP BY d.day, m.market
+  ON CONFLICT (day, market) DO UPDATE SET
+    submission_count = r.submission_count + EXCLUDED.submission_count,
+    approved_count = r.approved_count + EXCLUDED.approved_count,
+    qa_score_sum = r.qa_score_sum + EXCLUDED.qa_score_sum,
+    qa_score_count = r.qa_score_count + EXCLUDED.qa_score_count,
+    engagement_sum = r.engagement_sum + EXCLUDED.engagement_sum,
+    engagement_count = r.engagement_count + EXCLUDED.engagement_count;
+
+  INSERT INTO analytics_stage_rollup AS r (
+    workflow_stage, ai_processing_status, submission_count, age_seconds_sum,
+    age_count, ai_readiness_sum, ai_readiness_count
+  )
+  SELECT
+    d.workflow_stage,
+    d.ai_processing_status,
+    SUM(d.sign),
+    COALESCE(SUM(d.sign * d.age_seconds), 0),
+    COUNT(d.age_seconds) FILTER (WHERE d.sign > 0) - COUNT(d.age_seconds) FILTER (WHERE d.sign < 0),
+    COALESCE(SUM(d.sign * d.ai_readiness_score), 0),
+    COUNT(d.ai_readiness_score) FILTER (WHERE d.sign > 0) - COUNT(d.ai_readiness_score) FILTER (WHERE d.sign < 0)
+  FROM rollup_signed d
+  GROUP BY d.workflow_stage, d.ai_processing_status
+  ON CONFLICT (workflow_stage, ai_processing_status) DO UPDATE SET
+    submission_count = r.submission_count + EXCLUDED.submission_count,
+    age_seconds_sum = r.age_seconds_sum + EXCLUDED.age_seconds_sum,
+    age_count = r.age_count + EXCLUDED.age_count,
+    ai_readiness_sum = r.ai_readiness_sum + EXCLUDED.ai_readiness_sum,
+    ai_readiness_count = r.ai_readiness_count + EXCLUDED.ai_readiness_count;
+
+  -- Drop groups that no longer have any submissions
+  DELETE FROM analytics_daily_area_rollup WHERE submission_count <= 0;
+  DELETE FROM analytics_daily_market_rollup WHERE submission_count <= 0;
+  DELETE FROM analytics_stage_rollup WHERE submission_count <= 0;
+
+  -- Record the contributions just applied
+  DELETE FROM analytics_submission_facts f
+  WHERE f.submission_id IN (SELECT submission_id FROM rollup_removed);
+  DELETE FROM analytics_rollup_deletes d
+  WHERE d.submission_id IN (SELECT submission_id FROM rollup_removed);
+
+  INSERT INTO analytics_submission_facts
+  SELECT * FROM rollup_changed
+  ON CONFLICT (submission_id) DO UPDATE SET
+    updated_at = EXCLUDED.updated_at,
+    day = EXCLUDED.day,
+    therapeutic_area = EXCLUDED.therapeutic_area,
+    markets = EXCLUDED.markets,
+    workflow_stage = EXCLUDED.workflow_stage,
+    ai_processing_status = EXCLUDED.ai_processing_status,
+    is_completed = EXCLUDED.is_completed,
+    is_ai_processed = EXCLUDED.is_ai_processed,
+    is_approved = EXCLUDED.is_approved,
+    has_fda_data = EXCLUDED.has_fda_data,
+    qa_score = EXCLUDED.qa_score,
+    medical_accuracy_score = EXCLUDED.medical_accuracy_score,
+    fda_data_quality_score = EXCLUDED.fda_data_quality_score,
+    ai_readiness_score = EXCLUDED.ai_readiness_score,
+    engagement_rate = EXCLUDED.engagement_rate,
+    age_seconds = EXCLUDED.age_seconds;
+
+  SELECT COUNT(*) INTO v_applied FROM rollup_changed;
+  SELECT COUNT(*) INTO v_deleted FROM rollup_removed;
+
+  UPDATE analytics_rollup_state st SET
+    watermark = GREATEST(st.watermark, COALESCE((SELECT MAX(c.updated_at) FROM rollup_changed c), st.watermark)),
+    last_refreshed_at = now(),
+    rows_applied = st.rows_applied + v_applied
+  WHERE st.id
+  RETURNING st.watermark INTO v_watermark;
+
+  RETURN QUERY SELECT v_applied, v_deleted, v_watermark;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Reset rollups so the next refresh rebuilds them from scratch
+CREATE OR REPLACE FUNCTION reset_analytics_rollups()
+RETURNS void AS $$
+BEGIN
+  TRUNCATE analytics_daily_area_rollup, analytics_daily_market_rollup,
+           analytics_stage_rollup, analytics_submission_facts,
+           analytics_rollup_deletes;
+  UPDATE analytics_rollup_state SET
+    watermark = '-infinity',
+    last_refreshed_at = NULL,
+    rows_applied = 0
+  WHERE id;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Databases that already ran this file get age_count and a rebuild, since the
+-- existing age sums cannot be split back into counted rows
+DO $$
+BEGIN
+  IF NOT EXISTS (
+    SELECT 1 FROM information_schema.columns
+    WHERE table_name = 'analytics_stage_rollup' AND column_name = 'age_count'
+  ) THEN
+    ALTER TABLE analytics_stage_rollup ADD COLUMN age_count bigint NOT NULL DEFAULT 0;
+    PERFORM reset_analytics_rollups();
+  END IF;
+END $$;
+
+-- Dashboard views, now served from the rollups
+DROP VIEW IF EXISTS submission_metrics;
+CREATE VIEW submission_metrics AS
+SELECT
+  COALESCE(SUM(a.submission_count), 0)::bigint as total_submissions,
+  COALESCE(SUM(a.completed_count), 0)::bigint as completed_submissions,
+  COALESCE(SUM(a.ai_processed_count), 0)::bigint as ai_processed,
+  COALESCE(SUM(a.approved_count), 0)::bigint as qa_approved,
+  SUM(a.qa_score_sum) / NULLIF(SUM(a.qa_score_count), 0) as avg_qa_score,
+  SUM(a.medical_accuracy_sum) / NULLIF(SUM(a.medical_accuracy_count), 0) as avg_medical_accuracy,
+  COUNT(DISTINCT NULLIF(a.therapeutic_area, '')) as therapeutic_areas_covered,
+  (SELECT COUNT(DISTINCT m.market) FROM analytics_daily_market_rollup m) as markets_covered
+FROM analytics_daily_area_rollup a;
+
+DROP VIEW IF EXISTS therapeutic_area_performance;
+CREATE VIEW therapeutic_area_performance AS
+SELECT
+  therapeutic_area,
+  SUM(submission_count)::bigint as submission_count,
+  SUM(qa_score_sum) / NULLIF(SUM(qa_score_count), 0) as avg_qa_score,
+  SUM(medical_accuracy_sum) / NULLIF(SUM(medical_accuracy_count), 0) as avg_medical_accuracy,
+  SUM(approved_count)::bigint as approved_count,
+  SUM(completed_count)::bigint as completed_count,
+  SUM(fda_quality_sum) / NULLIF(SUM(fda_quality_count), 0) as avg_fda_data_quality
+FROM analytics_daily_area_rollup
+WHERE therapeutic_area <> ''
+GROUP BY therapeutic_area
+ORDER BY submission_count DESC;
+
+DROP VIEW IF EXISTS geographic_performance;
+CREATE VIEW geographic_performance AS
+SELECT
+  market,
+  SUM(submission_count)::bigint as submission_count,
+  SUM(qa_score_sum) / NULLIF(SUM(qa_score_count), 0) as avg_qa_score,
+  SUM(approved_count)::bigint as approved_count,
+  SUM(engagement_sum) / NULLIF(SUM(engagement_count), 0) as avg_engagement_rate
+FROM analytics_daily_market_rollup
+GROUP BY market
+ORDER BY submission_count DESC;
+
+DROP VIEW IF EXISTS ai_processing_metrics;
+CREATE VIEW ai_processing_metrics AS
+SELECT
+  NULLIF(ai_processing_status, '') as ai_processing_status,
+  SUM(submission_count)::bigint as count,
+  SUM(ai_readiness_sum) / NULLIF(SUM(ai_readiness_count), 0) as avg_readiness_score,
+  SUM(age_seconds_sum) / NULLIF(SUM(age_count), 0) / 3600 as avg_processing_hours
+FROM analytics_stage_rollup
+GROUP BY ai_processing_status;
+
+DROP VIEW IF EXISTS workflow_distribution;
+CREATE VIEW workflow_distribution AS
+SELECT
+  NULLIF(workflow_stage, '') as workflow_stage,
+  SUM(submission_count)::bigint as count,
+  ROUND((SUM(submission_count) * 100.0 / SUM(SUM(submission_count)) OVER()), 2) as percentage,
+  SUM(age_seconds_sum) / NULLIF(SUM(age_count), 0) / 3600 as avg_time_in_stage_hours
+FROM analytics_stage_rollup
+GROUP BY workflow_stage
+ORDER BY count DESC;
+
+DROP VIEW IF EXISTS daily_performance_trends;
+CREATE VIEW daily_performance_trends AS
+SELECT
+  day as date,
+  SUM(submission_count)::bigint as submissions_created,
+  SUM(completed_count)::bigint as submissions_completed,
+  SUM(qa_score_sum) / NULLIF(SUM(qa_score_count), 0) as avg_qa_score,
+  SUM(approved_count)::bigint as approvals_count
+FROM analytics_daily_area_rollup
+WHERE day >= DATE(now() - interval '30 days')
+GROUP BY day
+ORDER BY day;
+
+DROP VIEW IF EXISTS fda_integration_metrics;
+CREATE VIEW fda_integration_metrics AS
+SELECT
+  COALESCE(SUM(submission_count), 0)::bigint as total_submissions,
+  COALESCE(SUM(fda_data_count), 0)::bigint as fda_data_available,
+  SUM(fda_quality_sum) / NULLIF(SUM(fda_quality_count), 0) as avg_fda_quality_score,
+  COALESCE(SUM(high_quality_fda_count), 0)::bigint as high_quality_fda_data,
+  ROUND(
+    (SUM(fda_data_count) * 100.0 / NULLIF(SUM(submission_count), 0)), 2
+  ) as fda_integration_rate
+FROM analytics_daily_area_rollup;
+
+-- Dashboard metrics over whole days from the rollups
+CREATE OR REPLACE FUNCTION get_dashboard_metrics(
+  start_date timestamptz DEFAULT now() - interval '30 days',
+  end_date timestamptz DEFAULT now()
+)
+RETURNS TABLE (
+  metric_name text,
+  metric_value numeric,
+  metric_change_percent numeric
+) AS $$
+BEGIN
+  RETURN QUERY
+  WITH current_period AS (
+    SELECT
+      COALESCE(SUM(r.submission_count), 0) as total_submissions,
+      SUM(r.qa_score_sum) / NULLIF(SUM(r.qa_score_count), 0) as avg_qa_score,
+      COALESCE(SUM(r.approved_count), 0) as approved_count
+    FROM analytics_daily_area_rollup r
+    WHERE r.day BETWEEN DATE(start_date) AND DATE(end_date)
+  ),
+  previous_period AS (
+    SELECT
+      COALESCE(SUM(r.submission_count), 0) as total_submissions,
+      SUM(r.qa_score_sum) / NULLIF(SUM(r.qa_score_count), 0) as avg_qa_score,
+      COALESCE(SUM(r.approved_count), 0) as approved_count
+    FROM analytics_daily_area_rollup r
+    WHERE r.day >= DATE(start_date - (end_date - start_date))
+      AND r.day < DATE(start_date)
+  )
+  SELECT 'Total Submissions' as metric_name,
+         c.total_submissions::numeric as metric_value,
+         CASE WHEN p.total_submissions > 0
+              THEN ((c.total_submissions - p.total_submissions)::numeric / p.total_submissions * 100)
+              ELSE 0
+         END as metric_change_percent
+  FROM current_period c, previous_period p
+  UNION ALL
+  SELECT 'Average QA Score' as metric_name,
+         ROUND(c.avg_qa_score, 2) as metric_value,
+         CASE WHEN p.avg_qa_score > 0
+              THEN ROUND(((c.avg_qa_score - p.avg_qa_score) / p.avg_qa_score * 100), 2)
+              ELSE 0
+         END as metric_change_percent
+  FROM current_period c, previous_period p
+  UNION ALL
+  SELECT 'Approved Submissions' as metric_name,
+         c.approved_count::numeric as metric_value,
+         CASE WHEN p.approved_count > 0
+              THEN ((c.approved_count - p.approved_count)::numeric / p.approved_count * 100)
+              ELSE 0
+         END as metric_change_percent
+  FROM current_period c, previous_period p;
+END;
+$$ LANGUAGE plpgsql;
@@ -0,0 +1,140 @@
+-- Batch forms of run_seo_automation and create_submission
+-- One RPC call and one transaction per batch instead of one per submission.
+-- Both return one row per input item (item_index is the 0-based position in
+-- the input array) with the submission id, ok, and the error if it failed; a
+-- failing item never rolls back the others. Driven by seo_tools/batch.py,
+-- which chunks large inputs (python -m seo_tools batch ...).
+
+-- Run SEO automation for many submissions. Unknown ids and repeats are
+-- resolved set-wise up front; run_seo_automation() is then called for each
+-- remaining id inside its own savepoint.
+CREATE OR REPLACE FUNCTION run_seo_automation_batch(submission_ids uuid[])
+RETURNS TABLE (
+  item_index int,
+  submission_id uuid,
+  ok boolean,
+  error text
+) AS $$
+DECLARE
+  item record;
+BEGIN
+  FOR item IN
+    SELECT
+      (t.ord - 1)::int AS idx,
+      t.id,
+      s.id IS NOT NULL AS found,
+      (min(t.ord) OVER (PARTITION BY t.id) - 1)::int AS first_idx
+    FROM unnest(submission_ids) WITH ORDINALITY AS t(id, ord)
+    LEFT JOIN submissions s ON s.id = t.id
+    ORDER BY t.ord
+  LOOP
+    item_index := item.idx;
+    submission_id := item.id;
+
+    IF item.id IS NULL OR NOT item.found THEN
+      ok := false;
+      error := 'submission not found';
+    ELSIF item.first_idx <> item.idx THEN
+      ok := true;
+      error := 'duplicate of item ' || item.first_idx || ', skipped';
+    ELSE
+      BEGIN
+        PERFORM run_seo_automation(item.id);
+        ok := true;
+        error := NULL;
+      EXCEPTION WHEN OTHERS THEN
+        ok := false;
+        error := SQLERRM;
+      END;
+    END IF;
+
+    RETURN NEXT;
+  END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Create many submissions from a jsonb array of records keyed like the
+-- create_submission() parameters without the p_ prefix (compliance_id,
+-- product_name, ..., stage). Every record goes through create_submission()
+-- itself, inside its own savepoint, so batch and single creation behave the
+-- same and a failing record only reports its own error. Keys missing from a
+-- record are passed as NULL, as seo_tools' create_via_rpc() does; p_stage is
+-- only passed when the record has a stage.
+CREATE OR REPLACE FUNCTION create_submissions_batch(records jsonb)
+RETURNS TABLE (
+  item_index int,
+  submission_id uuid,
+  ok boolean,
+  error text
+) AS $$
+DECLARE
+  item record;
+  new_id uuid;
+BEGIN
+  IF jsonb_typeof(records) IS DISTINCT FROM 'array' THEN
+    RAISE EXCEPTION 'records must be a JSON array';
+  END IF;
+
+  FOR item IN
+    SELECT (t.ord - 1)::int AS idx, r.*
+    FROM jsonb_array_elements(records) WITH ORDINALITY AS t(elem, ord)
+    CROSS JOIN LATERAL jsonb_to_record(t.elem) AS r(
+      compliance_id text,
+      product_name text,
+      generic_name text,
+      indication text,
+      therapeutic_area text,
+      submitter_email text,
+      submitter_name text,
+      seo_reviewer_name text,
+      seo_reviewer_email text,
+      workflow_stage text,
+      priority_level text,
+      stage text
+    )
+    ORDER BY t.ord
+  LOOP
+    item_index := item.idx;
+    BEGIN
+      IF item.stage IS NULL THEN
+        new_id := create_submission(
+          p_compliance_id => item.compliance_id,
+          p_product_name => item.product_name,
+          p_generic_name => item.generic_name,
+          p_indication => item.indication,
+          p_therapeutic_area => item.therapeutic_area,
+          p_submitter_email => item.submitter_email,
+          p_submitter_name => item.submitter_name,
+          p_seo_reviewer_name => item.seo_reviewer_name,
+          p_seo_reviewer_email => item.seo_reviewer_email,
+          p_workflow_stage => item.workflow_stage,
+          p_priority_level => item.priority_level
+        );
+      ELSE
+        new_id := create_submission(
+          p_compliance_id => item.compliance_id,
+          p_product_name => item.product_name,
+          p_generic_name => item.generic_name,
+          p_indication => item.indication,
+          p_therapeutic_area => item.therapeutic_area,
+          p_submitter_email => item.submitter_email,
+          p_submitter_name => item.submitter_name,
+          p_seo_reviewer_name => item.seo_reviewer_name,
+          p_seo_reviewer_email => item.seo_reviewer_email,
+          p_workflow_stage => item.workflow_stage,
+          p_priority_level => item.priority_level,
+          p_stage => item.stage
+        );
+      END IF;
+      submission_id := new_id;
+      ok := true;
+      error := NULL;
+    EXCEPTION WHEN OTHERS THEN
+      submission_id := NULL;
+      ok := false;
+      error := SQLERRM;
+    END;
+    RETURN NEXT;
+  END LOOP;
+END;
+$$ LANGUAGE plpgsql;